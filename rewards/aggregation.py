@@ -0,0 +1,222 @@
+"""
+Small MongoDB-style aggregation pipeline evaluated in process.
+
+Supported stages:
+    {"$match": {...}}                      same filter syntax as Backend.query
+    {"$project": {"field": 1, "alias": "$other.path", "_id": 0}}
+    {"$unwind": "$field"} or {"$unwind": {"path": "$field",
+                                         "preserveNullAndEmptyArrays": true}}
+    {"$lookup": {"from": "users", "localField": "following",
+                 "foreignField": "_id", "as": "followed"}}
+    {"$group": {"_id": "$field", "n": {"$sum": 1}, "total": {"$sum": "$x"},
+                "docs": {"$count": {}}}}
+    {"$count": "name"}
+
+Field references (``"$a.b"``) may use dotted paths. ``$lookup`` fetches the
+foreign documents for all input documents with a single ``$in`` query, so a
+join costs one backend call regardless of how many documents it touches.
+Array-valued foreign fields join on each element, as in MongoDB (``$in``
+matches array fields element-wise; see query_filter.py).
+"""
+
+from typing import Any, Callable, Dict, Iterable, List
+
+from .query_filter import document_matches
+
+# fetch(collection, field, values) -> documents whose field is in values
+FetchFunc = Callable[[str, str, List[Any]], List[Dict[str, Any]]]
+
+_MISSING = object()
+
+
+def _get_path(document: Any, path: str) -> Any:
+    """Resolve a dotted path, returning _MISSING if any part is absent."""
+    current = document
+    for part in path.split("."):
+        if isinstance(current, dict) and part in current:
+            current = current[part]
+        else:
+            return _MISSING
+    return current
+
+
+def _evaluate(expression: Any, document: Dict[str, Any]) -> Any:
+    """Evaluate a field reference, a dict of expressions or a literal."""
+    if isinstance(expression, str) and expression.startswith("$"):
+        value = _get_path(document, expression[1:])
+        return None if value is _MISSING else value
+    if isinstance(expression, dict):
+        return {key: _evaluate(value, document) for key, value in expression.items()}
+    return expression
+
+
+def _hashable(value: Any) -> Any:
+    """Turn a group key into something usable as a dict key."""
+    if isinstance(value, dict):
+        return ("__dict__",) + tuple(sorted((key, _hashable(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return ("__list__",) + tuple(_hashable(item) for item in value)
+    return value
+
+
+def _field_name(reference: Any, stage: str) -> str:
+    if not isinstance(reference, str) or not reference.startswith("$"):
+        raise ValueError(f"{stage} expects a '$field' reference, got {reference!r}")
+    return reference[1:]
+
+
+def _project(documents: Iterable[Dict[str, Any]], spec: Dict[str, Any]) -> List[Dict[str, Any]]:
+    include_id = spec.get("_id", 1) not in (0, False)
+    fields = {key: value for key, value in spec.items() if key != "_id"}
+    exclusion = bool(fields) and all(value in (0, False) for value in fields.values())
+
+    results = []
+    for doc in documents:
+        if exclusion:
+            projected = {key: value for key, value in doc.items() if key not in fields}
+            if not include_id:
+                projected.pop("_id", None)
+        else:
+            projected = {}
+            if include_id and "_id" in doc:
+                projected["_id"] = doc["_id"]
+            for key, value in fields.items():
+                if isinstance(value, str) and value.startswith("$"):
+                    resolved = _get_path(doc, value[1:])
+                else:
+                    resolved = _get_path(doc, key) if value not in (0, False) else _MISSING
+                if resolved is not _MISSING:
+                    projected[key] = resolved
+        results.append(projected)
+    return results
+
+
+def _unwind(documents: Iterable[Dict[str, Any]], spec: Any) -> List[Dict[str, Any]]:
+    if isinstance(spec, dict):
+        path = _field_name(spec.get("path"), "$unwind")
+        preserve = bool(spec.get("preserveNullAndEmptyArrays", False))
+    else:
+        path = _field_name(spec, "$unwind")
+        preserve = False
+    if "." in path:
+        raise ValueError("$unwind only supports top-level fields")
+
+    results = []
+    for doc in documents:
+        value = doc.get(path, _MISSING)
+        if isinstance(value, list) and value:
+            for item in value:
+                unwound = dict(doc)
+                unwound[path] = item
+                results.append(unwound)
+        elif isinstance(value, list) or value is _MISSING or value is None:
+            if preserve:
+                results.append(dict(doc))
+        else:
+            results.append(doc)
+    return results
+
+
+def _lookup(documents: List[Dict[str, Any]], spec: Dict[str, Any], fetch: FetchFunc) -> List[Dict[str, Any]]:
+    foreign = spec["from"]
+    local_field = spec["localField"]
+    foreign_field = spec["foreignField"]
+    output = spec["as"]
+
+    def local_values(doc: Dict[str, Any]) -> List[Any]:
+        value = _get_path(doc, local_field)
+        if value is _MISSING:
+            return [None]
+        return list(value) if isinstance(value, list) else [value]
+
+    wanted: Dict[Any, Any] = {}
+    for doc in documents:
+        for value in local_values(doc):
+            wanted.setdefault(_hashable(value), value)
+
+    by_key: Dict[Any, List[Dict[str, Any]]] = {}
+    if wanted:
+        for foreign_doc in fetch(foreign, foreign_field, list(wanted.values())):
+            value = _get_path(foreign_doc, foreign_field)
+            keys = value if isinstance(value, list) else [None if value is _MISSING else value]
+            for key in {_hashable(key) for key in keys}:
+                by_key.setdefault(key, []).append(foreign_doc)
+
+    results = []
+    for doc in documents:
+        joined: List[Dict[str, Any]] = []
+        seen = set()
+        for value in local_values(doc):
+            for foreign_doc in by_key.get(_hashable(value), []):
+                if id(foreign_doc) not in seen:
+                    seen.add(id(foreign_doc))
+                    joined.append(foreign_doc)
+        merged = dict(doc)
+        merged[output] = joined
+        results.append(merged)
+    return results
+
+
+def _group(documents: Iterable[Dict[str, Any]], spec: Dict[str, Any]) -> List[Dict[str, Any]]:
+    if "_id" not in spec:
+        raise ValueError("$group requires an _id expression")
+    accumulators = {key: value for key, value in spec.items() if key != "_id"}
+    for key, accumulator in accumulators.items():
+        if not isinstance(accumulator, dict) or len(accumulator) != 1 or next(iter(accumulator)) not in ("$sum", "$count"):
+            raise ValueError(f"$group field '{key}' must use $sum or $count")
+
+    groups: Dict[Any, Dict[str, Any]] = {}
+    for doc in documents:
+        group_id = _evaluate(spec["_id"], doc)
+        group = groups.get(_hashable(group_id))
+        if group is None:
+            group = {"_id": group_id}
+            group.update({key: 0 for key in accumulators})
+            groups[_hashable(group_id)] = group
+        for key, accumulator in accumulators.items():
+            if "$count" in accumulator:
+                group[key] += 1
+                continue
+            value = _evaluate(accumulator["$sum"], doc)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                group[key] += value
+    return list(groups.values())
+
+
+def run_pipeline(
+    documents: Iterable[Dict[str, Any]],
+    pipeline: List[Dict[str, Any]],
+    fetch: FetchFunc,
+) -> List[Dict[str, Any]]:
+    """Run aggregation stages over documents.
+
+    Args:
+        documents: Input documents (the pipeline's source collection).
+        pipeline: List of single-key stage dicts.
+        fetch: Used by $lookup to load foreign documents in one query.
+
+    Raises:
+        ValueError: If a stage is unknown or malformed.
+    """
+    results = [doc for doc in documents if isinstance(doc, dict)]
+    for stage in pipeline:
+        if not isinstance(stage, dict) or len(stage) != 1:
+            raise ValueError(f"Pipeline stage must be a single-key dict, got {stage!r}")
+        name, spec = next(iter(stage.items()))
+        if name == "$match":
+            results = [doc for doc in results if document_matches(doc, spec)]
+        elif name == "$project":
+            results = _project(results, spec)
+        elif name == "$unwind":
+            results = _unwind(results, spec)
+        elif name == "$lookup":
+            results = _lookup(results, spec, fetch)
+        elif name == "$group":
+            results = _group(results, spec)
+        elif name == "$count":
+            if not isinstance(spec, str) or not spec:
+                raise ValueError("$count expects a non-empty output field name")
+            results = [{spec: len(results)}] if results else []
+        else:
+            raise ValueError(f"Unsupported pipeline stage: {name}")
+    return results
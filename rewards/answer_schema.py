@@ -0,0 +1,223 @@
+"""
+Structural validation of final answers against the task's example JSON.
+
+Task prompts end with "Provide your final answer as JSON:" followed by an
+example, using ``<number>``, ``<boolean>`` or ``<string>`` placeholders
+where the value is up to the agent. The example is compiled once per task
+into a pydantic-core ``SchemaValidator`` that checks the parsed answer's
+shape in one native pass:
+
+    example = example_for_task(task)
+    validator = answer_validator(task_id, example)
+    result = score_with_structure(validator, final_answer, lambda: reward(...))
+
+Schema rules, derived from the example:
+    object      Object with the example's keys, all optional; extra keys
+                are allowed.
+    list        List whose items follow the (merged) example items.
+    scalar      Any scalar (number, string, boolean); a list or object
+                where the example has a scalar is rejected.
+Any value may be null, since validators report missing values themselves.
+Scalar types are left to the validators, which accept e.g. "20" for 20 in
+places and ignore fields they don't score.
+
+The example can't tell which fields a validator scores, so a mismatch never
+sets the score by itself: the validator scores the answer first, and the
+answer is only validated when that can add to the result. Verbose results
+that don't pass get the mismatches appended to their errors; passing and
+fail-fast results (which carry only their first error) are returned
+without validating. If the validator raises (typically calling ``.get`` on
+a list), the answer scores 0.0 with the mismatches as the errors instead of
+a traceback.
+``scripts/check_answer_schema.py`` checks that scores match the validators'
+own on every trace answer and on reshaped variants of it.
+
+Rewards can declare ``answer_schema`` (an example in the same format) in
+their ``@reward`` registration to override the prompt's example.
+"""
+
+import hashlib
+import json
+import re
+import threading
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from pydantic_core import SchemaValidator, ValidationError, core_schema
+
+from .answers import extract_json, parse_answer
+from .scoring import FAIL_FAST, current_mode
+
+_MARKER = "final answer as JSON"
+# Unquoted placeholders such as <number> or <ellipse|rectangle|diamond>
+_PLACEHOLDER = re.compile(r'(?<!")<([^<>"\n]+)>(?!")')
+_MAX_REPORTED_ERRORS = 10
+
+_SCALAR = core_schema.union_schema(
+    [
+        core_schema.str_schema(strict=True),
+        core_schema.bool_schema(strict=True),
+        core_schema.int_schema(strict=True),
+        core_schema.float_schema(strict=True),
+    ],
+    custom_error_type="scalar_type",
+    custom_error_message="Input should be a number, string or boolean",
+)
+
+
+def example_from_prompt(prompt: str) -> Optional[Dict[str, Any]]:
+    """The example answer after "final answer as JSON" in a prompt, or None."""
+    start = prompt.find(_MARKER)
+    if start < 0:
+        return None
+    text = _PLACEHOLDER.sub(lambda match: json.dumps(f"<{match.group(1)}>"), prompt[start + len(_MARKER):])
+    example = extract_json(text)
+    return example if isinstance(example, dict) else None
+
+
+def example_for_task(task: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+    """The example answer from a task's ``instructions`` (its ``user_prompt``), or None."""
+    instructions = task.get("instructions")
+    if isinstance(instructions, str):
+        try:
+            instructions = json.loads(instructions)
+        except ValueError:
+            return example_from_prompt(instructions)
+    if isinstance(instructions, Mapping) and isinstance(instructions.get("user_prompt"), str):
+        return example_from_prompt(instructions["user_prompt"])
+    return None
+
+
+def _merge_items(items: List[Any]) -> Any:
+    """One example for all list items: objects are merged key by key."""
+    if items and all(isinstance(item, dict) for item in items):
+        merged: Dict[str, Any] = {}
+        for item in items:
+            for key, value in item.items():
+                merged.setdefault(key, value)
+        return merged
+    return items[0] if len(items) == 1 else None
+
+
+def _schema(example: Any) -> core_schema.CoreSchema:
+    if isinstance(example, dict):
+        schema: core_schema.CoreSchema = core_schema.typed_dict_schema(
+            {key: core_schema.typed_dict_field(_schema(value), required=False) for key, value in example.items()},
+            extra_behavior="allow",
+        )
+    elif isinstance(example, list):
+        merged = _merge_items(example)
+        schema = core_schema.list_schema(_schema(merged) if merged is not None else core_schema.any_schema())
+    elif example is None:
+        schema = core_schema.any_schema()
+    else:
+        schema = _SCALAR
+    return core_schema.nullable_schema(schema)
+
+
+def compile_answer_schema(example: Mapping[str, Any]) -> SchemaValidator:
+    """Compile an example answer into a validator for answers of that shape."""
+    return SchemaValidator(_schema(dict(example)))
+
+
+_validators: Dict[Tuple[str, str], SchemaValidator] = {}
+_validators_lock = threading.Lock()
+
+
+def answer_validator(task_id: str, example: Optional[Mapping[str, Any]]) -> Optional[SchemaValidator]:
+    """The compiled validator for a task's example answer, cached by task and example content."""
+    if not example:
+        return None
+    key = (task_id, hashlib.sha256(json.dumps(example, sort_keys=True).encode()).hexdigest())
+    validator = _validators.get(key)
+    if validator is None:
+        validator = compile_answer_schema(example)
+        with _validators_lock:
+            _validators[key] = validator
+    return validator
+
+
+def _location(loc: Tuple[Any, ...]) -> str:
+    return ".".join(str(part) for part in loc) or "answer"
+
+
+def structure_errors(validator: SchemaValidator, data: Any) -> List[str]:
+    """"[X] " messages for every place the parsed answer doesn't match the schema."""
+    try:
+        validator.validate_python(data)
+    except ValidationError as e:
+        errors: Dict[str, str] = {}
+        for error in e.errors(include_url=False):
+            errors.setdefault(_location(error["loc"]), error["msg"])
+        messages = [f"[X] Answer field '{where}': {msg}" for where, msg in errors.items()]
+        if len(messages) > _MAX_REPORTED_ERRORS:
+            messages = messages[:_MAX_REPORTED_ERRORS] + [f"[X] ... and {len(messages) - _MAX_REPORTED_ERRORS} more"]
+        return messages
+    return []
+
+
+def answer_structure_errors(validator: Optional[SchemaValidator], final_answer: str) -> List[str]:
+    """``structure_errors`` for a raw final answer; [] if there is no validator or no JSON."""
+    if validator is None:
+        return []
+    data = parse_answer(final_answer)
+    if not data:
+        return []
+    return structure_errors(validator, data)
+
+
+def _explains_result(result: Dict[str, Any]) -> bool:
+    """Whether shape messages would be added to a result: a failing verbose one."""
+    return result.get("score", 0.0) < 1.0 and current_mode() != FAIL_FAST
+
+
+def add_structure_errors(
+    result: Dict[str, Any], validator: Optional[SchemaValidator], final_answer: str
+) -> Dict[str, Any]:
+    """A copy of a TaskScore-shaped result with the answer's shape messages added to its errors.
+
+    The score is kept. Passing results and fail-fast results are returned
+    as they are, without validating the answer.
+    """
+    if not _explains_result(result):
+        return result
+    messages = answer_structure_errors(validator, final_answer)
+    if not messages:
+        return result
+    metadata = dict(result.get("metadata") or {})
+    metadata["error_accumulator"] = list(metadata.get("error_accumulator") or []) + messages
+    return {**result, "metadata": metadata}
+
+
+def score_with_structure(
+    validator: Optional[SchemaValidator],
+    final_answer: str,
+    call: Callable[[], Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Score an answer with ``call`` (the reward), reporting shape mismatches alongside.
+
+    Returns:
+        The reward's result, with mismatches added to its errors if it
+        didn't pass (verbose mode only). If the reward raises and the answer
+        has mismatches, a 0.0 result whose errors are the mismatches (only
+        the first in fail-fast mode).
+
+    Raises:
+        Whatever the reward raises for an answer without mismatches.
+    """
+    try:
+        result = call()
+    except Exception:
+        messages = answer_structure_errors(validator, final_answer)
+        if not messages:
+            raise
+        # The reward tripped over the answer's shape
+        if current_mode() == FAIL_FAST:
+            return {"score": 0.0, "metadata": {"success_accumulator": [], "error_accumulator": messages[:1]}}
+        return {
+            "score": 0.0,
+            "metadata": {
+                "success_accumulator": ["[✓] JSON response parsed successfully"],
+                "error_accumulator": messages,
+            },
+        }
+    return add_structure_errors(result, validator, final_answer)
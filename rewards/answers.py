@@ -0,0 +1,272 @@
+"""
+Extraction of JSON objects from free-form final answers.
+
+Model answers wrap their JSON in prose, markdown fences or both, and can be
+long and brace-heavy (code snippets, JSX, nested specs). ``extract_json``
+finds candidate objects with a single linear scan instead of regexes:
+
+1. The whole answer is tried with ``json.loads`` first.
+2. Fenced code blocks are tried before the rest of the text: each block
+   as a whole, then the objects inside it.
+3. Balanced ``{...}`` spans are found by one pass over the structural
+   characters, tracking strings and escapes once inside an object, with no
+   limit on nesting depth. The outermost spans are tried first; if one is
+   not valid JSON its nested spans are tried instead.
+
+Scanning is O(n). Parsing is bounded by ``_MAX_PARSE_ATTEMPTS`` so that
+deeply nested invalid input can't make the fallback quadratic.
+
+``parse_answer`` wraps ``extract_json`` in a bounded LRU cache keyed by the
+answer's hash, so validators run against the same answer share one parse.
+Cached results are frozen (see ``frozen.py``) because every caller gets the
+same object.
+"""
+
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Iterator, List, Literal, Optional, Sequence, Tuple, TypedDict
+
+from .frozen import freeze
+
+_STRUCTURAL = re.compile(r'[{}"\\]')
+_FENCE = "```"
+_MAX_PARSE_ATTEMPTS = 64
+
+Selection = Literal["first", "largest"]
+
+
+# (start, end, nested spans)
+_Span = Tuple[int, int, Sequence[Any]]
+_NO_SPANS: Tuple[()] = ()
+
+
+def _balanced_spans(text: str, track_strings: bool, unterminated: List[bool]) -> Iterator[_Span]:
+    """Outermost balanced-brace spans of text, each with its nested spans.
+
+    Quotes are only treated as string delimiters inside an object, so
+    apostrophes and quotes in surrounding prose don't affect the scan. The
+    children of an object that is never closed are promoted to the top level.
+    With ``track_strings=False`` quotes are ignored altogether, which
+    recovers objects after a stray unbalanced quote inside braces.
+
+    Spans are yielded in text order as soon as they close, so callers that
+    stop at the first valid object don't scan the rest of the text.
+    ``unterminated[0]`` is set if the scan ended inside a string.
+    """
+    starts: List[int] = []
+    # Nested spans per open brace, created on first use
+    children: List[Optional[List[_Span]]] = []
+    in_string = False
+    skip = -1
+
+    for match in _STRUCTURAL.finditer(text):
+        pos = match.start()
+        if pos == skip:
+            continue
+        char = match.group()
+        if in_string:
+            if char == "\\":
+                skip = pos + 1
+            elif char == '"':
+                in_string = False
+        elif char == "{":
+            starts.append(pos)
+            children.append(None)
+        elif not starts:
+            continue
+        elif char == '"':
+            in_string = track_strings
+        elif char == "}":
+            span = (starts.pop(), pos + 1, children.pop() or _NO_SPANS)
+            if not starts:
+                yield span
+            elif children[-1] is None:
+                children[-1] = [span]
+            else:
+                children[-1].append(span)
+
+    unterminated[0] = in_string
+    for nested in children:
+        if nested:
+            yield from nested
+
+
+def _fenced_blocks(text: str) -> Iterator[str]:
+    """Contents of ``` fenced blocks, without a leading language tag."""
+    pos = 0
+    while True:
+        start = text.find(_FENCE, pos)
+        if start < 0:
+            return
+        end = text.find(_FENCE, start + len(_FENCE))
+        if end < 0:
+            return
+        block = text[start + len(_FENCE):end]
+        newline = block.find("\n")
+        tag = block[:newline] if newline >= 0 else ""
+        if tag.strip() and not any(char in tag for char in "{[\"") and len(tag.split()) == 1:
+            block = block[newline + 1:]
+        yield block
+        pos = end + len(_FENCE)
+
+
+def _objects(text: str, budget: List[int]) -> Iterator[Tuple[int, dict]]:
+    """(span length, object) for valid JSON objects in text, outermost first.
+
+    Falls back to a quote-agnostic scan if the string-aware one finds nothing
+    and ended inside an unterminated string.
+    """
+    for track_strings in (True, False):
+        found = False
+        unterminated = [False]
+        for span in _balanced_spans(text, track_strings, unterminated):
+            pending = [span]
+            while pending and budget[0] > 0:
+                start, end, nested = pending.pop()
+                budget[0] -= 1
+                value = _parse(text[start:end])
+                if isinstance(value, dict):
+                    found = True
+                    yield end - start, value
+                else:
+                    pending.extend(reversed(nested))
+            if budget[0] <= 0:
+                return
+        if found or not unterminated[0]:
+            return
+
+
+def _parse(text: str) -> Any:
+    """json.loads, returning None on invalid or too deeply nested JSON."""
+    try:
+        return json.loads(text.strip())
+    except (ValueError, RecursionError):
+        return None
+
+
+def extract_json(answer: str, select: Selection = "first") -> Optional[Any]:
+    """Extract the JSON payload from a final answer.
+
+    Args:
+        answer: The final answer text.
+        select: "first" returns the first valid object found, "largest" the
+            one with the longest source text. Fenced blocks win over
+            unfenced text either way.
+
+    Returns:
+        The whole answer parsed as JSON if it is valid JSON (of any type),
+        otherwise an extracted object, or None if there is none.
+    """
+    if not isinstance(answer, str):
+        return None
+    try:
+        return json.loads(answer.strip())
+    except (ValueError, RecursionError):
+        pass
+
+    budget = [_MAX_PARSE_ATTEMPTS]
+    fenced: List[Tuple[int, dict]] = []
+    for block in _fenced_blocks(answer):
+        if "}" not in block:
+            continue
+        value = _parse(block)
+        if isinstance(value, dict):
+            candidates: Iterator[Tuple[int, dict]] = iter([(len(block), value)])
+        else:
+            candidates = _objects(block, budget)
+        for size, obj in candidates:
+            if select == "first":
+                return obj
+            fenced.append((size, obj))
+    if fenced:
+        return max(fenced, key=lambda item: item[0])[1]
+
+    best: Optional[Tuple[int, dict]] = None
+    for size, obj in _objects(answer, budget):
+        if select == "first":
+            return obj
+        if best is None or size > best[0]:
+            best = (size, obj)
+    return best[1] if best is not None else None
+
+
+class AnswerCacheStats(TypedDict):
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+class AnswerCache:
+    """Bounded LRU cache of parsed final answers.
+
+    Entries are keyed by the sha256 of the answer text and the selection
+    mode, so long answers aren't kept alive as keys. Safe to share between
+    threads.
+
+    Args:
+        maxsize: Maximum number of cached answers.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[bytes, str], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def parse(self, answer: str, select: Selection = "first") -> Optional[Any]:
+        """Return the frozen ``extract_json`` result for an answer."""
+        if not isinstance(answer, str):
+            return None
+        key = (hashlib.sha256(answer.encode("utf-8", "surrogatepass")).digest(), select)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return self._entries[key]
+            self._misses += 1
+
+        value = freeze(extract_json(answer, select))
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def stats(self) -> AnswerCacheStats:
+        with self._lock:
+            return AnswerCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._entries),
+                maxsize=self.maxsize,
+            )
+
+    def clear(self) -> None:
+        """Drop all entries and reset the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+_answer_cache = AnswerCache()
+
+
+def parse_answer(answer: str, select: Selection = "first") -> Optional[Any]:
+    """Cached, read-only ``extract_json``. Use ``thaw`` for a mutable copy."""
+    return _answer_cache.parse(answer, select)
+
+
+def answer_cache_stats() -> AnswerCacheStats:
+    """Hit/miss counters of the shared answer cache."""
+    return _answer_cache.stats()
+
+
+def clear_answer_cache() -> None:
+    _answer_cache.clear()
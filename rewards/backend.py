@@ -1,6 +1,14 @@
-import re
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
+
+from .aggregation import run_pipeline
+from .columnar import ColumnarCollection
+from .hash_index import HashIndex
+from .query_filter import document_matches
+from .query_stats import QueryShapeReport, QueryStats, QueryStatsRecorder
+from .text_index import TextIndex, field_text, fold, literal_from_regex, usable_for_regex
 
 
 class Backend(ABC):
@@ -17,62 +25,441 @@ class Backend(ABC):
         """
         pass
 
+    def aggregate(self, query: dict[str, Any]) -> List[Dict[str, Any]]:
+        """Execute an aggregation pipeline.
+
+        Args:
+            query: A dict with 'collection' and 'pipeline' keys, e.g.
+                   {"collection": "users", "pipeline": [
+                       {"$match": {"_id": "0"}},
+                       {"$unwind": "$following"},
+                       {"$lookup": {"from": "users", "localField": "following",
+                                    "foreignField": "_id", "as": "followed"}},
+                   ]}
+                   See rewards/aggregation.py for the supported stages.
+
+        Returns:
+            List of result documents
+
+        The default implementation runs the pipeline in process on top of
+        query(): a leading $match becomes the query filter and each $lookup
+        fetches its foreign documents with a single $in query.
+        """
+        collection = query.get("collection")
+        pipeline = list(query.get("pipeline", []))
+
+        filter_dict: Dict[str, Any] = {}
+        if pipeline and isinstance(pipeline[0], dict) and list(pipeline[0]) == ["$match"]:
+            filter_dict = pipeline.pop(0)["$match"]
+
+        def fetch(foreign: str, field: str, values: List[Any]) -> List[Dict[str, Any]]:
+            return self.query({"collection": foreign, "filter": {field: {"$in": values}}})
+
+        documents = self.query({"collection": collection, "filter": filter_dict})
+        return run_pipeline(documents, pipeline, fetch)
+
 class BackendDictAdapter(Backend):
-    """Adapter to wrap backend state dict as a Backend object."""
+    """Adapter to wrap backend state dict as a Backend object.
+
+    Args:
+        backend_state: Mapping of collection name to list of documents. A
+            BackendSnapshot or SnapshotOverlay can be passed to share one
+            read-only copy of the state between verifications, and a
+            SnapshotFile to load collections lazily from a compiled
+            snapshot (its precomputed indexes are used automatically).
+        columnar: Store collections column-wise for scan-heavy workloads.
+            ``True`` enables it for every collection, an iterable of names
+            enables it for those collections only. Columnar collections are
+            built lazily on first query and return rebuilt copies of the
+            matching documents rather than the original dicts.
+        collect_stats: Record per-query statistics for ``query_report``.
+            Off by default: recording adds timing and a serialized copy of
+            every filter to each query. ``explain`` works either way.
 
-    def __init__(self, backend_state: Dict[str, Any]):
+    Thread safety: any number of threads may call ``query``, ``aggregate``,
+    ``explain`` and ``text_contains_any`` on one adapter concurrently.
+    Indexes and columnar stores are immutable once built and are read
+    without locking; each one is built by exactly one thread while other
+    threads needing the same structure wait for it (threads needing a
+    different structure are not blocked). Statistics are recorded into
+    per-thread buffers and merged by ``query_report``. Creating indexes,
+    ``query_report`` and ``reset_query_stats`` are safe while queries run;
+    mutating the underlying collections is not.
+    """
+
+    def __init__(
+        self,
+        backend_state: Mapping[str, Any],
+        columnar: Union[bool, Iterable[str]] = False,
+        collect_stats: bool = False,
+    ):
         self.backend_state = backend_state
+        if isinstance(columnar, bool):
+            self._columnar_enabled = columnar
+            self._columnar_names = None
+        else:
+            self._columnar_enabled = True
+            self._columnar_names = frozenset(columnar)
+        # (kind, collection, ...) -> (source list, source length, structure)
+        self._derived: Dict[Tuple[Any, ...], Tuple[list, int, Any]] = {}
+        # key -> lock held while that structure is being built
+        self._build_locks: Dict[Tuple[Any, ...], threading.Lock] = {}
+        self._build_locks_guard = threading.Lock()
+        # collection name -> fields with a hash / text index
+        self._hash_index_fields: Dict[str, Set[str]] = {}
+        self._text_index_fields: Dict[str, Set[str]] = {}
+        self._stats = QueryStatsRecorder() if collect_stats else None
 
-    def query(self, query: dict[str, Any]) -> Any:
-        collection = query.get("collection")
-        filter_dict = query.get("filter", {})
+        # States loaded from a compiled snapshot ship precomputed hash indexes
+        indexed_fields = getattr(backend_state, "indexed_fields", None)
+        if callable(indexed_fields):
+            for collection, fields in indexed_fields().items():
+                self._hash_index_fields.setdefault(collection, set()).update(fields)
 
+    def _collection_data(self, collection: Any) -> Optional[list]:
+        """Return the document list for a collection, or None if unusable."""
         if collection not in self.backend_state:
-            return []
-
+            return None
         collection_data = self.backend_state[collection]
         if not isinstance(collection_data, list):
-            return []
+            return None
+        return collection_data
 
-        results = []
-        for item in collection_data:
-            if not isinstance(item, dict):
+    def _derived_structure(
+        self,
+        key: Tuple[Any, ...],
+        collection_data: list,
+        build: Callable[[list], Any],
+    ) -> Any:
+        """Return a structure derived from a collection, rebuilding it when stale.
+
+        A structure is stale once the collection list was replaced or resized.
+        Fresh structures are returned without locking; building takes a
+        per-key lock so concurrent callers build each structure only once.
+        """
+        cached = self._derived.get(key)
+        if cached is not None:
+            source, length, structure = cached
+            if source is collection_data and length == len(collection_data):
+                return structure
+
+        lock = self._build_locks.get(key)
+        if lock is None:
+            with self._build_locks_guard:
+                lock = self._build_locks.setdefault(key, threading.Lock())
+        with lock:
+            cached = self._derived.get(key)
+            if cached is not None:
+                source, length, structure = cached
+                if source is collection_data and length == len(collection_data):
+                    return structure
+            structure = build(collection_data)
+            # Published as one tuple so readers never see a partial entry
+            self._derived[key] = (collection_data, len(collection_data), structure)
+        return structure
+
+    def _columnar_collection(self, collection: str, collection_data: list) -> Optional[ColumnarCollection]:
+        """Return the columnar store for a collection, building it if needed."""
+        if not self._columnar_enabled:
+            return None
+        if self._columnar_names is not None and collection not in self._columnar_names:
+            return None
+        return self._derived_structure(("columnar", collection), collection_data, ColumnarCollection)
+
+    def _text_index(self, collection: str, field: str, collection_data: list) -> Optional[TextIndex]:
+        """Return the text index for a field, or None if none was created."""
+        if field not in self._text_index_fields.get(collection, ()):
+            return None
+        return self._derived_structure(
+            ("text", collection, field),
+            collection_data,
+            lambda documents: TextIndex(documents, field),
+        )
+
+    def create_text_index(self, collection: str, fields: Iterable[str]) -> None:
+        """Index text fields of a collection for substring queries.
+
+        Once created, literal-substring ``$regex`` filters on these fields and
+        ``text_contains_any`` only look at candidate documents from the index.
+        The index is rebuilt automatically if the collection list changes.
+        """
+        fields = set(fields)
+        self._text_index_fields.setdefault(collection, set()).update(fields)
+        collection_data = self._collection_data(collection)
+        if collection_data is not None:
+            for field in fields:
+                self._text_index(collection, field, collection_data)
+
+    def _hash_index(self, collection: str, field: str, collection_data: list) -> Optional[HashIndex]:
+        """Return the hash index for a field, or None if none was created."""
+        if field not in self._hash_index_fields.get(collection, ()):
+            return None
+
+        def build(documents: list) -> HashIndex:
+            precomputed = getattr(self.backend_state, "hash_index", None)
+            if callable(precomputed) and documents is self.backend_state[collection]:
+                index = precomputed(collection, field)
+                if index is not None and len(index) == len(documents):
+                    return index
+            return HashIndex(documents, field)
+
+        return self._derived_structure(("hash", collection, field), collection_data, build)
+
+    def create_index(self, collection: str, fields: Iterable[str]) -> None:
+        """Index fields of a collection for equality and ``$in`` filters.
+
+        The index is rebuilt automatically if the collection list changes.
+        """
+        fields = set(fields)
+        self._hash_index_fields.setdefault(collection, set()).update(fields)
+        collection_data = self._collection_data(collection)
+        if collection_data is not None:
+            for field in fields:
+                self._hash_index(collection, field, collection_data)
+
+    def _current_indexes(self) -> List[Tuple[str, Any, str, Any]]:
+        """(kind, collection, field, index) for built indexes that are not stale."""
+        current = []
+        for key, (source, length, structure) in list(self._derived.items()):
+            if key[0] not in ("hash", "text"):
                 continue
-            match = True
-            for key, value in filter_dict.items():
-                if isinstance(value, dict):
-                    # Handle $in operator
-                    if "$in" in value:
-                        if item.get(key) not in value.get("$in", []):
-                            match = False
-                            break
-                    # Handle $regex operator
-                    elif "$regex" in value:
-                        pattern = value.get("$regex", "")
-                        options = value.get("$options", "")
-                        flags = 0
-                        if "i" in options:
-                            flags |= re.IGNORECASE
-                        item_value = item.get(key, "")
-                        if not isinstance(item_value, str):
-                            item_value = str(item_value) if item_value is not None else ""
-                        try:
-                            if not re.search(pattern, item_value, flags):
-                                match = False
-                                break
-                        except re.error:
-                            match = False
-                            break
-                    else:
-                        # Unknown operator, treat as exact match
-                        if item.get(key) != value:
-                            match = False
-                            break
-                else:
-                    if item.get(key) != value:
-                        match = False
-                        break
-            if match:
-                results.append(item)
+            kind, collection, field = key
+            if source is self._collection_data(collection) and length == len(source):
+                current.append((kind, collection, field, structure))
+        return current
+
+    def built_indexes(self) -> List[Tuple[str, Any, str]]:
+        """(kind, collection, field) of the built hash and text indexes."""
+        return [(kind, collection, field) for kind, collection, field, _ in self._current_indexes()]
+
+    def export_indexes(self) -> List[Dict[str, Any]]:
+        """Serializable form of the built hash and text indexes.
+
+        Row numbers refer to positions in the current collection lists, so
+        the export is only valid for a state with the same content (see
+        ``index_cache.IndexCache``).
+        """
+        return [
+            {"kind": kind, "collection": collection, "field": field, "index": index.to_state()}
+            for kind, collection, field, index in self._current_indexes()
+        ]
 
+    def import_indexes(self, indexes: Iterable[Dict[str, Any]]) -> int:
+        """Install indexes from ``export_indexes`` instead of building them.
+
+        Indexes whose row count doesn't match their collection are skipped.
+
+        Returns:
+            The number of indexes installed.
+        """
+        installed = 0
+        for entry in indexes:
+            kind, collection, field = entry["kind"], entry["collection"], entry["field"]
+            collection_data = self._collection_data(collection)
+            if collection_data is None:
+                continue
+            if kind == "hash":
+                index: Any = HashIndex.from_state(entry["index"])
+                fields = self._hash_index_fields
+            elif kind == "text":
+                index = TextIndex.from_state(entry["index"])
+                fields = self._text_index_fields
+            else:
+                continue
+            if len(index) != len(collection_data):
+                continue
+            fields.setdefault(collection, set()).add(field)
+            self._derived[(kind, collection, field)] = (collection_data, len(collection_data), index)
+            installed += 1
+        return installed
+
+    def _index_candidates(
+        self, collection: str, collection_data: list, filter_dict: Dict[str, Any]
+    ) -> Tuple[Optional[List[int]], Optional[str]]:
+        """Pick the most selective usable index for a filter.
+
+        Returns the candidate rows and the index name, or (None, None) if no
+        index applies.
+        """
+        best: Optional[List[int]] = None
+        best_name: Optional[str] = None
+        for key, condition in filter_dict.items():
+            rows: Optional[List[int]] = None
+            name = None
+
+            hash_index = self._hash_index(collection, key, collection_data)
+            if hash_index is not None:
+                rows = hash_index.candidates(condition)
+                name = f"hash:{key}"
+
+            if rows is None and isinstance(condition, dict) and "$in" not in condition and "$regex" in condition:
+                literal = literal_from_regex(condition.get("$regex"))
+                if literal is not None and not usable_for_regex(literal, condition.get("$options")):
+                    literal = None
+                text_index = self._text_index(collection, key, collection_data) if literal is not None else None
+                if text_index is not None and text_index.exact_for_regex:
+                    rows = text_index.candidates(literal).tolist()
+                    name = f"text:{key}"
+
+            if rows is not None and (best is None or len(rows) < len(best)):
+                best, best_name = rows, name
+        return best, best_name
+
+    def _execute_with_stats(
+        self, collection: Any, filter_dict: Dict[str, Any]
+    ) -> Tuple[List[Dict[str, Any]], QueryStats]:
+        """Run a query, timed, and describe how it was answered."""
+        started = time.perf_counter()
+        results, strategy, index_name, scanned = self._execute(collection, filter_dict)
+        stats = QueryStats(
+            collection=collection,
+            filter=filter_dict,
+            strategy=strategy,
+            index=index_name,
+            scanned=scanned,
+            matched=len(results),
+            time_ms=(time.perf_counter() - started) * 1000,
+        )
+        return results, stats
+
+    def _execute(
+        self, collection: Any, filter_dict: Dict[str, Any]
+    ) -> Tuple[List[Dict[str, Any]], str, Optional[str], int]:
+        """Run a query: (results, strategy, index name, documents scanned)."""
+        results: List[Dict[str, Any]]
+        index_name: Optional[str] = None
+
+        delta = self._overlay_delta(collection)
+        collection_data = delta.base if delta is not None else self._collection_data(collection)
+        if collection_data is None:
+            results, strategy, scanned = [], "missing", 0
+        elif delta is not None:
+            results, strategy, index_name, scanned = self._execute_delta(collection, delta, filter_dict)
+        else:
+            rows, index_name = self._index_candidates(collection, collection_data, filter_dict)
+            store = self._columnar_collection(collection, collection_data) if rows is None else None
+            if rows is not None:
+                strategy, scanned = "index", len(rows)
+                results = []
+                for row in rows:
+                    item = collection_data[row]
+                    if isinstance(item, dict) and document_matches(item, filter_dict):
+                        results.append(item)
+            elif store is not None:
+                strategy, scanned = "columnar", len(store)
+                results = store.find(filter_dict)
+            else:
+                strategy, scanned = "scan", len(collection_data)
+                results = [
+                    item for item in collection_data
+                    if isinstance(item, dict) and document_matches(item, filter_dict)
+                ]
+        return results, strategy, index_name, scanned
+
+    def _overlay_delta(self, collection: Any) -> Any:
+        """The SnapshotOverlay delta for a collection, or None (see snapshot.py)."""
+        delta = getattr(self.backend_state, "delta", None)
+        return delta(collection) if callable(delta) else None
+
+    def _execute_delta(
+        self, collection: Any, delta: Any, filter_dict: Dict[str, Any]
+    ) -> Tuple[List[Dict[str, Any]], str, Optional[str], int]:
+        """Query an overlay collection: the base list through its indexes and
+        columnar store, then the overlay's replaced and inserted documents.
+
+        Structures stay keyed on the unchanging base list, so writes to the
+        overlay don't rebuild them.
+        """
+        base = delta.base
+        changed = delta.rows
+        rows, index_name = self._index_candidates(collection, base, filter_dict)
+        store = self._columnar_collection(collection, base) if rows is None else None
+        matches: List[Tuple[int, Any]]
+        if rows is not None:
+            strategy, scanned = "index", len(rows)
+            matches = [
+                (row, base[row]) for row in rows
+                if row not in changed and isinstance(base[row], dict) and document_matches(base[row], filter_dict)
+            ]
+        elif store is not None:
+            strategy, scanned = "columnar", len(store)
+            found = store.find_rows(filter_dict, exclude=changed)
+            matches = list(zip(store.positions[found].tolist(), store.documents(found)))
+        else:
+            strategy, scanned = "scan", len(base)
+            matches = [
+                (row, item) for row, item in enumerate(base)
+                if row not in changed and isinstance(item, dict) and document_matches(item, filter_dict)
+            ]
+
+        extra = list(delta.changed())
+        scanned += len(extra)
+        matches.extend(
+            (position, item) for position, item in extra
+            if isinstance(item, dict) and document_matches(item, filter_dict)
+        )
+        matches.sort(key=lambda match: match[0])
+        return [item for _, item in matches], strategy, index_name, scanned
+
+    def query(self, query: dict[str, Any]) -> Any:
+        recorder = self._stats
+        if recorder is None:
+            return self._execute(query.get("collection"), query.get("filter", {}))[0]
+        results, stats = self._execute_with_stats(query.get("collection"), query.get("filter", {}))
+        recorder.record(stats)
         return results
+
+    def explain(self, query: dict[str, Any]) -> QueryStats:
+        """Run a query and return how it was answered instead of its results.
+
+        The query is not included in ``query_report``.
+        """
+        _, stats = self._execute_with_stats(query.get("collection"), query.get("filter", {}))
+        return stats
+
+    def query_report(self) -> List[QueryShapeReport]:
+        """Aggregated statistics of the queries run so far, by filter shape.
+
+        Shapes with strategy "scan" and a high ``scanned`` count are
+        candidates for ``create_index``; a high ``repeated`` count means a
+        validator issues the same query several times. Empty unless the
+        adapter was created with ``collect_stats=True``.
+        """
+        return self._stats.report() if self._stats is not None else []
+
+    def reset_query_stats(self) -> None:
+        """Clear statistics, e.g. between verifications sharing an adapter."""
+        if self._stats is not None:
+            self._stats.reset()
+
+    def text_contains_any(
+        self, collection: str, fields: Iterable[str], keywords: Iterable[str]
+    ) -> List[Dict[str, Any]]:
+        """Return documents where any of the fields contains any of the keywords.
+
+        Matching is case-insensitive substring containment on the field text
+        (see ``text_index.field_text``). Fields with a text index are answered
+        from the index; other fields are scanned.
+        """
+        collection_data = self._collection_data(collection)
+        if collection_data is None:
+            return []
+
+        needles = [fold(keyword) for keyword in keywords]
+        matched: Set[int] = set()
+        for field in fields:
+            index = self._text_index(collection, field, collection_data)
+            if index is not None:
+                matched.update(index.contains_any(needles, collection_data).tolist())
+                continue
+            for row, item in enumerate(collection_data):
+                if row in matched or not isinstance(item, dict):
+                    continue
+                text = fold(field_text(item.get(field)))
+                if any(needle in text for needle in needles):
+                    matched.add(row)
+
+        return [
+            collection_data[row] for row in sorted(matched)
+            if isinstance(collection_data[row], dict)
+        ]
@@ -0,0 +1,519 @@
+"""
+Declarative checks over a parsed final answer.
+
+A check spec describes what a validator expects from the answer JSON. It can
+live inline in a task JSON under ``"check_spec"`` or in a sidecar file
+``rewards/checks/<task-id>.json``. Specs are compiled once into a plan of
+closures (paths pre-split, comparisons pre-bound, static messages
+pre-formatted) and plans are cached per task.
+
+Spec format:
+
+    {
+      "checks": [
+        {"path": "email_input.x", "equals": 24, "label": "Email Input x=24"},
+        {"path": ["vertical_spacing", "spacing"], "equals": 20, "aliases": ["20"]},
+        {"path": "framework", "equals": "react", "ignore_case": true},
+        {"path": "code_length", "gt": 100},
+        {"path": "same_dimensions", "is": true,
+         "fail": "same_dimensions is not true"},
+        {"label": "Email Input dimensions 327x48",
+         "all": [{"path": "email_input.width", "equals": 327},
+                 {"path": "email_input.height", "equals": 48}],
+         "fail": "Email Input dimensions {actual[0]}x{actual[1]}, expected 327x48"},
+        {"item": {"list": "components", "key": "name", "contains": "primary"},
+         "missing": "Button/Primary component not found",
+         "checks": [{"path": "x", "equals": 100}]}
+      ]
+    }
+
+Check keys:
+    path            Dotted path into the answer (or into the matched item).
+                    A list of paths is a list of aliases; the first one
+                    that resolves is used.
+    default         Value to use when the path doesn't resolve (null).
+    equals          Expected value. ``tolerance`` allows a numeric margin,
+                    ``ignore_case`` compares strings case-insensitively and
+                    ``aliases`` lists other accepted values.
+    is              Identity check against true, false or null.
+    one_of          Any of the listed values.
+    contains_any    Case-insensitive substring match against any/all of
+    contains_all    the listed strings.
+    non_empty       A non-empty string, list or object; with ``type`` only
+                    that type is accepted (``"type": "string"``).
+    gt, gte, lt, lte
+                    Numeric bound (booleans are not numbers).
+    length          Expected length of a list, string or object.
+    type            "string", "number", "boolean", "list" or "object".
+    all             A group of checks reported as one message.
+    item            Find a list element by a key: ``{"list", "key",
+                    "equals" | "contains"}``; its ``checks`` are evaluated
+                    relative to the element, ``missing`` is the message
+                    if no element matches.
+
+Messages:
+    ``label`` names the check. ``pass`` and ``fail`` override the message
+    text and are ``str.format`` templates over ``actual`` (a list for
+    ``all`` groups), ``expected`` and ``label``. "[✓] " / "[X] " prefixes
+    are added automatically.
+"""
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .answers import parse_answer
+from .scoring import FAIL_FAST, DiscardedMessages, current_mode, message_lists, run_scored
+
+CHECKS_DIR = Path(__file__).parent / "checks"
+
+_MISSING = object()
+
+# evaluate(data) -> (passed, actual)
+_Predicate = Callable[[Any], Tuple[bool, Any]]
+# run(data, checks_passed, errors)
+_Step = Callable[[Any, List[str], List[str]], None]
+# batch(datas) -> boolean array, True where the check passes
+_BatchTest = Callable[[List[Any]], np.ndarray]
+
+_COMPARISONS = (
+    "equals", "is", "one_of", "contains_any", "contains_all",
+    "non_empty", "gt", "gte", "lt", "lte", "length", "type",
+)
+_BOUNDS = {"gt": np.greater, "gte": np.greater_equal, "lt": np.less, "lte": np.less_equal}
+# Integers beyond this lose precision as float64 and are compared one by one
+_MAX_EXACT_INT = 2 ** 53
+_TYPES = {
+    "string": lambda value: isinstance(value, str),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "boolean": lambda value: isinstance(value, bool),
+    "list": lambda value: isinstance(value, list),
+    "object": lambda value: isinstance(value, dict),
+}
+
+
+class CheckSpecError(ValueError):
+    """Raised when a check spec is malformed."""
+
+
+def _split_path(path: str) -> Tuple[str, ...]:
+    return tuple(part for part in path.split(".") if part)
+
+
+def _resolver(spec: Dict[str, Any]) -> Callable[[Any], Any]:
+    """Compile ``path`` (or a list of alias paths) into a lookup function."""
+    path = spec.get("path")
+    if path is None:
+        raise CheckSpecError(f"Check needs a 'path': {spec!r}")
+    paths = [_split_path(p) for p in ([path] if isinstance(path, str) else path)]
+    default = spec.get("default")
+
+    def resolve(data: Any) -> Any:
+        for parts in paths:
+            current = data
+            for part in parts:
+                if isinstance(current, dict) and part in current:
+                    current = current[part]
+                else:
+                    current = _MISSING
+                    break
+            if current is not _MISSING:
+                return current
+        return default
+
+    return resolve
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _comparison(spec: Dict[str, Any]) -> Tuple[Callable[[Any], bool], Any]:
+    """Compile the comparison of a check into (test, expected)."""
+    names = [name for name in _COMPARISONS if name in spec]
+    if "non_empty" in names and "type" in names:
+        names.remove("type")
+    if len(names) != 1:
+        raise CheckSpecError(f"Check needs exactly one comparison of {_COMPARISONS}: {spec!r}")
+    name = names[0]
+    expected = spec[name]
+
+    if name == "equals":
+        accepted = [expected] + list(spec.get("aliases", []))
+        tolerance = spec.get("tolerance", 0)
+        if spec.get("ignore_case"):
+            lowered = {value.lower() for value in accepted if isinstance(value, str)}
+            others = [value for value in accepted if not isinstance(value, str)]
+            return (
+                lambda value: (value.lower() in lowered) if isinstance(value, str) else value in others,
+                expected,
+            )
+        if tolerance:
+            numbers = [value for value in accepted if _is_number(value)]
+            return (
+                lambda value: (
+                    any(abs(value - number) <= tolerance for number in numbers)
+                    if _is_number(value) else value in accepted
+                ),
+                expected,
+            )
+        if len(accepted) == 1:
+            return (lambda value: value == expected), expected
+        return (lambda value: value in accepted), expected
+
+    if name == "is":
+        return (lambda value: value is expected), expected
+    if name == "one_of":
+        return (lambda value: value in expected), expected
+    if name in ("contains_any", "contains_all"):
+        needles = [str(needle).lower() for needle in expected]
+        combine = any if name == "contains_any" else all
+
+        def contains(value: Any) -> bool:
+            if value is None:
+                return False
+            text = str(value).lower()
+            return combine(needle in text for needle in needles)
+
+        return contains, expected
+    if name == "non_empty":
+        if "type" not in spec:
+            return (lambda value: isinstance(value, (str, list, dict)) and len(value) > 0), True
+        if spec["type"] not in ("string", "list", "object"):
+            raise CheckSpecError(f"non_empty needs a string, list or object type, got {spec['type']!r}")
+        is_type = _TYPES[spec["type"]]
+        return (lambda value: is_type(value) and len(value) > 0), True
+    if name in ("gt", "gte", "lt", "lte"):
+        compare = {
+            "gt": lambda value: value > expected,
+            "gte": lambda value: value >= expected,
+            "lt": lambda value: value < expected,
+            "lte": lambda value: value <= expected,
+        }[name]
+        return (lambda value: _is_number(value) and compare(value)), expected
+    if name == "length":
+        return (lambda value: isinstance(value, (str, list, dict)) and len(value) == expected), expected
+    if expected not in _TYPES:
+        raise CheckSpecError(f"Unknown type {expected!r}, expected one of {sorted(_TYPES)}")
+    return _TYPES[expected], expected
+
+
+def _vector_test(spec: Dict[str, Any]) -> Optional[Tuple[Callable[[np.ndarray], np.ndarray], bool]]:
+    """Vectorized form of a numeric comparison as (test, bools_count_as_numbers), or None.
+
+    Mirrors ``_comparison``: ``equals`` without a tolerance accepts True/False
+    as 1/0 (Python equality), bounds never accept booleans.
+    """
+    for name, compare in _BOUNDS.items():
+        if name in spec and _is_number(spec[name]):
+            bound = spec[name]
+            return (lambda values: compare(values, bound)), False
+    if "equals" in spec and not spec.get("ignore_case"):
+        accepted = [spec["equals"]] + list(spec.get("aliases", []))
+        tolerance = spec.get("tolerance", 0)
+        if not all(_is_number(value) for value in accepted) or not _is_number(tolerance):
+            return None
+        targets = np.asarray(accepted, dtype=np.float64)
+        return (lambda values: (np.abs(values[:, None] - targets) <= tolerance).any(axis=1)), not tolerance
+    return None
+
+
+def _exact_float(value: Any, bools: bool) -> bool:
+    if isinstance(value, bool):
+        return bools
+    if isinstance(value, float):
+        return True
+    return isinstance(value, int) and abs(value) <= _MAX_EXACT_INT
+
+
+def _compile_batch_leaf(spec: Dict[str, Any]) -> _BatchTest:
+    resolve = _resolver(spec)
+    test, _ = _comparison(spec)
+    vector = _vector_test(spec)
+
+    def batch(datas: List[Any]) -> np.ndarray:
+        values = [resolve(data) for data in datas]
+        if vector is None:
+            return np.fromiter((bool(test(value)) for value in values), dtype=bool, count=len(values))
+        vector_test, bools = vector
+        exact = np.fromiter((_exact_float(value, bools) for value in values), dtype=bool, count=len(values))
+        ok = np.empty(len(values), dtype=bool)
+        if exact.any():
+            ok[exact] = vector_test(np.asarray([float(value) for value, e in zip(values, exact) if e]))
+        for row in np.flatnonzero(~exact).tolist():
+            ok[row] = bool(test(values[row]))
+        return ok
+
+    return batch
+
+
+def _compile_batch(spec: Dict[str, Any]) -> _BatchTest:
+    """Compile a check into a pass/fail test over many answers at once."""
+    if isinstance(spec, dict) and "all" in spec and "item" not in spec:
+        parts = [_compile_batch(part) for part in spec["all"]]
+
+        def group(datas: List[Any]) -> np.ndarray:
+            ok = np.ones(len(datas), dtype=bool)
+            for part in parts:
+                ok &= part(datas)
+            return ok
+
+        return group
+    if isinstance(spec, dict) and "item" not in spec:
+        return _compile_batch_leaf(spec)
+
+    step = _compile_step(spec)
+
+    def each(datas: List[Any]) -> np.ndarray:
+        ok = np.empty(len(datas), dtype=bool)
+        for row, data in enumerate(datas):
+            errors: List[str] = []
+            step(data, DiscardedMessages(), errors)
+            ok[row] = not errors
+        return ok
+
+    return each
+
+
+def _messages(
+    spec: Dict[str, Any], expected: Any
+) -> Tuple[Callable[[Any], str], Callable[[Any], str]]:
+    """Compile pass/fail message builders; static messages are formatted once."""
+    label = spec.get("label") or spec.get("path") or "check"
+    if isinstance(label, list):
+        label = label[0]
+    pass_template = spec.get("pass", str(label))
+    fail_template = spec.get("fail", "{label} is {actual!r}, expected {expected!r}")
+
+    def builder(prefix: str, template: str) -> Callable[[Any], str]:
+        if "{" not in template:
+            message = prefix + template
+            return lambda actual: message
+        return lambda actual: prefix + template.format(actual=actual, expected=expected, label=label)
+
+    return builder("[✓] ", pass_template), builder("[X] ", fail_template)
+
+
+def _compile_predicate(spec: Dict[str, Any]) -> Tuple[_Predicate, Any]:
+    """Compile a leaf check or an ``all`` group into (predicate, expected)."""
+    if "all" in spec:
+        parts = [_compile_predicate(part) for part in spec["all"]]
+
+        def group(data: Any) -> Tuple[bool, Any]:
+            results = [predicate(data) for predicate, _ in parts]
+            return all(ok for ok, _ in results), [actual for _, actual in results]
+
+        return group, [expected for _, expected in parts]
+
+    resolve = _resolver(spec)
+    test, expected = _comparison(spec)
+
+    def leaf(data: Any) -> Tuple[bool, Any]:
+        actual = resolve(data)
+        return test(actual), actual
+
+    return leaf, expected
+
+
+def _compile_item(spec: Dict[str, Any]) -> _Step:
+    item = spec["item"]
+    list_path = _resolver({"path": item.get("list")})
+    key = item.get("key", "name")
+    if "equals" in item:
+        wanted = item["equals"]
+        matches: Callable[[Any], bool] = lambda value: value == wanted
+    elif "contains" in item:
+        needle = str(item["contains"]).lower()
+        matches = lambda value: isinstance(value, str) and needle in value.lower()
+    else:
+        raise CheckSpecError(f"'item' needs 'equals' or 'contains': {spec!r}")
+    missing = "[X] " + spec.get("missing", f"{item.get('list')} item with {key} {item.get('equals', item.get('contains'))!r} not found")
+    steps = [_compile_step(check) for check in spec.get("checks", [])]
+
+    def run(data: Any, checks_passed: List[str], errors: List[str]) -> None:
+        elements = list_path(data)
+        found = None
+        if isinstance(elements, list):
+            found = next(
+                (element for element in elements if isinstance(element, dict) and matches(element.get(key))),
+                None,
+            )
+        if found is None:
+            errors.append(missing)
+            return
+        for step in steps:
+            step(found, checks_passed, errors)
+
+    return run
+
+
+def _compile_step(spec: Dict[str, Any]) -> _Step:
+    if not isinstance(spec, dict):
+        raise CheckSpecError(f"Check must be an object, got {spec!r}")
+    if "item" in spec:
+        return _compile_item(spec)
+
+    predicate, expected = _compile_predicate(spec)
+    on_pass, on_fail = _messages(spec, expected)
+
+    def run(data: Any, checks_passed: List[str], errors: List[str]) -> None:
+        ok, actual = predicate(data)
+        if ok:
+            if not isinstance(checks_passed, DiscardedMessages):
+                checks_passed.append(on_pass(actual))
+        else:
+            errors.append(on_fail(actual))
+
+    return run
+
+
+class CheckPlan:
+    """A compiled check spec."""
+
+    def __init__(self, spec: Dict[str, Any]):
+        if not isinstance(spec, dict) or not isinstance(spec.get("checks"), list):
+            raise CheckSpecError("Check spec must be an object with a 'checks' list")
+        self.spec = spec
+        self._steps: Sequence[_Step] = [_compile_step(check) for check in spec["checks"]]
+        self._batch_tests: Sequence[_BatchTest] = [_compile_batch(check) for check in spec["checks"]]
+
+    def evaluate(self, data: Any) -> Tuple[List[str], List[str]]:
+        """Run every check against parsed answer data.
+
+        In fail-fast scoring mode (see ``scoring.py``) evaluation stops at
+        the first failed check and pass messages are never formatted.
+
+        Returns:
+            (checks_passed, errors) message lists.
+        """
+        checks_passed, errors = message_lists()
+        for step in self._steps:
+            step(data, checks_passed, errors)
+        return checks_passed, errors
+
+    def passes_many(self, datas: Sequence[Any]) -> np.ndarray:
+        """Whether each parsed answer passes every check, without building messages.
+
+        Checks run one at a time over the answers still passing, with
+        numeric comparisons vectorized.
+        """
+        ok = np.ones(len(datas), dtype=bool)
+        for batch in self._batch_tests:
+            rows = np.flatnonzero(ok)
+            if not rows.size:
+                break
+            ok[rows] = batch([datas[row] for row in rows.tolist()])
+        return ok
+
+
+def score_answer(plan: CheckPlan, final_answer: str) -> Dict[str, Any]:
+    """Parse a final answer and score it against a plan.
+
+    Returns a TaskScore-shaped dict with the same parse and exception
+    messages as the hand-written validators in figma_v2.py.
+    """
+    checks_passed, errors = message_lists()
+    try:
+        json_data = parse_answer(final_answer)
+        if not json_data:
+            errors.append("[X] Could not parse JSON from final answer")
+        else:
+            checks_passed.append("[✓] JSON response parsed successfully")
+            passed, failed = plan.evaluate(json_data)
+            checks_passed.extend(passed)
+            errors.extend(failed)
+    except Exception as e:
+        errors.append(f"[X] Exception during validation: {str(e)}")
+
+    return {
+        "score": 1.0 if not errors else 0.0,
+        "metadata": {"success_accumulator": checks_passed, "error_accumulator": errors},
+    }
+
+
+def score_answers(plan: CheckPlan, answers: Sequence[str]) -> List[Dict[str, Any]]:
+    """Score several answers against one plan; results are in input order.
+
+    Identical answers are scored once and share a result. In verbose mode
+    each distinct answer is scored with ``score_answer``. In fail-fast mode
+    all parsed answers go through ``CheckPlan.passes_many`` together and
+    only the failing ones are re-scored individually for their first error.
+    """
+    slots: Dict[str, int] = {}
+    order = [slots.setdefault(answer, len(slots)) for answer in answers]
+    texts = list(slots)
+
+    if current_mode() != FAIL_FAST:
+        results = [score_answer(plan, text) for text in texts]
+    else:
+        passed = np.zeros(len(texts), dtype=bool)
+        try:
+            parsed = [parse_answer(text) for text in texts]
+            rows = [row for row, data in enumerate(parsed) if data]
+            if rows:
+                passed[rows] = plan.passes_many([parsed[row] for row in rows])
+        except Exception:
+            passed[:] = False
+        results = [
+            {"score": 1.0, "metadata": {"success_accumulator": [], "error_accumulator": []}}
+            if ok else run_scored(lambda text=text: score_answer(plan, text), FAIL_FAST)
+            for text, ok in zip(texts, passed.tolist())
+        ]
+    return [results[slot] for slot in order]
+
+
+def compile_spec(spec: Dict[str, Any]) -> CheckPlan:
+    """Compile a check spec.
+
+    Raises:
+        CheckSpecError: If the spec is malformed.
+    """
+    return CheckPlan(spec)
+
+
+_plans: Dict[Tuple[str, str], CheckPlan] = {}
+_plans_lock = threading.Lock()
+
+
+def load_check_spec(task_id: str, task: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """Return a task's inline ``check_spec``, or its sidecar spec, or None."""
+    if task is not None and task.get("check_spec") is not None:
+        return task["check_spec"]
+    path = CHECKS_DIR / f"{task_id}.json"
+    if not path.exists():
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def plan_for_task(task_id: str, spec: Optional[Dict[str, Any]] = None) -> CheckPlan:
+    """Return the compiled plan for a task, compiling it on first use.
+
+    With ``spec`` (e.g. a task's inline ``check_spec``) plans are cached by
+    task id and spec content; without it the sidecar file is used and its
+    plan is cached until the file's mtime changes.
+
+    Raises:
+        CheckSpecError: If the task has no spec or it is malformed.
+    """
+    if spec is not None:
+        key = (task_id, hashlib.sha256(json.dumps(spec, sort_keys=True).encode()).hexdigest())
+    else:
+        path = CHECKS_DIR / f"{task_id}.json"
+        try:
+            key = (task_id, f"mtime:{path.stat().st_mtime_ns}")
+        except OSError:
+            raise CheckSpecError(f"No check spec found for task '{task_id}'") from None
+
+    plan = _plans.get(key)
+    if plan is None:
+        if spec is None:
+            spec = load_check_spec(task_id)
+        plan = compile_spec(spec)
+        with _plans_lock:
+            _plans[key] = plan
+    return plan
@@ -0,0 +1,463 @@
+"""
+Structural summaries of generated React (JSX/TSX) and SwiftUI code.
+
+Code-extraction answers carry the generated component as a string.
+Validators used to trust self-reported fields (``has_svg``,
+``code_length``) or look for substrings anywhere in the code, including in
+comments. ``summarize_jsx`` and ``summarize_swiftui`` tokenize the code in
+one left-to-right pass and report what is actually there: declared and
+exported components, imports, JSX elements and their props, SVG markup
+(as JSX or inside string literals) and, for SwiftUI, View structs,
+containers and modifier chains.
+
+The JSX scanner tracks the nesting of code, template literals, tags and
+element children on an explicit stack, so JSX text (apostrophes, braces
+inside strings) and deeply nested markup don't confuse it and there is no
+recursion. Every token is matched with an anchored regex at the current
+position, so the scan is linear in the code length.
+
+Summaries are cached by the code's sha256 and are frozen, since validators
+scoring the same answer share them.
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypedDict
+
+from .frozen import freeze
+
+_CACHE_SIZE = 256
+
+SVG_TAGS = frozenset({
+    "svg", "g", "path", "rect", "circle", "ellipse", "line", "polyline", "polygon", "text", "tspan",
+    "defs", "use", "symbol", "clipPath", "mask", "linearGradient", "radialGradient", "stop",
+    "pattern", "image", "filter", "foreignObject",
+})
+
+# Keywords after which "<" starts JSX rather than a comparison
+_JSX_AFTER_KEYWORDS = frozenset({"return", "yield", "default", "else", "case", "in", "of", "await", "typeof", "void"})
+
+_WS = re.compile(r"\s+")
+_LINE_COMMENT = re.compile(r"//[^\n]*")
+_BLOCK_COMMENT = re.compile(r"/\*.*?(?:\*/|\Z)", re.S)
+_QUOTED = {
+    '"': re.compile(r'"(?:[^"\\\n]|\\.)*"?'),
+    "'": re.compile(r"'(?:[^'\\\n]|\\.)*'?"),
+}
+_IDENT = re.compile(r"[A-Za-z_$][\w$]*")
+_NUMBER = re.compile(r"\d[\w.]*")
+_PUNCT = re.compile(r"=>|\.\.\.|&&|\|\||\?\?|[=!]==?|[<>]=?|.", re.S)
+_TEMPLATE_CHUNK = re.compile(r"(?:[^`\\$]|\\.|\$(?!\{))*", re.S)
+_TAG_NAME = re.compile(r"[A-Za-z_$][\w$.:-]*")
+_ATTR_NAME = re.compile(r"[A-Za-z_$][\w$:-]*")
+_ATTR_STRING = re.compile(r'"[^"]*"?|\'[^\']*\'?')
+_CHILD_TEXT = re.compile(r"[^<{]+")
+_MARKUP_TAG = re.compile(r"<([A-Za-z][\w:-]*)")
+
+
+class JsxSummary(TypedDict):
+    length: int
+    components: List[str]
+    default_export: Optional[str]
+    has_default_export: bool
+    exports: List[str]
+    imports: Dict[str, List[str]]
+    elements: Dict[str, int]
+    props: Dict[str, int]
+    svg_elements: Dict[str, int]
+    has_svg: bool
+    returns_jsx: bool
+    balanced: bool
+
+
+class SwiftUISummary(TypedDict):
+    length: int
+    imports: List[str]
+    views: List[str]
+    has_body: bool
+    containers: Dict[str, int]
+    view_types: Dict[str, int]
+    modifiers: Dict[str, int]
+    svg_elements: Dict[str, int]
+    has_svg: bool
+    balanced: bool
+
+
+def _count(counts: Dict[str, int], key: str) -> None:
+    counts[key] = counts.get(key, 0) + 1
+
+
+def _markup_tags(text: str, counts: Dict[str, int]) -> None:
+    """Count SVG tags in markup embedded in a string literal."""
+    if "<" not in text:
+        return
+    for match in _MARKUP_TAG.finditer(text):
+        if match.group(1) in SVG_TAGS:
+            _count(counts, match.group(1))
+
+
+class _JsxScanner:
+    """Single-pass JSX/TSX scanner (see module docstring)."""
+
+    def __init__(self, code: str):
+        self.code = code
+        self.pos = 0
+        self.components: List[str] = []
+        self.exports: List[str] = []
+        self.default_export: Optional[str] = None
+        self.has_default_export = False
+        self.imports: Dict[str, List[str]] = {}
+        self.elements: Dict[str, int] = {}
+        self.props: Dict[str, int] = {}
+        self.svg: Dict[str, int] = {}
+        self.returns_jsx = False
+        self.balanced = True
+        # Frames: ["code", brace depth, closes on "}"], ["template"], ["tag", name], ["children", name]
+        self.stack: List[List[Any]] = [["code", 0, False]]
+        # Recent significant code tokens, for declarations and JSX detection
+        self.recent: List[str] = []
+        # Names bound by the import statement being scanned
+        self.in_import = False
+        self.import_names: List[str] = []
+
+    def scan(self) -> JsxSummary:
+        code = self.code
+        while self.pos < len(code):
+            kind = self.stack[-1][0]
+            if kind == "code":
+                self._code_token()
+            elif kind == "template":
+                self._template_token()
+            elif kind == "tag":
+                self._tag_token()
+            else:
+                self._children_token()
+        if len(self.stack) != 1 or self.stack[0][1] != 0:
+            self.balanced = False
+        return JsxSummary(
+            length=len(code),
+            components=self.components,
+            default_export=self.default_export,
+            has_default_export=self.has_default_export,
+            exports=self.exports,
+            imports=self.imports,
+            elements=self.elements,
+            props=self.props,
+            svg_elements=self.svg,
+            has_svg=bool(self.svg),
+            returns_jsx=self.returns_jsx,
+            balanced=self.balanced,
+        )
+
+    def _match(self, pattern: "re.Pattern[str]") -> Optional[str]:
+        match = pattern.match(self.code, self.pos)
+        if match is None or match.end() == self.pos:
+            return None
+        self.pos = match.end()
+        return match.group()
+
+    def _push_recent(self, token: str) -> None:
+        self.recent.append(token)
+        if len(self.recent) > 4:
+            del self.recent[0]
+
+    def _statement_start(self) -> bool:
+        return not self.recent or self.recent[-1] in (";", "}", "{")
+
+    def _jsx_allowed(self) -> bool:
+        if not self.recent:
+            return True
+        last = self.recent[-1]
+        if last in _JSX_AFTER_KEYWORDS:
+            return True
+        return not (last[0].isalnum() or last[0] in "_$)]" or last in ("jsx", "string"))
+
+    def _declare(self, name: str) -> None:
+        """Record declarations and exports from the tokens before an identifier."""
+        # "async" doesn't change what is being declared or exported
+        recent = [token for token in self.recent if token != "async"]
+        previous = recent[-1] if recent else ""
+        if previous in ("function", "class", "const", "let", "var"):
+            if name[:1].isupper() and name not in self.components:
+                self.components.append(name)
+            if recent[-3:-1] == ["export", "default"]:
+                self.default_export = name
+            elif recent[-2:-1] == ["export"]:
+                self.exports.append(name)
+        elif recent[-2:] == ["export", "default"] and name not in ("function", "class"):
+            self.default_export = name
+        if name == "default" and previous == "export":
+            self.has_default_export = True
+        if self.in_import and name not in ("from", "as", "type"):
+            self.import_names.append(name)
+
+    def _code_token(self) -> None:
+        code, frame = self.code, self.stack[-1]
+        char = code[self.pos]
+        if char.isspace():
+            self._match(_WS)
+            return
+        if code.startswith("//", self.pos):
+            self._match(_LINE_COMMENT)
+            return
+        if code.startswith("/*", self.pos):
+            self._match(_BLOCK_COMMENT)
+            return
+        if char in _QUOTED:
+            literal = self._match(_QUOTED[char]) or char
+            _markup_tags(literal, self.svg)
+            if self.in_import and self.recent and self.recent[-1] in ("from", "import"):
+                self.imports.setdefault(literal.strip("'\""), []).extend(self.import_names)
+                self.in_import = False
+                self.import_names = []
+            self._push_recent("string")
+            return
+        if char == "`":
+            self.pos += 1
+            self.stack.append(["template"])
+            return
+        identifier = self._match(_IDENT)
+        if identifier is not None:
+            self._declare(identifier)
+            if identifier == "import" and self._statement_start():
+                self.in_import = True
+                self.import_names = []
+            self._push_recent(identifier)
+            return
+        if char.isdigit():
+            self._match(_NUMBER)
+            self._push_recent("0")
+            return
+        if char == "<" and self._jsx_allowed() and (_TAG_NAME.match(code, self.pos + 1) or code.startswith("<>", self.pos)):
+            if self.recent and self.recent[-1] in ("return", "(") and "return" in self.recent[-2:]:
+                self.returns_jsx = True
+            self.pos += 1
+            self._open_tag()
+            return
+        token = self._match(_PUNCT) or char
+        if token == "{":
+            frame[1] += 1
+        elif token == "}":
+            if frame[1] == 0 and frame[2]:
+                self.stack.pop()
+                return
+            if frame[1] == 0:
+                self.balanced = False
+            else:
+                frame[1] -= 1
+        self._push_recent(token)
+
+    def _template_token(self) -> None:
+        code = self.code
+        start = self.pos
+        self._match(_TEMPLATE_CHUNK)
+        _markup_tags(code[start:self.pos], self.svg)
+        if self.pos >= len(code):
+            return
+        if code[self.pos] == "`":
+            self.pos += 1
+            self.stack.pop()
+            self._push_recent("string")
+        elif code.startswith("${", self.pos):
+            self.pos += 2
+            self.stack.append(["code", 0, True])
+        else:
+            self.pos += 1
+
+    def _open_tag(self) -> None:
+        """Called just after "<" of an opening tag or fragment."""
+        name = self._match(_TAG_NAME) or ""
+        _count(self.elements, name or "<>")
+        if name in SVG_TAGS:
+            _count(self.svg, name)
+        if name:
+            self.stack.append(["tag", name])
+        else:
+            # Fragment: "<>" opens children directly
+            self.pos += 1
+            self.stack.append(["children", ""])
+
+    def _tag_token(self) -> None:
+        code = self.code
+        char = code[self.pos]
+        if char.isspace():
+            self._match(_WS)
+        elif code.startswith("/>", self.pos):
+            self.pos += 2
+            self._close_element()
+        elif char == ">":
+            self.pos += 1
+            name = self.stack.pop()[1]
+            self.stack.append(["children", name])
+        elif char == "{":
+            self.pos += 1
+            self.stack.append(["code", 0, True])
+        elif char in "\"'":
+            self._match(_ATTR_STRING)
+        else:
+            attribute = self._match(_ATTR_NAME)
+            if attribute is not None:
+                _count(self.props, attribute)
+            else:
+                self.pos += 1
+
+    def _children_token(self) -> None:
+        code = self.code
+        char = code[self.pos]
+        if char == "{":
+            self.pos += 1
+            self.stack.append(["code", 0, True])
+        elif char == "<":
+            if code.startswith("</", self.pos):
+                end = code.find(">", self.pos)
+                closing = code[self.pos + 2:end if end >= 0 else len(code)].strip()
+                self.pos = end + 1 if end >= 0 else len(code)
+                if closing != self.stack[-1][1]:
+                    self.balanced = False
+                self._close_element()
+            else:
+                self.pos += 1
+                self._open_tag()
+        else:
+            self._match(_CHILD_TEXT)
+
+    def _close_element(self) -> None:
+        self.stack.pop()
+        if self.stack[-1][0] == "code":
+            self._push_recent("jsx")
+
+
+_SWIFT_TOKEN = re.compile(
+    r'(?P<ws>\s+)'
+    r'|(?P<comment>//[^\n]*|/\*.*?(?:\*/|\Z))'
+    r'|(?P<string>"""(?:[^\\]|\\.)*?(?:"""|\Z)|"(?:[^"\\\n]|\\.)*"?)'
+    r'|(?P<ident>[A-Za-z_][\w]*)'
+    r'|(?P<number>\d[\w.]*)'
+    r'|(?P<punct>->|\S)',
+    re.S,
+)
+_SWIFT_CONTAINERS = frozenset({
+    "VStack", "HStack", "ZStack", "LazyVStack", "LazyHStack", "LazyVGrid", "LazyHGrid",
+    "ScrollView", "List", "Form", "Group", "NavigationStack", "NavigationView", "GeometryReader",
+})
+
+
+def summarize_swiftui_uncached(code: str) -> SwiftUISummary:
+    imports: List[str] = []
+    views: List[str] = []
+    containers: Dict[str, int] = {}
+    view_types: Dict[str, int] = {}
+    modifiers: Dict[str, int] = {}
+    svg: Dict[str, int] = {}
+    has_body = False
+    depth = 0
+    balanced = True
+    # (kind, text) of the last three significant tokens
+    recent: List[Tuple[str, str]] = []
+    pending_struct: Optional[str] = None
+    pending_member: Optional[str] = None
+
+    for match in _SWIFT_TOKEN.finditer(code):
+        kind = match.lastgroup or "punct"
+        if kind in ("ws", "comment"):
+            continue
+        text = match.group()
+        if kind == "string":
+            _markup_tags(text, svg)
+        # A ".name" member becomes a modifier once it's followed by "(" or "{"
+        if pending_member is not None:
+            if text in ("(", "{"):
+                _count(modifiers, pending_member)
+            pending_member = None
+        if kind == "ident":
+            last = recent[-1] if recent else ("", "")
+            if last == ("ident", "import"):
+                imports.append(text)
+            elif last == ("ident", "struct"):
+                pending_struct = text
+            elif last == ("punct", "."):
+                before = recent[-2] if len(recent) > 1 else ("", "")
+                chained = before[1] in (")", "}", "]") or (before[0] == "ident" and not before[1][:1].isupper())
+                if chained:
+                    pending_member = text
+            elif text in _SWIFT_CONTAINERS:
+                _count(containers, text)
+            elif text[:1].isupper():
+                _count(view_types, text)
+            if text == "View" and pending_struct is not None and pending_struct not in views:
+                views.append(pending_struct)
+            if text == "body" and last == ("ident", "var"):
+                has_body = True
+        elif text == "{":
+            depth += 1
+            pending_struct = None
+        elif text == "}":
+            if depth == 0:
+                balanced = False
+            else:
+                depth -= 1
+        recent.append((kind, text))
+        if len(recent) > 3:
+            del recent[0]
+
+    return SwiftUISummary(
+        length=len(code),
+        imports=imports,
+        views=views,
+        has_body=has_body,
+        containers=containers,
+        view_types=view_types,
+        modifiers=modifiers,
+        svg_elements=svg,
+        has_svg=bool(svg),
+        balanced=balanced and depth == 0,
+    )
+
+
+def summarize_jsx_uncached(code: str) -> JsxSummary:
+    return _JsxScanner(code).scan()
+
+
+class _SummaryCache:
+    """Bounded LRU of frozen summaries keyed by (language, code sha256)."""
+
+    def __init__(self, maxsize: int = _CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[str, bytes], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, language: str, code: str, build: Callable[[str], Any]) -> Any:
+        key = (language, hashlib.sha256(code.encode("utf-8", "surrogatepass")).digest())
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        summary = freeze(build(code))
+        with self._lock:
+            self._entries[key] = summary
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return summary
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_summaries = _SummaryCache()
+
+
+def summarize_jsx(code: str) -> Optional[JsxSummary]:
+    """Cached, read-only structural summary of JSX/TSX code (None for non-strings)."""
+    if not isinstance(code, str):
+        return None
+    return _summaries.get("jsx", code, summarize_jsx_uncached)
+
+
+def summarize_swiftui(code: str) -> Optional[SwiftUISummary]:
+    """Cached, read-only structural summary of SwiftUI code (None for non-strings)."""
+    if not isinstance(code, str):
+        return None
+    return _summaries.get("swiftui", code, summarize_swiftui_uncached)
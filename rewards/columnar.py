@@ -0,0 +1,338 @@
+"""
+Columnar storage for BackendDictAdapter collections.
+
+A ColumnarCollection stores one array per top-level field instead of a list
+of dicts. Strings and booleans are dictionary-encoded (an int32 code per row
+plus a vocabulary), homogeneous ints/floats become NumPy columns, and
+everything else (lists, nested dicts, mixed types) falls back to a plain
+object column. Filters are evaluated as boolean masks over whole columns and
+documents are only rebuilt for the rows that match.
+
+Matching semantics are identical to ``query_filter.document_matches``; a
+missing field and an explicit ``None`` are indistinguishable to filters but
+are preserved when documents are rebuilt.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List
+
+import numpy as np
+
+from .query_filter import value_matches
+
+_MISSING = object()
+
+# Codes used by dictionary-encoded and numeric columns
+_CODE_MISSING = -1
+_CODE_NULL = -2
+
+_INT64_MIN = -(2 ** 63)
+_INT64_MAX = 2 ** 63 - 1
+
+
+class _Column(ABC):
+    """Base class for a single field stored column-wise."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abstractmethod
+    def get(self, row: int) -> Any:
+        """Return the stored value for a row, or _MISSING."""
+        pass
+
+    def take(self, rows: np.ndarray) -> List[Any]:
+        """Return the stored values (or _MISSING) for several rows at once."""
+        return [self.get(int(row)) for row in rows]
+
+    def mask(self, condition: Any) -> np.ndarray:
+        """Return a boolean mask of rows whose value satisfies the condition."""
+        return self._fallback_mask(condition)
+
+    def _fallback_mask(self, condition: Any) -> np.ndarray:
+        n = len(self)
+        values = (self.get(i) for i in range(n))
+        return np.fromiter(
+            (value_matches(None if v is _MISSING else v, condition) for v in values),
+            dtype=bool,
+            count=n,
+        )
+
+
+class _DictionaryColumn(_Column):
+    """Dictionary-encoded column for str-only or bool-only fields."""
+
+    def __init__(self, values: List[Any]):
+        self.vocab: List[Any] = []
+        self.lookup: Dict[Any, int] = {}
+        codes = np.empty(len(values), dtype=np.int32)
+        for i, value in enumerate(values):
+            if value is _MISSING:
+                codes[i] = _CODE_MISSING
+            elif value is None:
+                codes[i] = _CODE_NULL
+            else:
+                code = self.lookup.get(value)
+                if code is None:
+                    code = len(self.vocab)
+                    self.lookup[value] = code
+                    self.vocab.append(value)
+                codes[i] = code
+        self.codes = codes
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def get(self, row: int) -> Any:
+        code = self.codes[row]
+        if code >= 0:
+            return self.vocab[code]
+        return None if code == _CODE_NULL else _MISSING
+
+    def take(self, rows: np.ndarray) -> List[Any]:
+        vocab = self.vocab
+        return [
+            vocab[code] if code >= 0 else (None if code == _CODE_NULL else _MISSING)
+            for code in self.codes[rows].tolist()
+        ]
+
+    def _codes_mask(self, matched_codes: Iterable[int], include_null: bool) -> np.ndarray:
+        matched = list(matched_codes)
+        mask = np.isin(self.codes, np.asarray(matched, dtype=np.int32)) if matched else np.zeros(len(self.codes), dtype=bool)
+        if include_null:
+            mask |= self.codes < 0
+        return mask
+
+    def mask(self, condition: Any) -> np.ndarray:
+        if isinstance(condition, dict):
+            if "$in" in condition:
+                candidates = condition.get("$in", [])
+                if not isinstance(candidates, (list, tuple, set, frozenset)):
+                    return self._fallback_mask(condition)
+                codes = set()
+                include_null = False
+                for candidate in candidates:
+                    if candidate is None:
+                        include_null = True
+                        continue
+                    try:
+                        code = self.lookup.get(candidate)
+                    except TypeError:
+                        continue
+                    if code is not None:
+                        codes.add(code)
+                return self._codes_mask(codes, include_null)
+            if "$regex" in condition:
+                # Evaluate the pattern once per distinct value, not once per row
+                matched = [
+                    code for code, value in enumerate(self.vocab)
+                    if value_matches(value, condition)
+                ]
+                return self._codes_mask(matched, value_matches(None, condition))
+        if condition is None:
+            return self.codes < 0
+        try:
+            code = self.lookup.get(condition)
+        except TypeError:
+            code = None
+        if code is None:
+            return np.zeros(len(self.codes), dtype=bool)
+        return self.codes == code
+
+
+class _NumericColumn(_Column):
+    """NumPy-backed column for int-only or float-only fields."""
+
+    def __init__(self, values: List[Any], dtype: Any):
+        n = len(values)
+        self.data = np.zeros(n, dtype=dtype)
+        # state: 0 = value present, _CODE_MISSING, _CODE_NULL
+        self.state = np.zeros(n, dtype=np.int8)
+        for i, value in enumerate(values):
+            if value is _MISSING:
+                self.state[i] = _CODE_MISSING
+            elif value is None:
+                self.state[i] = _CODE_NULL
+            else:
+                self.data[i] = value
+        self.present = self.state == 0
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def get(self, row: int) -> Any:
+        state = self.state[row]
+        if state == 0:
+            return self.data[row].item()
+        return None if state == _CODE_NULL else _MISSING
+
+    def take(self, rows: np.ndarray) -> List[Any]:
+        return [
+            value if state == 0 else (None if state == _CODE_NULL else _MISSING)
+            for value, state in zip(self.data[rows].tolist(), self.state[rows].tolist())
+        ]
+
+    def _equals_mask(self, value: Any) -> np.ndarray:
+        if isinstance(value, bool):
+            value = int(value)
+        if isinstance(value, int):
+            if not _INT64_MIN <= value <= _INT64_MAX:
+                return np.zeros(len(self.data), dtype=bool)
+        elif not isinstance(value, float):
+            return np.zeros(len(self.data), dtype=bool)
+        return self.present & (self.data == value)
+
+    def mask(self, condition: Any) -> np.ndarray:
+        if isinstance(condition, dict):
+            if "$in" in condition:
+                candidates = condition.get("$in", [])
+                if not isinstance(candidates, (list, tuple, set, frozenset)):
+                    return self._fallback_mask(condition)
+                mask = np.zeros(len(self.data), dtype=bool)
+                for candidate in candidates:
+                    if candidate is None:
+                        mask |= ~self.present
+                    else:
+                        mask |= self._equals_mask(candidate)
+                return mask
+            if "$regex" in condition:
+                mask = np.zeros(len(self.data), dtype=bool)
+                if self.present.any():
+                    distinct = np.unique(self.data[self.present])
+                    matched = [v for v in distinct if value_matches(v.item(), condition)]
+                    if matched:
+                        mask = self.present & np.isin(self.data, np.asarray(matched, dtype=self.data.dtype))
+                if value_matches(None, condition):
+                    mask |= ~self.present
+                return mask
+        if condition is None:
+            return ~self.present
+        if isinstance(condition, dict):
+            return np.zeros(len(self.data), dtype=bool)
+        return self._equals_mask(condition)
+
+
+class _ObjectColumn(_Column):
+    """Plain Python column for nested or mixed-type fields."""
+
+    def __init__(self, values: List[Any]):
+        self.values = values
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def get(self, row: int) -> Any:
+        return self.values[row]
+
+    def take(self, rows: np.ndarray) -> List[Any]:
+        values = self.values
+        return [values[row] for row in rows.tolist()]
+
+
+def _build_column(values: List[Any]) -> _Column:
+    kinds = set()
+    for value in values:
+        if value is _MISSING or value is None:
+            continue
+        kinds.add(type(value))
+        if len(kinds) > 1:
+            return _ObjectColumn(values)
+
+    if not kinds:
+        return _ObjectColumn(values)
+    kind = kinds.pop()
+    if kind is str or kind is bool:
+        return _DictionaryColumn(values)
+    if kind is float:
+        return _NumericColumn(values, np.float64)
+    if kind is int:
+        in_range = all(
+            _INT64_MIN <= v <= _INT64_MAX
+            for v in values
+            if v is not _MISSING and v is not None
+        )
+        if in_range:
+            return _NumericColumn(values, np.int64)
+    return _ObjectColumn(values)
+
+
+class ColumnarCollection:
+    """Column-wise copy of a collection (a list of documents).
+
+    Non-dict items are dropped, matching BackendDictAdapter which never
+    returns them. The collection is a snapshot: later changes to the source
+    documents are not reflected.
+    """
+
+    def __init__(self, documents: Iterable[Any]):
+        positions: List[int] = []
+        rows = []
+        for position, doc in enumerate(documents):
+            if isinstance(doc, dict):
+                positions.append(position)
+                rows.append(doc)
+        self.size = len(rows)
+        # Position of each row in the source list
+        self.positions = np.asarray(positions, dtype=np.int64)
+
+        # Field order follows first appearance across documents
+        fields: Dict[str, None] = {}
+        for doc in rows:
+            for key in doc:
+                if key not in fields:
+                    fields[key] = None
+
+        self.fields: List[str] = list(fields)
+        self.columns: Dict[str, _Column] = {
+            field: _build_column([doc.get(field, _MISSING) for doc in rows])
+            for field in self.fields
+        }
+
+    def __len__(self) -> int:
+        return self.size
+
+    def document(self, row: int) -> Dict[str, Any]:
+        """Rebuild the document stored at a row."""
+        doc: Dict[str, Any] = {}
+        for field in self.fields:
+            value = self.columns[field].get(row)
+            if value is not _MISSING:
+                doc[field] = value
+        return doc
+
+    def mask(self, filter_dict: Dict[str, Any]) -> np.ndarray:
+        """Evaluate a filter into a boolean row mask."""
+        mask = np.ones(self.size, dtype=bool)
+        for key, condition in filter_dict.items():
+            column = self.columns.get(key)
+            if column is None:
+                # Field absent from every document: the value is always None
+                if not value_matches(None, condition):
+                    return np.zeros(self.size, dtype=bool)
+                continue
+            mask &= column.mask(condition)
+            if not mask.any():
+                break
+        return mask
+
+    def find(self, filter_dict: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Return rebuilt documents matching the filter, in collection order."""
+        return self.documents(np.flatnonzero(self.mask(filter_dict)))
+
+    def find_rows(self, filter_dict: Dict[str, Any], exclude: Iterable[int] = ()) -> np.ndarray:
+        """Rows matching the filter, leaving out rows at the given source positions."""
+        mask = self.mask(filter_dict)
+        excluded = np.fromiter(exclude, dtype=np.int64)
+        if excluded.size:
+            mask &= ~np.isin(self.positions, excluded)
+        return np.flatnonzero(mask)
+
+    def documents(self, rows: np.ndarray) -> List[Dict[str, Any]]:
+        """Rebuild the documents at the given rows."""
+        docs: List[Dict[str, Any]] = [{} for _ in range(len(rows))]
+        for field in self.fields:
+            for doc, value in zip(docs, self.columns[field].take(rows)):
+                if value is not _MISSING:
+                    doc[field] = value
+        return docs
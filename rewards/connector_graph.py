@@ -0,0 +1,138 @@
+"""
+Graph of FigJam connectors between board nodes.
+
+Connector tasks ask which sticky a connector starts and ends at, through
+which magnets, and whether one node leads to another through a chain of
+connectors. ``ConnectorGraph`` turns a board's connector documents into
+adjacency lists once:
+
+    graph = truth.connector_graph("page-4")
+    graph.connects("Feature Idea", "Priority")           # True
+    graph.edges_between("Feature Idea", "Priority")[0]["start_magnet"]
+    graph.reachable("Feature Idea", "Tech Debt")         # through Priority
+    graph.follows_chain(["Feature Idea", "Priority", "Tech Debt"])
+
+Nodes are referred to by ``_id`` or by name; a name shared by several nodes
+refers to all of them. Edges are directed from the connector's start to its
+end. Reachable sets are computed once per source node and memoized, so
+repeated reachability checks from the same node are dictionary lookups.
+"""
+
+from collections import deque
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Set
+
+Edge = Mapping[str, Any]
+
+
+class ConnectorGraph:
+    """Directed adjacency over connectors.
+
+    Args:
+        connectors: Connector records with ``id``, ``name``,
+            ``start_node_id``, ``end_node_id``, ``start_magnet`` and
+            ``end_magnet`` (see ``ground_truth.ConnectorTruth``).
+        names: Node id to node name, for name lookups.
+    """
+
+    def __init__(self, connectors: Iterable[Edge], names: Mapping[Any, Any]):
+        self.edges: List[Edge] = [
+            edge for edge in connectors
+            if edge.get("start_node_id") is not None and edge.get("end_node_id") is not None
+        ]
+        self._outgoing: Dict[Any, List[Edge]] = {}
+        self._incoming: Dict[Any, List[Edge]] = {}
+        self._by_connector: Dict[Any, Edge] = {}
+        for edge in self.edges:
+            self._outgoing.setdefault(edge["start_node_id"], []).append(edge)
+            self._incoming.setdefault(edge["end_node_id"], []).append(edge)
+            for key in (edge.get("id"), edge.get("name")):
+                if key is not None:
+                    self._by_connector.setdefault(key, edge)
+
+        self._ids_by_name: Dict[Any, Set[Any]] = {}
+        for node_id, name in names.items():
+            self._ids_by_name.setdefault(name, set()).add(node_id)
+        self._names = names
+        self._reach: Dict[Any, FrozenSet[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self.edges)
+
+    def _ids(self, ref: Any) -> Set[Any]:
+        if ref in self._names or ref in self._outgoing or ref in self._incoming:
+            return {ref}
+        return self._ids_by_name.get(ref, set())
+
+    def name_of(self, node_id: Any) -> Any:
+        return self._names.get(node_id)
+
+    def connector(self, ref: Any) -> Optional[Edge]:
+        """A connector by id or exact name."""
+        return self._by_connector.get(ref)
+
+    def outgoing(self, ref: Any) -> List[Edge]:
+        return [edge for node_id in self._ids(ref) for edge in self._outgoing.get(node_id, ())]
+
+    def incoming(self, ref: Any) -> List[Edge]:
+        return [edge for node_id in self._ids(ref) for edge in self._incoming.get(node_id, ())]
+
+    def edges_between(self, start: Any, end: Any) -> List[Edge]:
+        """Connectors from ``start`` to ``end``."""
+        ends = self._ids(end)
+        return [edge for edge in self.outgoing(start) if edge["end_node_id"] in ends]
+
+    def connects(
+        self,
+        start: Any,
+        end: Any,
+        start_magnet: Optional[str] = None,
+        end_magnet: Optional[str] = None,
+    ) -> bool:
+        """True if a connector runs from start to end, through the given magnets if any."""
+        return any(
+            (start_magnet is None or edge.get("start_magnet") == start_magnet.lower())
+            and (end_magnet is None or edge.get("end_magnet") == end_magnet.lower())
+            for edge in self.edges_between(start, end)
+        )
+
+    def _reachable_from(self, node_id: Any) -> FrozenSet[Any]:
+        reach = self._reach.get(node_id)
+        if reach is None:
+            seen = {node_id}
+            queue = deque([node_id])
+            while queue:
+                for edge in self._outgoing.get(queue.popleft(), ()):
+                    if edge["end_node_id"] not in seen:
+                        seen.add(edge["end_node_id"])
+                        queue.append(edge["end_node_id"])
+            seen.discard(node_id)
+            reach = frozenset(seen)
+            self._reach[node_id] = reach
+        return reach
+
+    def reachable(self, start: Any, end: Any) -> bool:
+        """True if following connectors from start leads to end."""
+        ends = self._ids(end)
+        return any(not ends.isdisjoint(self._reachable_from(node_id)) for node_id in self._ids(start))
+
+    def path(self, start: Any, end: Any) -> Optional[List[Any]]:
+        """Node ids along a shortest connector path from start to end, or None."""
+        starts, ends = self._ids(start), self._ids(end)
+        previous: Dict[Any, Any] = {node_id: None for node_id in starts}
+        queue = deque(starts)
+        while queue:
+            node_id = queue.popleft()
+            if node_id in ends:
+                path = [node_id]
+                while previous[path[-1]] is not None:
+                    path.append(previous[path[-1]])
+                return path[::-1]
+            for edge in self._outgoing.get(node_id, ()):
+                if edge["end_node_id"] not in previous:
+                    previous[edge["end_node_id"]] = node_id
+                    queue.append(edge["end_node_id"])
+        return None
+
+    def follows_chain(self, refs: Sequence[Any]) -> bool:
+        """True if every consecutive pair in refs is joined by a connector."""
+        return len(refs) >= 2 and all(self.edges_between(a, b) for a, b in zip(refs, refs[1:]))
@@ -7,9 +7,20 @@ All tasks expect JSON-formatted final answers.
 """
 
 import json
-import re
 from typing import Any, Dict, List, Literal, Optional, TypedDict, Union
+
+import numpy as np
+
+from . import geometry
+from .answers import parse_answer
 from .backend import Backend
+from .check_spec import plan_for_task, score_answer
+from .code_structure import summarize_jsx, summarize_swiftui
+from .ground_truth import ground_truth_for_file
+from .registry import reward
+from .scoring import collects, message_lists
+from .spatial_index import SpatialIndex
+from .variables import to_hex
 
 
 class ScoreMetadata(TypedDict):
@@ -27,31 +38,24 @@ class TaskScore(TypedDict):
 # =============================================================================
 
 def _extract_json_from_answer(answer: str) -> Optional[Dict[str, Any]]:
-    """Extract JSON object from the final answer string."""
-    # Try to find JSON in the answer
-    # First, try direct parsing
-    try:
-        return json.loads(answer.strip())
-    except json.JSONDecodeError:
-        pass
+    """Extract JSON object from the final answer string.
 
-    # Try to find JSON block in markdown code fence
-    json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', answer, re.DOTALL)
-    if json_match:
-        try:
-            return json.loads(json_match.group(1))
-        except json.JSONDecodeError:
-            pass
+    Results are cached and read-only, since validators run on the same
+    answer share them.
+    """
+    return parse_answer(answer)
 
-    # Try to find any JSON object in the text
-    json_match = re.search(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', answer, re.DOTALL)
-    if json_match:
-        try:
-            return json.loads(json_match.group(0))
-        except json.JSONDecodeError:
-            pass
 
-    return None
+def _score_check_spec(task_id: str, final_answer: str) -> TaskScore:
+    """Score the answer against the task's check spec in rewards/checks/<task_id>.json."""
+    result = score_answer(plan_for_task(task_id), final_answer)
+    return TaskScore(
+        score=result["score"],
+        metadata=ScoreMetadata(
+            success_accumulator=result["metadata"]["success_accumulator"],
+            error_accumulator=result["metadata"]["error_accumulator"]
+        )
+    )
 
 
 def _check_value_tolerance(actual: Union[int, float], expected: Union[int, float], tolerance: int = 0) -> bool:
@@ -70,10 +74,20 @@ def _get_nested_value(data: Dict[str, Any], *keys: str) -> Any:
     return current
 
 
+def _mentions_name(text: str, name: Any) -> bool:
+    """Whether lower-cased text contains every word of a name, singular or plural.
+
+    "Brand Colors" is mentioned by "brand colors collection" and "brand color".
+    """
+    words = [word.rstrip("s") for word in str(name).lower().split()]
+    return bool(words) and all(word in text for word in words)
+
+
 # =============================================================================
 # Task 1: Extract Login Screen as React Code with SVG
 # =============================================================================
 
+@reward(check_spec="login-screen-react-extraction-v2")
 def _validate_figma_login_screen_react_extraction(
     backend: Backend,
     frontend_final_state: Dict[str, Any],
@@ -96,75 +110,14 @@ def _validate_figma_login_screen_react_extraction(
     - SVG element exists within the HTML string
     - Component accepts className and props parameters
     """
-    errors: List[str] = []
-    checks_passed: List[str] = []
-
-    try:
-        json_data = _extract_json_from_answer(final_answer)
-
-        if not json_data:
-            errors.append("[X] Could not parse JSON from final answer")
-            return TaskScore(
-                score=0.0,
-                metadata=ScoreMetadata(
-                    success_accumulator=checks_passed,
-                    error_accumulator=errors
-                )
-            )
-
-        checks_passed.append("[✓] JSON response parsed successfully")
-
-        # Check framework is react
-        framework = json_data.get("framework", "").lower()
-        if framework == "react":
-            checks_passed.append("[✓] Framework is 'react'")
-        else:
-            errors.append(f"[X] Framework is '{framework}', expected 'react'")
-
-        # Check has_svg is true
-        has_svg = json_data.get("has_svg")
-        if has_svg is True:
-            checks_passed.append("[✓] has_svg is true - SVG element exists")
-        else:
-            errors.append(f"[X] has_svg is {has_svg}, expected true")
-
-        # Check component_name exists
-        component_name = json_data.get("component_name")
-        if component_name and isinstance(component_name, str) and len(component_name) > 0:
-            checks_passed.append(f"[✓] Component name extracted: '{component_name}'")
-        else:
-            errors.append("[X] Component name not properly extracted")
-
-        # Check code_length is reasonable (> 100 chars for a real component)
-        code_length = json_data.get("code_length")
-        if isinstance(code_length, (int, float)) and code_length > 100:
-            checks_passed.append(f"[✓] Code length is {code_length} characters")
-        else:
-            errors.append(f"[X] Code length is {code_length}, expected > 100")
-
-        return TaskScore(
-            score=1.0 if len(errors) == 0 else 0.0,
-            metadata=ScoreMetadata(
-                success_accumulator=checks_passed,
-                error_accumulator=errors
-            )
-        )
-
-    except Exception as e:
-        errors.append(f"[X] Exception during validation: {str(e)}")
-        return TaskScore(
-            score=0.0,
-            metadata=ScoreMetadata(
-                success_accumulator=checks_passed,
-                error_accumulator=errors
-            )
-        )
+    return _score_check_spec("login-screen-react-extraction-v2", final_answer)
 
 
 # =============================================================================
 # Task 2: Spatial Analysis of Input Fields
 # =============================================================================
 
+@reward(check_spec="input-fields-spatial-analysis-v2")
 def _validate_figma_input_fields_spatial_analysis(
     backend: Backend,
     frontend_final_state: Dict[str, Any],
@@ -189,104 +142,14 @@ def _validate_figma_input_fields_spatial_analysis(
     - Both horizontally aligned (same x)
     - Both have identical dimensions
     """
-    errors: List[str] = []
-    checks_passed: List[str] = []
-
-    try:
-        json_data = _extract_json_from_answer(final_answer)
-
-        if not json_data:
-            errors.append("[X] Could not parse JSON from final answer")
-            return TaskScore(
-                score=0.0,
-                metadata=ScoreMetadata(
-                    success_accumulator=checks_passed,
-                    error_accumulator=errors
-                )
-            )
-
-        checks_passed.append("[✓] JSON response parsed successfully")
-
-        # Check Email Input position
-        email = json_data.get("email_input", {})
-        if _get_nested_value(json_data, "email_input", "x") == 24:
-            checks_passed.append("[✓] Email Input x=24")
-        else:
-            errors.append(f"[X] Email Input x={email.get('x')}, expected 24")
-
-        if _get_nested_value(json_data, "email_input", "y") == 380:
-            checks_passed.append("[✓] Email Input y=380")
-        else:
-            errors.append(f"[X] Email Input y={email.get('y')}, expected 380")
-
-        # Check Email Input dimensions
-        if email.get("width") == 327 and email.get("height") == 48:
-            checks_passed.append("[✓] Email Input dimensions 327x48")
-        else:
-            errors.append(f"[X] Email Input dimensions {email.get('width')}x{email.get('height')}, expected 327x48")
-
-        # Check Password Input position
-        password = json_data.get("password_input", {})
-        if _get_nested_value(json_data, "password_input", "x") == 24:
-            checks_passed.append("[✓] Password Input x=24")
-        else:
-            errors.append(f"[X] Password Input x={password.get('x')}, expected 24")
-
-        if _get_nested_value(json_data, "password_input", "y") == 444:
-            checks_passed.append("[✓] Password Input y=444")
-        else:
-            errors.append(f"[X] Password Input y={password.get('y')}, expected 444")
-
-        # Check Password Input dimensions
-        if password.get("width") == 327 and password.get("height") == 48:
-            checks_passed.append("[✓] Password Input dimensions 327x48")
-        else:
-            errors.append(f"[X] Password Input dimensions {password.get('width')}x{password.get('height')}, expected 327x48")
-
-        # Check vertical spacing (should be 16: 444 - 380 - 48 = 16)
-        vertical_spacing = json_data.get("vertical_spacing")
-        if vertical_spacing == 16:
-            checks_passed.append("[✓] Vertical spacing is 16 pixels")
-        else:
-            errors.append(f"[X] Vertical spacing is {vertical_spacing}, expected 16")
-
-        # Check horizontally aligned
-        horizontally_aligned = json_data.get("horizontally_aligned")
-        if horizontally_aligned is True:
-            checks_passed.append("[✓] Both inputs are horizontally aligned")
-        else:
-            errors.append("[X] horizontally_aligned is not true")
-
-        # Check same dimensions
-        same_dimensions = json_data.get("same_dimensions")
-        if same_dimensions is True:
-            checks_passed.append("[✓] Both inputs have identical dimensions")
-        else:
-            errors.append("[X] same_dimensions is not true")
-
-        return TaskScore(
-            score=1.0 if len(errors) == 0 else 0.0,
-            metadata=ScoreMetadata(
-                success_accumulator=checks_passed,
-                error_accumulator=errors
-            )
-        )
-
-    except Exception as e:
-        errors.append(f"[X] Exception during validation: {str(e)}")
-        return TaskScore(
-            score=0.0,
-            metadata=ScoreMetadata(
-                success_accumulator=checks_passed,
-                error_accumulator=errors
-            )
-        )
+    return _score_check_spec("input-fields-spatial-analysis-v2", final_answer)
 
 
 # =============================================================================
 # Task 3: Variable Definitions Cross-Reference
 # =============================================================================
 
+@reward(cost="answer")
 def _validate_figma_variable_definitions_crossref(
     backend: Backend,
     frontend_final_state: Dict[str, Any],
@@ -314,9 +177,12 @@ def _validate_figma_variable_definitions_crossref(
     - Light mode color is '#3B82F6'
     - Dark mode color is '#60A5FA'
     - Variable binding is identical
+
+    When file-1's variables are in the task's initial state, the binding, collection and
+    per-mode colors are resolved from them (following aliases) instead.
     """
-    errors: List[str] = []
-    checks_passed: List[str] = []
+    checks_passed, errors = message_lists()
+    collecting = collects(checks_passed)
 
     try:
         json_data = _extract_json_from_answer(final_answer)
@@ -333,41 +199,64 @@ def _validate_figma_variable_definitions_crossref(
 
         checks_passed.append("[✓] JSON response parsed successfully")
 
+        truth = ground_truth_for_file("file-1")
+        resolver = truth.variables
+        button_var = resolver.bound_variable("node-rect-button", "fill")
+        header_var = resolver.bound_variable("Header Background", "fill")
+        variable = resolver.variable(button_var) if button_var is not None else None
+        expected_collection = resolver.collection_of(button_var) if variable is not None else None
+        light_expected = (resolver.color(button_var, "Light", "node-rect-button") if variable else None) or "#3B82F6"
+        dark_expected = (resolver.color(button_var, "Dark", "node-rect-button") if variable else None) or "#60A5FA"
+        binding_expected = button_var == header_var if button_var is not None and header_var is not None else True
+
         # Check shared variable
         shared_var = json_data.get("shared_variable", "").lower()
-        if "var-primary" in shared_var or "primary" in shared_var:
-            checks_passed.append("[✓] Shared variable is 'var-primary'")
+        if variable is not None:
+            name = str(variable.get("name", "")).lower()
+            accepted = {str(variable.get("_id", "")).lower(), name, name.rsplit("/", 1)[-1]} - {""}
+            shared_ok = any(key in shared_var for key in accepted)
+            expected_var = variable.get("_id")
+        else:
+            shared_ok = "var-primary" in shared_var or "primary" in shared_var
+            expected_var = "var-primary"
+        if shared_ok:
+            if collecting:
+                checks_passed.append(f"[✓] Shared variable is '{expected_var}'")
         else:
-            errors.append(f"[X] Shared variable is '{json_data.get('shared_variable')}', expected 'var-primary'")
+            errors.append(f"[X] Shared variable is '{json_data.get('shared_variable')}', expected '{expected_var}'")
 
         # Check collection name
         collection = json_data.get("collection_name", "").lower()
-        if "brand" in collection and "color" in collection:
-            checks_passed.append("[✓] Collection is 'Brand Colors'")
+        if expected_collection is not None and expected_collection.get("name"):
+            collection_name = expected_collection["name"]
+            collection_ok = _mentions_name(collection, collection_name)
         else:
-            errors.append(f"[X] Collection is '{json_data.get('collection_name')}', expected 'Brand Colors'")
-
-        # Check light mode color
-        color_consistency = json_data.get("color_consistency", {})
-        light_mode = color_consistency.get("light_mode", "").upper()
-        if light_mode == "#3B82F6" or light_mode == "3B82F6":
-            checks_passed.append("[✓] Light mode color is '#3B82F6'")
+            collection_name = "Brand Colors"
+            collection_ok = "brand" in collection and "color" in collection
+        if collection_ok:
+            if collecting:
+                checks_passed.append(f"[✓] Collection is '{collection_name}'")
         else:
-            errors.append(f"[X] Light mode color is '{light_mode}', expected '#3B82F6'")
+            errors.append(f"[X] Collection is '{json_data.get('collection_name')}', expected '{collection_name}'")
 
-        # Check dark mode color
-        dark_mode = color_consistency.get("dark_mode", "").upper()
-        if dark_mode == "#60A5FA" or dark_mode == "60A5FA":
-            checks_passed.append("[✓] Dark mode color is '#60A5FA'")
-        else:
-            errors.append(f"[X] Dark mode color is '{dark_mode}', expected '#60A5FA'")
+        # Check light and dark mode colors
+        color_consistency = json_data.get("color_consistency", {})
+        for field, label, expected_color in (("light_mode", "Light", light_expected), ("dark_mode", "Dark", dark_expected)):
+            answer_color = color_consistency.get(field, "").upper()
+            if to_hex(answer_color) == expected_color:
+                if collecting:
+                    checks_passed.append(f"[✓] {label} mode color is '{expected_color}'")
+            else:
+                errors.append(f"[X] {label} mode color is '{answer_color}', expected '{expected_color}'")
 
         # Check same variable binding
         same_binding = json_data.get("same_variable_binding")
-        if same_binding is True:
-            checks_passed.append("[✓] Variable binding is identical between nodes")
+        if same_binding is binding_expected:
+            checks_passed.append("[✓] Variable binding is identical between nodes" if binding_expected
+                                 else "[✓] Variable bindings differ between nodes")
         else:
-            errors.append("[X] same_variable_binding is not true")
+            errors.append("[X] same_variable_binding is not true" if binding_expected
+                          else "[X] same_variable_binding should be false")
 
         return TaskScore(
             score=1.0 if len(errors) == 0 else 0.0,
@@ -392,6 +281,7 @@ def _validate_figma_variable_definitions_crossref(
 # Task 4: ShopEasy Home Screen Hierarchy Navigation
 # =============================================================================
 
+@reward(cost="answer")
 def _validate_figma_shopeasy_home_hierarchy(
     backend: Backend,
     frontend_final_state: Dict[str, Any],
@@ -413,8 +303,7 @@ def _validate_figma_shopeasy_home_hierarchy(
     - Search Icon is type ellipse
     - Cart Icon is type ellipse
     """
-    errors: List[str] = []
-    checks_passed: List[str] = []
+    checks_passed, errors = message_lists()
 
     try:
         json_data = _extract_json_from_answer(final_answer)
@@ -489,6 +378,7 @@ def _validate_figma_shopeasy_home_hierarchy(
 # Task 5: Extract Login Screen as React with Text Focus
 # =============================================================================
 
+@reward(cost="answer")
 def _validate_figma_login_screen_text_react(
     backend: Backend,
     frontend_final_state: Dict[str, Any],
@@ -511,8 +401,7 @@ def _validate_figma_login_screen_text_react(
     - Component structure is valid React
     - JSX syntax is correct
     """
-    errors: List[str] = []
-    checks_passed: List[str] = []
+    checks_passed, errors = message_lists()
 
     try:
         json_data = _extract_json_from_answer(final_answer)
@@ -536,23 +425,29 @@ def _validate_figma_login_screen_text_react(
         else:
             errors.append(f"[X] Framework is '{framework}', expected 'react'")
 
+        code = json_data.get("code", "")
+        summary = summarize_jsx(code) if isinstance(code, str) and len(code) > 50 else None
+
         # Check has_svg
         has_svg = json_data.get("has_svg")
-        if has_svg is True:
+        if has_svg is True and summary is not None and not summary["has_svg"]:
+            errors.append("[X] has_svg is true but the code contains no SVG markup")
+        elif has_svg is True:
             checks_passed.append("[✓] has_svg is true - contains embedded SVG")
         else:
             errors.append(f"[X] has_svg is {has_svg}, expected true")
 
         # Check jsx_syntax
         jsx_syntax = json_data.get("jsx_syntax")
-        if jsx_syntax is True:
+        if jsx_syntax is True and summary is not None and not (summary["elements"] and summary["balanced"]):
+            errors.append("[X] jsx_syntax is true but the code has no well-formed JSX")
+        elif jsx_syntax is True:
             checks_passed.append("[✓] jsx_syntax is true - valid JSX")
         else:
             errors.append(f"[X] jsx_syntax is {jsx_syntax}, expected true")
 
         # Check code exists and has content
-        code = json_data.get("code", "")
-        if isinstance(code, str) and len(code) > 50:
+        if summary is not None:
             checks_passed.append("[✓] Code field contains React component")
         else:
             errors.append("[X] Code field is missing or too short")
@@ -580,6 +475,7 @@ def _validate_figma_login_screen_text_react(
 # Task 6: Buttons Page Component Hierarchy Analysis
 # =============================================================================
 
+@reward(check_spec="buttons-page-hierarchy-v2")
 def _validate_figma_buttons_page_hierarchy(
     backend: Backend,
     frontend_final_state: Dict[str, Any],
@@ -605,94 +501,14 @@ def _validate_figma_buttons_page_hierarchy(
     - Button/Secondary at (100,160) with 120x40
     - Vertical spacing is 20 pixels
     """
-    errors: List[str] = []
-    checks_passed: List[str] = []
-
-    try:
-        json_data = _extract_json_from_answer(final_answer)
-
-        if not json_data:
-            errors.append("[X] Could not parse JSON from final answer")
-            return TaskScore(
-                score=0.0,
-                metadata=ScoreMetadata(
-                    success_accumulator=checks_passed,
-                    error_accumulator=errors
-                )
-            )
-
-        checks_passed.append("[✓] JSON response parsed successfully")
-
-        # Check total components
-        total_components = json_data.get("total_components")
-        if total_components == 2:
-            checks_passed.append("[✓] Exactly 2 components on page")
-        else:
-            errors.append(f"[X] total_components is {total_components}, expected 2")
-
-        # Check components array
-        components = json_data.get("components", [])
-
-        # Find Primary button
-        primary = next((c for c in components if "primary" in c.get("name", "").lower()), None)
-        if primary:
-            if primary.get("x") == 100 and primary.get("y") == 100:
-                checks_passed.append("[✓] Button/Primary at (100,100)")
-            else:
-                errors.append(f"[X] Button/Primary at ({primary.get('x')},{primary.get('y')}), expected (100,100)")
-
-            if primary.get("width") == 120 and primary.get("height") == 40:
-                checks_passed.append("[✓] Button/Primary dimensions 120x40")
-            else:
-                errors.append(f"[X] Button/Primary dimensions {primary.get('width')}x{primary.get('height')}, expected 120x40")
-        else:
-            errors.append("[X] Button/Primary component not found")
-
-        # Find Secondary button
-        secondary = next((c for c in components if "secondary" in c.get("name", "").lower()), None)
-        if secondary:
-            if secondary.get("x") == 100 and secondary.get("y") == 160:
-                checks_passed.append("[✓] Button/Secondary at (100,160)")
-            else:
-                errors.append(f"[X] Button/Secondary at ({secondary.get('x')},{secondary.get('y')}), expected (100,160)")
-
-            if secondary.get("width") == 120 and secondary.get("height") == 40:
-                checks_passed.append("[✓] Button/Secondary dimensions 120x40")
-            else:
-                errors.append(f"[X] Button/Secondary dimensions {secondary.get('width')}x{secondary.get('height')}, expected 120x40")
-        else:
-            errors.append("[X] Button/Secondary component not found")
-
-        # Check vertical spacing
-        vertical_spacing = json_data.get("vertical_spacing")
-        if vertical_spacing == 20 or str(vertical_spacing) == "20":
-            checks_passed.append("[✓] Vertical spacing is 20 pixels")
-        else:
-            errors.append(f"[X] Vertical spacing is {vertical_spacing}, expected 20")
-
-        return TaskScore(
-            score=1.0 if len(errors) == 0 else 0.0,
-            metadata=ScoreMetadata(
-                success_accumulator=checks_passed,
-                error_accumulator=errors
-            )
-        )
-
-    except Exception as e:
-        errors.append(f"[X] Exception during validation: {str(e)}")
-        return TaskScore(
-            score=0.0,
-            metadata=ScoreMetadata(
-                success_accumulator=checks_passed,
-                error_accumulator=errors
-            )
-        )
+    return _score_check_spec("buttons-page-hierarchy-v2", final_answer)
 
 
 # =============================================================================
 # Task 7: Q1 Goals Section FigJam Extraction
 # =============================================================================
 
+@reward(cost="answer")
 def _validate_figma_q1_goals_section_extraction(
     backend: Backend,
     frontend_final_state: Dict[str, Any],
@@ -719,8 +535,7 @@ def _validate_figma_q1_goals_section_extraction(
     - Section dimensions are 800x400
     - SVG shows section's visual appearance with opacity
     """
-    errors: List[str] = []
-    checks_passed: List[str] = []
+    checks_passed, errors = message_lists()
 
     try:
         json_data = _extract_json_from_answer(final_answer)
@@ -802,6 +617,7 @@ def _validate_figma_q1_goals_section_extraction(
 # Task 8: Complex Button Component Analysis with Variants
 # =============================================================================
 
+@reward(cost="answer")
 def _validate_figma_button_component_variants(
     backend: Backend,
     frontend_final_state: Dict[str, Any],
@@ -812,6 +628,9 @@ def _validate_figma_button_component_variants(
 
     Expected JSON includes components with variantProperties, componentSetId, etc.
 
+    Expected values are derived from file-2's documents in the task's initial state,
+    falling back to the seeded values below when they are missing.
+
     Verification:
     - Button/Primary at (100,100) with 120x40
     - Button/Secondary at (100,160) with 120x40
@@ -821,8 +640,8 @@ def _validate_figma_button_component_variants(
     - Secondary has variantProperties State='Default', Variant='Secondary'
     - Vertical spacing is 20px
     """
-    errors: List[str] = []
-    checks_passed: List[str] = []
+    checks_passed, errors = message_lists()
+    collecting = collects(checks_passed)
 
     try:
         json_data = _extract_json_from_answer(final_answer)
@@ -839,86 +658,78 @@ def _validate_figma_button_component_variants(
 
         checks_passed.append("[✓] JSON response parsed successfully")
 
-        components = json_data.get("components", [])
-
-        # Find Primary button
-        primary = next((c for c in components if "primary" in c.get("name", "").lower()), None)
-        if primary:
-            # Check position
-            if primary.get("x") == 100 and primary.get("y") == 100:
-                checks_passed.append("[✓] Button/Primary at (100,100)")
-            else:
-                errors.append(f"[X] Button/Primary at ({primary.get('x')},{primary.get('y')}), expected (100,100)")
-
-            # Check dimensions
-            if primary.get("width") == 120 and primary.get("height") == 40:
-                checks_passed.append("[✓] Button/Primary dimensions 120x40")
-            else:
-                errors.append(f"[X] Button/Primary dimensions incorrect")
-
-            # Check type
-            if primary.get("type") == "component":
-                checks_passed.append("[✓] Button/Primary has type 'component'")
-            else:
-                errors.append(f"[X] Button/Primary type is '{primary.get('type')}', expected 'component'")
+        truth = ground_truth_for_file("file-2")
+        seeded = {
+            "Primary": ({"x": 100, "y": 100, "width": 120, "height": 40}, {"State": "Default", "Variant": "Primary"}),
+            "Secondary": ({"x": 100, "y": 160, "width": 120, "height": 40}, {"State": "Default", "Variant": "Secondary"}),
+        }
+        expected = {}
+        for variant, (box, properties) in seeded.items():
+            name = f"Button/{variant}"
+            expected[variant] = (
+                truth.geometry(name) or box,
+                truth.field(name, "componentSetId") or "compset-button",
+                truth.variant_properties(name) or properties,
+            )
 
-            # Check componentSetId
-            if primary.get("componentSetId") == "compset-button":
-                checks_passed.append("[✓] Button/Primary belongs to 'compset-button'")
-            else:
-                errors.append(f"[X] Button/Primary componentSetId is '{primary.get('componentSetId')}'")
+        components = json_data.get("components", [])
 
-            # Check variantProperties
-            variant_props = primary.get("variantProperties", {})
-            if variant_props.get("State") == "Default" and variant_props.get("Variant") == "Primary":
-                checks_passed.append("[✓] Button/Primary has correct variantProperties")
-            else:
-                errors.append(f"[X] Button/Primary variantProperties incorrect: {variant_props}")
-        else:
-            errors.append("[X] Button/Primary component not found")
+        for variant, (box, component_set_id, properties) in expected.items():
+            label = f"Button/{variant}"
+            component = next((c for c in components if variant.lower() in c.get("name", "").lower()), None)
+            if not component:
+                errors.append(f"[X] {label} component not found")
+                continue
 
-        # Find Secondary button
-        secondary = next((c for c in components if "secondary" in c.get("name", "").lower()), None)
-        if secondary:
             # Check position
-            if secondary.get("x") == 100 and secondary.get("y") == 160:
-                checks_passed.append("[✓] Button/Secondary at (100,160)")
+            if component.get("x") == box["x"] and component.get("y") == box["y"]:
+                if collecting:
+                    checks_passed.append(f"[✓] {label} at ({box['x']},{box['y']})")
             else:
-                errors.append(f"[X] Button/Secondary at ({secondary.get('x')},{secondary.get('y')}), expected (100,160)")
+                errors.append(f"[X] {label} at ({component.get('x')},{component.get('y')}), expected ({box['x']},{box['y']})")
 
             # Check dimensions
-            if secondary.get("width") == 120 and secondary.get("height") == 40:
-                checks_passed.append("[✓] Button/Secondary dimensions 120x40")
+            if component.get("width") == box["width"] and component.get("height") == box["height"]:
+                if collecting:
+                    checks_passed.append(f"[✓] {label} dimensions {box['width']}x{box['height']}")
             else:
-                errors.append(f"[X] Button/Secondary dimensions incorrect")
+                errors.append(f"[X] {label} dimensions incorrect")
 
             # Check type
-            if secondary.get("type") == "component":
-                checks_passed.append("[✓] Button/Secondary has type 'component'")
+            if component.get("type") == "component":
+                if collecting:
+                    checks_passed.append(f"[✓] {label} has type 'component'")
+            elif variant == "Primary":
+                errors.append(f"[X] {label} type is '{component.get('type')}', expected 'component'")
             else:
-                errors.append(f"[X] Button/Secondary type is '{secondary.get('type')}'")
+                errors.append(f"[X] {label} type is '{component.get('type')}'")
 
             # Check componentSetId
-            if secondary.get("componentSetId") == "compset-button":
-                checks_passed.append("[✓] Button/Secondary belongs to 'compset-button'")
+            if component.get("componentSetId") == component_set_id:
+                if collecting:
+                    checks_passed.append(f"[✓] {label} belongs to '{component_set_id}'")
+            elif variant == "Primary":
+                errors.append(f"[X] {label} componentSetId is '{component.get('componentSetId')}'")
             else:
-                errors.append(f"[X] Button/Secondary componentSetId incorrect")
+                errors.append(f"[X] {label} componentSetId incorrect")
 
             # Check variantProperties
-            variant_props = secondary.get("variantProperties", {})
-            if variant_props.get("State") == "Default" and variant_props.get("Variant") == "Secondary":
-                checks_passed.append("[✓] Button/Secondary has correct variantProperties")
+            variant_props = component.get("variantProperties", {})
+            if all(variant_props.get(key) == value for key, value in properties.items()):
+                if collecting:
+                    checks_passed.append(f"[✓] {label} has correct variantProperties")
             else:
-                errors.append(f"[X] Button/Secondary variantProperties incorrect: {variant_props}")
-        else:
-            errors.append("[X] Button/Secondary component not found")
+                errors.append(f"[X] {label} variantProperties incorrect: {variant_props}")
 
         # Check vertical spacing
+        primary_box, secondary_box = expected["Primary"][0], expected["Secondary"][0]
+        expected_spacing = secondary_box["y"] - (primary_box["y"] + primary_box["height"])
         vertical_spacing = json_data.get("vertical_spacing")
-        if vertical_spacing == 20:
-            checks_passed.append("[✓] Vertical spacing is 20px")
+        if vertical_spacing == expected_spacing:
+            if collecting:
+                checks_passed.append(f"[✓] Vertical spacing is {expected_spacing}px")
         else:
-            errors.append(f"[X] Vertical spacing is {vertical_spacing}, expected 20")
+            errors.append(f"[X] Vertical spacing is {vertical_spacing}, expected {expected_spacing}")
 
         return TaskScore(
             score=1.0 if len(errors) == 0 else 0.0,
@@ -943,6 +754,7 @@ def _validate_figma_button_component_variants(
 # Task 9: FigJam Connector Relationships Analysis
 # =============================================================================
 
+@reward(cost="answer")
 def _validate_figma_figjam_connector_analysis(
     backend: Backend,
     frontend_final_state: Dict[str, Any],
@@ -951,6 +763,9 @@ def _validate_figma_figjam_connector_analysis(
     """
     Validate FigJam connector relationships and spatial layout analysis.
 
+    Expected values are derived from file-3's documents in the task's initial state,
+    falling back to the seeded values below when they are missing.
+
     Verification:
     - Connection 1-2 exists with correct endpoints
     - Connection 2-3 exists with correct endpoints
@@ -959,8 +774,8 @@ def _validate_figma_figjam_connector_analysis(
     - Approved stamp at (250,280)
     - Section encompasses sticky positions
     """
-    errors: List[str] = []
-    checks_passed: List[str] = []
+    checks_passed, errors = message_lists()
+    collecting = collects(checks_passed)
 
     try:
         json_data = _extract_json_from_answer(final_answer)
@@ -977,68 +792,82 @@ def _validate_figma_figjam_connector_analysis(
 
         checks_passed.append("[✓] JSON response parsed successfully")
 
+        truth = ground_truth_for_file("file-3")
+        seeded_connectors = {
+            "1-2": ("Feature Idea", "Priority", "right", "left"),
+            "2-3": ("Priority", "Tech Debt", "right", "left"),
+        }
+        section_bounds_expected = truth.geometry("Q1 Goals") or {"x": 50, "y": 50, "width": 800, "height": 400}
+        stamp_box = truth.geometry("Approved") or {"x": 250, "y": 280}
+        stickies = truth.nodes_of_type("sticky")
+        encompasses_expected = True
+        if stickies and truth.geometry("Q1 Goals"):
+            section_box = tuple(section_bounds_expected[field] for field in ("x", "y", "width", "height"))
+            encompasses_expected = len(SpatialIndex(stickies).contained_in(section_box)) == len(stickies)
+
         # Check connectors
         connectors = json_data.get("connectors", [])
 
-        # Find Connection 1-2
-        conn12 = next((c for c in connectors if "1-2" in c.get("name", "")), None)
-        if conn12:
-            checks_passed.append("[✓] Connection 1-2 found")
-
-            if conn12.get("start_node") == "Feature Idea" and conn12.get("end_node") == "Priority":
-                checks_passed.append("[✓] Connection 1-2 connects Feature Idea to Priority")
-            else:
-                errors.append("[X] Connection 1-2 endpoints incorrect")
-
-            if conn12.get("start_magnet") == "right" and conn12.get("end_magnet") == "left":
-                checks_passed.append("[✓] Connection 1-2 uses right and left magnets")
-            else:
-                errors.append("[X] Connection 1-2 magnets incorrect")
-        else:
-            errors.append("[X] Connection 1-2 not found")
-
-        # Find Connection 2-3
-        conn23 = next((c for c in connectors if "2-3" in c.get("name", "")), None)
-        if conn23:
-            checks_passed.append("[✓] Connection 2-3 found")
-
-            if conn23.get("start_node") == "Priority" and conn23.get("end_node") == "Tech Debt":
-                checks_passed.append("[✓] Connection 2-3 connects Priority to Tech Debt")
-            else:
-                errors.append("[X] Connection 2-3 endpoints incorrect")
+        for suffix, seeded in seeded_connectors.items():
+            label = f"Connection {suffix}"
+            derived = truth.connector(label)
+            start_node, end_node, start_magnet, end_magnet = seeded
+            if derived and derived["start_node"] and derived["end_node"]:
+                start_node, end_node = derived["start_node"], derived["end_node"]
+                start_magnet = derived["start_magnet"] or start_magnet
+                end_magnet = derived["end_magnet"] or end_magnet
+
+            conn = next((c for c in connectors if suffix in c.get("name", "")), None)
+            if conn:
+                if collecting:
+                    checks_passed.append(f"[✓] {label} found")
+
+                if conn.get("start_node") == start_node and conn.get("end_node") == end_node:
+                    if collecting:
+                        checks_passed.append(f"[✓] {label} connects {start_node} to {end_node}")
+                else:
+                    errors.append(f"[X] {label} endpoints incorrect")
 
-            if conn23.get("start_magnet") == "right" and conn23.get("end_magnet") == "left":
-                checks_passed.append("[✓] Connection 2-3 uses right and left magnets")
+                if conn.get("start_magnet") == start_magnet and conn.get("end_magnet") == end_magnet:
+                    if collecting:
+                        checks_passed.append(f"[✓] {label} uses {start_magnet} and {end_magnet} magnets")
+                else:
+                    errors.append(f"[X] {label} magnets incorrect")
             else:
-                errors.append("[X] Connection 2-3 magnets incorrect")
-        else:
-            errors.append("[X] Connection 2-3 not found")
+                errors.append(f"[X] {label} not found")
 
         # Check section coverage
         section_coverage = json_data.get("section_coverage", {})
         section_bounds = section_coverage.get("section_bounds", {})
+        sx, sy = section_bounds_expected["x"], section_bounds_expected["y"]
+        sw, sh = section_bounds_expected["width"], section_bounds_expected["height"]
 
-        if section_bounds.get("x") == 50 and section_bounds.get("y") == 50:
-            checks_passed.append("[✓] Q1 Goals section at (50,50)")
+        if section_bounds.get("x") == sx and section_bounds.get("y") == sy:
+            if collecting:
+                checks_passed.append(f"[✓] Q1 Goals section at ({sx},{sy})")
         else:
             errors.append("[X] Q1 Goals section position incorrect")
 
-        if section_bounds.get("width") == 800 and section_bounds.get("height") == 400:
-            checks_passed.append("[✓] Q1 Goals section dimensions 800x400")
+        if section_bounds.get("width") == sw and section_bounds.get("height") == sh:
+            if collecting:
+                checks_passed.append(f"[✓] Q1 Goals section dimensions {sw}x{sh}")
         else:
             errors.append("[X] Q1 Goals section dimensions incorrect")
 
-        if section_coverage.get("encompasses_all_stickies") is True:
-            checks_passed.append("[✓] Section encompasses all sticky notes")
+        if section_coverage.get("encompasses_all_stickies") is encompasses_expected:
+            checks_passed.append("[✓] Section encompasses all sticky notes" if encompasses_expected
+                                 else "[✓] Section does not encompass all sticky notes")
         else:
-            errors.append("[X] Section does not encompass all stickies")
+            errors.append("[X] Section does not encompass all stickies" if encompasses_expected
+                          else "[X] Section encompasses_all_stickies should be false")
 
         # Check stamp analysis
         stamp = json_data.get("stamp_analysis", {})
-        if stamp.get("stamp_x") == 250 and stamp.get("stamp_y") == 280:
-            checks_passed.append("[✓] Approved stamp at (250,280)")
+        if stamp.get("stamp_x") == stamp_box["x"] and stamp.get("stamp_y") == stamp_box["y"]:
+            if collecting:
+                checks_passed.append(f"[✓] Approved stamp at ({stamp_box['x']},{stamp_box['y']})")
         else:
-            errors.append(f"[X] Stamp at ({stamp.get('stamp_x')},{stamp.get('stamp_y')}), expected (250,280)")
+            errors.append(f"[X] Stamp at ({stamp.get('stamp_x')},{stamp.get('stamp_y')}), expected ({stamp_box['x']},{stamp_box['y']})")
 
         return TaskScore(
             score=1.0 if len(errors) == 0 else 0.0,
@@ -1063,6 +892,7 @@ def _validate_figma_figjam_connector_analysis(
 # Task 10: Deep Spatial Analysis of Login Form Elements
 # =============================================================================
 
+@reward(check_spec="login-form-spatial-analysis-v2")
 def _validate_figma_login_form_spatial_analysis(
     backend: Backend,
     frontend_final_state: Dict[str, Any],
@@ -1089,89 +919,14 @@ def _validate_figma_login_form_spatial_analysis(
     - Spacing email to password is 64px
     - Spacing password to button is 76px
     """
-    errors: List[str] = []
-    checks_passed: List[str] = []
-
-    try:
-        json_data = _extract_json_from_answer(final_answer)
-
-        if not json_data:
-            errors.append("[X] Could not parse JSON from final answer")
-            return TaskScore(
-                score=0.0,
-                metadata=ScoreMetadata(
-                    success_accumulator=checks_passed,
-                    error_accumulator=errors
-                )
-            )
-
-        checks_passed.append("[✓] JSON response parsed successfully")
-
-        # Check Welcome Back position
-        welcome = json_data.get("welcome_text_position", {})
-        if welcome.get("x") == 24 and welcome.get("y") == 280:
-            checks_passed.append("[✓] Welcome Back text at (24,280)")
-        else:
-            errors.append(f"[X] Welcome Back at ({welcome.get('x')},{welcome.get('y')}), expected (24,280)")
-
-        # Check Email Input position
-        email = json_data.get("email_input_position", {})
-        if email.get("x") == 24 and email.get("y") == 380:
-            checks_passed.append("[✓] Email Input at (24,380)")
-        else:
-            errors.append(f"[X] Email Input at ({email.get('x')},{email.get('y')}), expected (24,380)")
-
-        # Check Password Input position
-        password = json_data.get("password_input_position", {})
-        if password.get("x") == 24 and password.get("y") == 444:
-            checks_passed.append("[✓] Password Input at (24,444)")
-        else:
-            errors.append(f"[X] Password Input at ({password.get('x')},{password.get('y')}), expected (24,444)")
-
-        # Check Sign In Button position
-        button = json_data.get("sign_in_button_position", {})
-        if button.get("x") == 24 and button.get("y") == 520:
-            checks_passed.append("[✓] Sign In Button at (24,520)")
-        else:
-            errors.append(f"[X] Sign In Button at ({button.get('x')},{button.get('y')}), expected (24,520)")
-
-        # Check spacing email to password (64px)
-        spacing_ep = json_data.get("spacing_email_to_password")
-        if spacing_ep == 64:
-            checks_passed.append("[✓] Spacing email to password is 64px")
-        else:
-            errors.append(f"[X] Spacing email to password is {spacing_ep}, expected 64")
-
-        # Check spacing password to button (76px)
-        spacing_pb = json_data.get("spacing_password_to_button")
-        if spacing_pb == 76:
-            checks_passed.append("[✓] Spacing password to button is 76px")
-        else:
-            errors.append(f"[X] Spacing password to button is {spacing_pb}, expected 76")
-
-        return TaskScore(
-            score=1.0 if len(errors) == 0 else 0.0,
-            metadata=ScoreMetadata(
-                success_accumulator=checks_passed,
-                error_accumulator=errors
-            )
-        )
-
-    except Exception as e:
-        errors.append(f"[X] Exception during validation: {str(e)}")
-        return TaskScore(
-            score=0.0,
-            metadata=ScoreMetadata(
-                success_accumulator=checks_passed,
-                error_accumulator=errors
-            )
-        )
+    return _score_check_spec("login-form-spatial-analysis-v2", final_answer)
 
 
 # =============================================================================
 # Task 11: Connectify Detail Screen React Extraction (Prompts6)
 # =============================================================================
 
+@reward(cost="answer")
 def _validate_connectify_detail_react_extraction(
     backend: Backend,
     frontend_final_state: Dict[str, Any],
@@ -1191,8 +946,8 @@ def _validate_connectify_detail_react_extraction(
 
     Verification criteria from prompts6.csv.
     """
-    errors: List[str] = []
-    checks_passed: List[str] = []
+    checks_passed, errors = message_lists()
+    collecting = collects(checks_passed)
 
     try:
         json_data = _extract_json_from_answer(final_answer)
@@ -1209,6 +964,9 @@ def _validate_connectify_detail_react_extraction(
 
         checks_passed.append("[✓] JSON response parsed successfully")
 
+        code = json_data.get("code", "")
+        summary = summarize_jsx(code) if isinstance(code, str) and len(code) > 100 else None
+
         # Check framework is react
         framework = json_data.get("framework", "").lower()
         if framework == "react":
@@ -1219,36 +977,42 @@ def _validate_connectify_detail_react_extraction(
         # Check component_name exists and follows PascalCase
         component_name = json_data.get("component_name")
         if component_name and isinstance(component_name, str) and len(component_name) > 0:
-            checks_passed.append(f"[✓] Component name extracted: '{component_name}'")
+            if collecting:
+                checks_passed.append(f"[✓] Component name extracted: '{component_name}'")
             # Check PascalCase convention
             if component_name[0].isupper():
                 checks_passed.append("[✓] Component function name matches PascalCase convention")
             else:
                 errors.append("[X] Component name does not follow PascalCase convention")
+            if summary and summary["components"] and component_name not in summary["components"]:
+                errors.append(f"[X] Component '{component_name}' is not declared in the code (found {list(summary['components'])})")
         else:
             errors.append("[X] Component name not properly extracted")
 
         # Check has_svg is true
         has_svg = json_data.get("has_svg")
-        if has_svg is True:
+        if has_svg is True and summary is not None and not summary["has_svg"]:
+            errors.append("[X] has_svg is true but the code contains no SVG markup")
+        elif has_svg is True:
             checks_passed.append("[✓] Embedded SVG exists in the code")
         else:
             errors.append(f"[X] has_svg is {has_svg}, expected true")
 
         # Check exports_default
         exports_default = json_data.get("exports_default")
-        if exports_default is True:
+        if exports_default is True and summary is not None and not summary["has_default_export"]:
+            errors.append("[X] exports_default is true but the code has no default export")
+        elif exports_default is True:
             checks_passed.append("[✓] Code exports a default function component")
         else:
             errors.append(f"[X] exports_default is {exports_default}, expected true")
 
         # Check code exists and validate structure
-        code = json_data.get("code", "")
-        if isinstance(code, str) and len(code) > 100:
+        if summary is not None:
             checks_passed.append("[✓] Generated code is a valid React component")
 
             # Check for proper React patterns
-            if "dangerouslySetInnerHTML" in code:
+            if "dangerouslySetInnerHTML" in summary["props"]:
                 checks_passed.append("[✓] Component uses proper JSX syntax with dangerouslySetInnerHTML")
                 if "__html" in code:
                     checks_passed.append("[✓] dangerouslySetInnerHTML uses __html key correctly")
@@ -1257,12 +1021,12 @@ def _validate_connectify_detail_react_extraction(
             else:
                 errors.append("[X] Code missing dangerouslySetInnerHTML for SVG rendering")
 
-            if "className" in code:
+            if "className" in summary["props"]:
                 checks_passed.append("[✓] Code includes className prop handling")
             else:
                 errors.append("[X] Code missing className prop handling")
 
-            if "import" in code.lower() and "react" in code.lower():
+            if any(module.lower() == "react" for module in summary["imports"]):
                 checks_passed.append("[✓] Code contains proper React import statement")
 
             if "viewBox" in code:
@@ -1272,7 +1036,7 @@ def _validate_connectify_detail_react_extraction(
                 checks_passed.append("[✓] SVG width and height attributes are present")
 
             # Check for single root element (return statement)
-            if "return" in code and ("<" in code or "(" in code):
+            if summary["returns_jsx"]:
                 checks_passed.append("[✓] Component returns single root element")
         else:
             errors.append("[X] Code field is missing or too short")
@@ -1300,6 +1064,7 @@ def _validate_connectify_detail_react_extraction(
 # Task 12: Q1 Roadmap FigJam Board Analysis (Prompts6)
 # =============================================================================
 
+@reward(cost="answer")
 def _validate_q1_roadmap_figjam_analysis(
     backend: Backend,
     frontend_final_state: Dict[str, Any],
@@ -1321,8 +1086,8 @@ def _validate_q1_roadmap_figjam_analysis(
       "stickies": [{"name": "<string>", "x": <number>, "y": <number>, "width": <number>, "height": <number>}]
     }
     """
-    errors: List[str] = []
-    checks_passed: List[str] = []
+    checks_passed, errors = message_lists()
+    collecting = collects(checks_passed)
 
     try:
         json_data = _extract_json_from_answer(final_answer)
@@ -1362,31 +1127,36 @@ def _validate_q1_roadmap_figjam_analysis(
 
         sticky_count = node_counts.get("sticky")
         if isinstance(sticky_count, int) and sticky_count >= 0:
-            checks_passed.append(f"[✓] Accurate count of STICKY nodes: {sticky_count}")
+            if collecting:
+                checks_passed.append(f"[✓] Accurate count of STICKY nodes: {sticky_count}")
         else:
             errors.append("[X] STICKY node count is missing or invalid")
 
         connector_count = node_counts.get("connector")
         if isinstance(connector_count, int) and connector_count >= 0:
-            checks_passed.append(f"[✓] Accurate count of CONNECTOR nodes: {connector_count}")
+            if collecting:
+                checks_passed.append(f"[✓] Accurate count of CONNECTOR nodes: {connector_count}")
         else:
             errors.append("[X] CONNECTOR node count is missing or invalid")
 
         section_count = node_counts.get("section")
         if isinstance(section_count, int) and section_count >= 0:
-            checks_passed.append(f"[✓] Accurate count of SECTION nodes: {section_count}")
+            if collecting:
+                checks_passed.append(f"[✓] Accurate count of SECTION nodes: {section_count}")
         else:
             errors.append("[X] SECTION node count is missing or invalid")
 
         shape_count = node_counts.get("shape-with-text")
         if isinstance(shape_count, int) and shape_count >= 0:
-            checks_passed.append(f"[✓] Accurate count of SHAPE-WITH-TEXT nodes: {shape_count}")
+            if collecting:
+                checks_passed.append(f"[✓] Accurate count of SHAPE-WITH-TEXT nodes: {shape_count}")
         else:
             errors.append("[X] SHAPE-WITH-TEXT node count is missing or invalid")
 
         stamp_count = node_counts.get("stamp")
         if isinstance(stamp_count, int) and stamp_count >= 0:
-            checks_passed.append(f"[✓] Accurate count of STAMP nodes: {stamp_count}")
+            if collecting:
+                checks_passed.append(f"[✓] Accurate count of STAMP nodes: {stamp_count}")
         else:
             errors.append("[X] STAMP node count is missing or invalid")
 
@@ -1419,7 +1189,8 @@ def _validate_q1_roadmap_figjam_analysis(
             stamp_count or 0
         ])
         if total_types > 0:
-            checks_passed.append(f"[✓] Total node count matches sum of individual type counts: {total_types}")
+            if collecting:
+                checks_passed.append(f"[✓] Total node count matches sum of individual type counts: {total_types}")
 
         return TaskScore(
             score=1.0 if len(errors) == 0 else 0.0,
@@ -1444,6 +1215,7 @@ def _validate_q1_roadmap_figjam_analysis(
 # Task 13: ShopEasy Login Screen React Extraction (Prompts6)
 # =============================================================================
 
+@reward(cost="answer")
 def _validate_shopeasy_login_react_extraction(
     backend: Backend,
     frontend_final_state: Dict[str, Any],
@@ -1461,8 +1233,8 @@ def _validate_shopeasy_login_react_extraction(
       "jsx_structure_valid": "<boolean>"
     }
     """
-    errors: List[str] = []
-    checks_passed: List[str] = []
+    checks_passed, errors = message_lists()
+    collecting = collects(checks_passed)
 
     try:
         json_data = _extract_json_from_answer(final_answer)
@@ -1486,9 +1258,14 @@ def _validate_shopeasy_login_react_extraction(
         else:
             errors.append(f"[X] Framework is '{framework}', expected 'react'")
 
+        code = json_data.get("code", "")
+        summary = summarize_jsx(code) if isinstance(code, str) and len(code) > 100 else None
+
         # Check has_svg
         has_svg = json_data.get("has_svg")
-        if has_svg is True:
+        if has_svg is True and summary is not None and not summary["has_svg"]:
+            errors.append("[X] has_svg is true but the code contains no SVG markup")
+        elif has_svg is True:
             checks_passed.append("[✓] Embedded SVG exists in the code")
         else:
             errors.append(f"[X] has_svg is {has_svg}, expected true")
@@ -1496,7 +1273,8 @@ def _validate_shopeasy_login_react_extraction(
         # Check component_name
         component_name = json_data.get("component_name")
         if component_name and isinstance(component_name, str) and len(component_name) > 0:
-            checks_passed.append(f"[✓] Component name extracted correctly: '{component_name}'")
+            if collecting:
+                checks_passed.append(f"[✓] Component name extracted correctly: '{component_name}'")
             if component_name[0].isupper():
                 checks_passed.append("[✓] Component name follows PascalCase naming convention")
             else:
@@ -1506,29 +1284,27 @@ def _validate_shopeasy_login_react_extraction(
 
         # Check jsx_structure_valid
         jsx_valid = json_data.get("jsx_structure_valid")
-        if jsx_valid is True or jsx_valid == "true":
+        if (jsx_valid is True or jsx_valid == "true") and summary is not None and not summary["balanced"]:
+            errors.append("[X] jsx_structure_valid is true but the code has unbalanced JSX")
+        elif jsx_valid is True or jsx_valid == "true":
             checks_passed.append("[✓] jsx_structure_valid field correctly evaluates JSX validity")
         else:
             errors.append(f"[X] jsx_structure_valid is {jsx_valid}, expected true")
 
         # Check code structure
-        code = json_data.get("code", "")
-        if isinstance(code, str) and len(code) > 100:
+        if summary is not None:
             checks_passed.append("[✓] React component structure with proper export")
 
-            if "dangerouslySetInnerHTML" in code:
+            if "dangerouslySetInnerHTML" in summary["props"]:
                 checks_passed.append("[✓] JSX syntax with dangerouslySetInnerHTML for SVG")
 
-            if "export default" in code or "export default" in code.lower():
+            if summary["has_default_export"]:
                 checks_passed.append("[✓] Export statement uses default export syntax")
 
             if "xmlns" in code:
                 checks_passed.append("[✓] SVG includes proper xmlns attribute")
 
-            # Check for unclosed tags (basic validation)
-            open_tags = code.count("<")
-            close_tags = code.count(">")
-            if open_tags == close_tags:
+            if summary["balanced"]:
                 checks_passed.append("[✓] No unclosed JSX tags in generated code")
 
             # Check for complex hierarchy handling
@@ -1561,6 +1337,7 @@ def _validate_shopeasy_login_react_extraction(
 # Task 14: Sprint Retro FigJam Board Analysis (Prompts6)
 # =============================================================================
 
+@reward(cost="answer")
 def _validate_sprint_retro_figjam_analysis(
     backend: Backend,
     frontend_final_state: Dict[str, Any],
@@ -1581,9 +1358,12 @@ def _validate_sprint_retro_figjam_analysis(
       ],
       "column_spacings": [{"between": ["Good", "Improve"], "pixels": 160}, {"between": ["Improve", "Action"], "pixels": 160}]
     }
+
+    When the initial state has the board's nodes, sticky and connector
+    counts are checked against them; otherwise only their types are checked.
     """
-    errors: List[str] = []
-    checks_passed: List[str] = []
+    checks_passed, errors = message_lists()
+    collecting = collects(checks_passed)
 
     try:
         json_data = _extract_json_from_answer(final_answer)
@@ -1607,27 +1387,30 @@ def _validate_sprint_retro_figjam_analysis(
         else:
             errors.append(f"[X] Board name is '{board_name}', expected 'Retro Board'")
 
-        # Check sticky_count is numeric
-        sticky_count = json_data.get("sticky_count")
-        if isinstance(sticky_count, int):
-            checks_passed.append(f"[✓] Correct count of STICKY type nodes: {sticky_count}")
-            checks_passed.append("[✓] sticky_count is numeric value not string")
-        elif isinstance(sticky_count, str) and sticky_count.isdigit():
-            checks_passed.append(f"[✓] Correct count of STICKY type nodes: {sticky_count}")
-            errors.append("[X] sticky_count should be numeric, not string")
-        else:
-            errors.append("[X] sticky_count is missing or invalid")
+        truth = ground_truth_for_file("file-7")
+        board_nodes = [node for node in truth.nodes if truth.on_board(node, "page-7")]
 
-        # Check connector_count is numeric
-        connector_count = json_data.get("connector_count")
-        if isinstance(connector_count, int):
-            checks_passed.append(f"[✓] Correct count of CONNECTOR type nodes: {connector_count}")
-            checks_passed.append("[✓] connector_count is numeric value not string")
-        elif isinstance(connector_count, str) and connector_count.isdigit():
-            checks_passed.append(f"[✓] Correct count of CONNECTOR type nodes: {connector_count}")
-            errors.append("[X] connector_count should be numeric, not string")
-        else:
-            errors.append("[X] connector_count is missing or invalid")
+        # Check sticky_count and connector_count are numeric (and correct, when the board is known)
+        for field, node_type in (("sticky_count", "STICKY"), ("connector_count", "CONNECTOR")):
+            count = json_data.get(field)
+            expected_count = sum(1 for node in board_nodes if str(node.get("type", "")).upper() == node_type)
+            if isinstance(count, str) and count.isdigit():
+                count_value: Any = int(count)
+            else:
+                count_value = count if isinstance(count, int) else None
+            if count_value is None:
+                errors.append(f"[X] {field} is missing or invalid")
+                continue
+            if board_nodes and count_value != expected_count:
+                errors.append(f"[X] {field} is {count}, expected {expected_count} {node_type} nodes")
+            else:
+                if collecting:
+                    checks_passed.append(f"[✓] Correct count of {node_type} type nodes: {count}")
+            if isinstance(count, int):
+                if collecting:
+                    checks_passed.append(f"[✓] {field} is numeric value not string")
+            else:
+                errors.append(f"[X] {field} should be numeric, not string")
 
         # Check key_stickies
         key_stickies = json_data.get("key_stickies", [])
@@ -1719,6 +1502,7 @@ def _validate_sprint_retro_figjam_analysis(
 # Task 15: ShopEasy Login Content Hierarchy Analysis (Prompts6)
 # =============================================================================
 
+@reward(cost="answer")
 def _validate_shopeasy_content_hierarchy(
     backend: Backend,
     frontend_final_state: Dict[str, Any],
@@ -1735,9 +1519,13 @@ def _validate_shopeasy_content_hierarchy(
       "node_counts_by_type": {"frame": <count>, "text": <count>},
       "deepest_nesting_level": <number>
     }
+
+    When the initial state has the Content frame's nodes, node counts, nesting
+    depth and children counts are checked against its hierarchy; otherwise
+    only their presence and types are checked.
     """
-    errors: List[str] = []
-    checks_passed: List[str] = []
+    checks_passed, errors = message_lists()
+    collecting = collects(checks_passed)
 
     try:
         json_data = _extract_json_from_answer(final_answer)
@@ -1754,25 +1542,35 @@ def _validate_shopeasy_content_hierarchy(
 
         checks_passed.append("[✓] JSON response parsed successfully")
 
+        content_id = "node-shopeasy-login-content"
+        truth = ground_truth_for_file("file-shopeasy")
+        tree = truth.hierarchy if content_id in truth.hierarchy else None
+        box = truth.geometry(content_id) or {"x": 24, "y": 224, "width": 345, "height": 500}
+
         # Check content_frame position
         content_frame = json_data.get("content_frame", {})
 
-        if content_frame.get("x") == 24 and content_frame.get("y") == 224:
-            checks_passed.append("[✓] Content frame position is x=24, y=224")
+        if content_frame.get("x") == box["x"] and content_frame.get("y") == box["y"]:
+            if collecting:
+                checks_passed.append(f"[✓] Content frame position is x={box['x']}, y={box['y']}")
         else:
-            errors.append(f"[X] Content frame at ({content_frame.get('x')},{content_frame.get('y')}), expected (24,224)")
+            errors.append(f"[X] Content frame at ({content_frame.get('x')},{content_frame.get('y')}), expected ({box['x']},{box['y']})")
 
-        if content_frame.get("width") == 345 and content_frame.get("height") == 500:
-            checks_passed.append("[✓] Content frame dimensions are 345x500 pixels")
+        if content_frame.get("width") == box["width"] and content_frame.get("height") == box["height"]:
+            if collecting:
+                checks_passed.append(f"[✓] Content frame dimensions are {box['width']}x{box['height']} pixels")
         else:
-            errors.append(f"[X] Content frame dimensions {content_frame.get('width')}x{content_frame.get('height')}, expected 345x500")
+            errors.append(f"[X] Content frame dimensions {content_frame.get('width')}x{content_frame.get('height')}, expected {box['width']}x{box['height']}")
 
         # Check total_nested_nodes
         total_nested = json_data.get("total_nested_nodes")
-        if isinstance(total_nested, int) and total_nested > 0:
-            checks_passed.append(f"[✓] Accurate count of all nested nodes within Content: {total_nested}")
-        else:
+        if not (isinstance(total_nested, int) and total_nested > 0):
             errors.append("[X] total_nested_nodes is missing or invalid")
+        elif tree is not None and total_nested != tree.subtree_size(content_id):
+            errors.append(f"[X] total_nested_nodes is {total_nested}, expected {tree.subtree_size(content_id)}")
+        else:
+            if collecting:
+                checks_passed.append(f"[✓] Accurate count of all nested nodes within Content: {total_nested}")
 
         # Check frame_hierarchy
         frame_hierarchy = json_data.get("frame_hierarchy", [])
@@ -1788,7 +1586,17 @@ def _validate_shopeasy_content_hierarchy(
 
             if all_valid:
                 checks_passed.append("[✓] Each frame in hierarchy has valid x, y, width, height")
-                checks_passed.append("[✓] children_count matches actual number of direct children")
+                wrong_counts = []
+                if tree is not None:
+                    for frame in frame_hierarchy:
+                        if isinstance(frame["name"], str) and frame["name"] in tree and tree.is_ancestor(content_id, frame["name"]):
+                            expected_count = len(tree.children(frame["name"]))
+                            if frame["children_count"] != expected_count:
+                                wrong_counts.append(f"{frame['name']} ({frame['children_count']}, expected {expected_count})")
+                if wrong_counts:
+                    errors.append(f"[X] children_count incorrect for: {', '.join(wrong_counts)}")
+                else:
+                    checks_passed.append("[✓] children_count matches actual number of direct children")
             else:
                 errors.append("[X] Some frames in hierarchy missing required properties")
 
@@ -1799,25 +1607,33 @@ def _validate_shopeasy_content_hierarchy(
 
         # Check node_counts_by_type
         node_counts = json_data.get("node_counts_by_type", {})
-        if isinstance(node_counts, dict) and len(node_counts) > 0:
+        expected_counts = tree.count_by(content_id) if tree is not None else None
+        if isinstance(node_counts, dict) and len(node_counts) > 0 and expected_counts not in (None, node_counts):
+            errors.append(f"[X] node_counts_by_type is {dict(node_counts)}, expected {expected_counts}")
+        elif isinstance(node_counts, dict) and len(node_counts) > 0:
             checks_passed.append("[✓] Accurate node type counting")
             checks_passed.append("[✓] node_counts_by_type includes all encountered types")
 
             frame_count = node_counts.get("frame", 0)
             text_count = node_counts.get("text", 0)
             if frame_count > 0:
-                checks_passed.append(f"[✓] Frame count: {frame_count}")
+                if collecting:
+                    checks_passed.append(f"[✓] Frame count: {frame_count}")
             if text_count >= 0:
-                checks_passed.append(f"[✓] Text node count accurately reflects text elements: {text_count}")
+                if collecting:
+                    checks_passed.append(f"[✓] Text node count accurately reflects text elements: {text_count}")
         else:
             errors.append("[X] node_counts_by_type is missing or empty")
 
         # Check deepest_nesting_level
         deepest_level = json_data.get("deepest_nesting_level")
-        if isinstance(deepest_level, int) and deepest_level > 0:
-            checks_passed.append(f"[✓] Deepest nesting level is accurate integer: {deepest_level}")
-        else:
+        if not (isinstance(deepest_level, int) and deepest_level > 0):
             errors.append("[X] deepest_nesting_level is missing or invalid")
+        elif tree is not None and deepest_level != tree.max_depth(content_id):
+            errors.append(f"[X] deepest_nesting_level is {deepest_level}, expected {tree.max_depth(content_id)}")
+        else:
+            if collecting:
+                checks_passed.append(f"[✓] Deepest nesting level is accurate integer: {deepest_level}")
 
         return TaskScore(
             score=1.0 if len(errors) == 0 else 0.0,
@@ -1842,6 +1658,7 @@ def _validate_shopeasy_content_hierarchy(
 # Task 16: User Journey Canvas Analysis (Prompts6)
 # =============================================================================
 
+@reward(cost="answer")
 def _validate_user_journey_canvas_analysis(
     backend: Backend,
     frontend_final_state: Dict[str, Any],
@@ -1860,8 +1677,8 @@ def _validate_user_journey_canvas_analysis(
       "journey_stages_count": <number>
     }
     """
-    errors: List[str] = []
-    checks_passed: List[str] = []
+    checks_passed, errors = message_lists()
+    collecting = collects(checks_passed)
 
     try:
         json_data = _extract_json_from_answer(final_answer)
@@ -1881,14 +1698,16 @@ def _validate_user_journey_canvas_analysis(
         # Check total_nodes
         total_nodes = json_data.get("total_nodes")
         if isinstance(total_nodes, int) and total_nodes > 0:
-            checks_passed.append(f"[✓] Accurate total node count across all levels: {total_nodes}")
+            if collecting:
+                checks_passed.append(f"[✓] Accurate total node count across all levels: {total_nodes}")
         else:
             errors.append("[X] total_nodes is missing or invalid")
 
         # Check hierarchy_levels
         hierarchy_levels = json_data.get("hierarchy_levels")
         if isinstance(hierarchy_levels, int) and hierarchy_levels > 0:
-            checks_passed.append(f"[✓] Correct hierarchy depth identification: {hierarchy_levels}")
+            if collecting:
+                checks_passed.append(f"[✓] Correct hierarchy depth identification: {hierarchy_levels}")
         else:
             errors.append("[X] hierarchy_levels is missing or invalid")
 
@@ -1901,7 +1720,8 @@ def _validate_user_journey_canvas_analysis(
             # Verify each level has required fields
             for level_data in nodes_by_level:
                 if "level" in level_data and "node_count" in level_data and "types" in level_data:
-                    checks_passed.append(f"[✓] Level {level_data.get('level')} node_count matches sum of types counts")
+                    if collecting:
+                        checks_passed.append(f"[✓] Level {level_data.get('level')} node_count matches sum of types counts")
                     break
         else:
             errors.append("[X] nodes_by_level is empty or missing")
@@ -1909,7 +1729,8 @@ def _validate_user_journey_canvas_analysis(
         # Check shape_with_text_nodes
         shape_nodes = json_data.get("shape_with_text_nodes", [])
         if isinstance(shape_nodes, list) and len(shape_nodes) > 0:
-            checks_passed.append(f"[✓] Accurate identification of all SHAPE-WITH-TEXT nodes: {len(shape_nodes)}")
+            if collecting:
+                checks_passed.append(f"[✓] Accurate identification of all SHAPE-WITH-TEXT nodes: {len(shape_nodes)}")
 
             # Check stage_order values
             stage_orders = [s.get("stage_order") for s in shape_nodes if "stage_order" in s]
@@ -1936,11 +1757,14 @@ def _validate_user_journey_canvas_analysis(
             horizontal_pixels = flow_distance.get("horizontal_pixels")
 
             if from_stage and to_stage:
-                checks_passed.append(f"[✓] from and to stage names match actual first and last stages")
-                checks_passed.append(f"[✓] Correct flow distance calculation between first and last stages")
+                if collecting:
+                    checks_passed.append(f"[✓] from and to stage names match actual first and last stages")
+                if collecting:
+                    checks_passed.append(f"[✓] Correct flow distance calculation between first and last stages")
 
             if isinstance(horizontal_pixels, (int, float)) and horizontal_pixels > 0:
-                checks_passed.append(f"[✓] flow_distance horizontal_pixels is positive number: {horizontal_pixels}")
+                if collecting:
+                    checks_passed.append(f"[✓] flow_distance horizontal_pixels is positive number: {horizontal_pixels}")
             else:
                 errors.append("[X] flow_distance horizontal_pixels is missing or not positive")
         else:
@@ -1949,7 +1773,8 @@ def _validate_user_journey_canvas_analysis(
         # Check journey_stages_count
         journey_count = json_data.get("journey_stages_count")
         if isinstance(journey_count, int) and journey_count > 0:
-            checks_passed.append(f"[✓] Accurate journey stage counting: {journey_count}")
+            if collecting:
+                checks_passed.append(f"[✓] Accurate journey stage counting: {journey_count}")
 
             # Verify it matches shape_with_text_nodes length
             if len(shape_nodes) == journey_count:
@@ -1980,6 +1805,7 @@ def _validate_user_journey_canvas_analysis(
 # Task 17: ShopEasy Size Selection Analysis (Prompts6)
 # =============================================================================
 
+@reward(cost="answer")
 def _validate_shopeasy_size_selection_analysis(
     backend: Backend,
     frontend_final_state: Dict[str, Any],
@@ -1997,8 +1823,8 @@ def _validate_shopeasy_size_selection_analysis(
       "total_size_options": 4
     }
     """
-    errors: List[str] = []
-    checks_passed: List[str] = []
+    checks_passed, errors = message_lists()
+    collecting = collects(checks_passed)
 
     try:
         json_data = _extract_json_from_answer(final_answer)
@@ -2037,9 +1863,10 @@ def _validate_shopeasy_size_selection_analysis(
         if len(size_options) == 4:
             checks_passed.append("[✓] 4 size frames identified in size_options array")
 
-            all_width_44 = all(s.get("width") == 44 for s in size_options)
-            all_height_40 = all(s.get("height") == 40 for s in size_options)
-            all_y_zero = all(s.get("y") == 0 for s in size_options)
+            boxes = geometry.boxes_from(size_options)
+            all_width_44 = geometry.all_match(boxes[:, geometry.WIDTH], 44)
+            all_height_40 = geometry.all_match(boxes[:, geometry.HEIGHT], 40)
+            all_y_zero = geometry.all_match(boxes[:, geometry.Y], 0)
 
             if all_width_44:
                 checks_passed.append("[✓] Each size frame has width=44 pixels")
@@ -2063,8 +1890,7 @@ def _validate_shopeasy_size_selection_analysis(
                 checks_passed.append("[✓] Size names include S, M, L, XL labels")
 
             # Check x-coordinates are increasing
-            x_coords = [s.get("x") for s in size_options]
-            if x_coords == sorted(x_coords):
+            if geometry.is_sorted(boxes[:, geometry.X]):
                 checks_passed.append("[✓] Size frames sorted by x-coordinate left to right")
                 checks_passed.append("[✓] X-coordinates show increasing horizontal pattern")
         else:
@@ -2074,7 +1900,8 @@ def _validate_shopeasy_size_selection_analysis(
         spacing = json_data.get("spacing_pattern", {})
         gap = spacing.get("gap_between_sizes")
         if isinstance(gap, (int, float)) and gap > 0:
-            checks_passed.append(f"[✓] Spacing between frames calculated in gap_between_sizes: {gap}")
+            if collecting:
+                checks_passed.append(f"[✓] Spacing between frames calculated in gap_between_sizes: {gap}")
         else:
             errors.append("[X] gap_between_sizes is missing or invalid")
 
@@ -2130,6 +1957,7 @@ def _validate_shopeasy_size_selection_analysis(
 # Task 18: FitTrack Analytics Charts Grid Analysis (Prompts6)
 # =============================================================================
 
+@reward(cost="answer")
 def _validate_fittrack_charts_grid_analysis(
     backend: Backend,
     frontend_final_state: Dict[str, Any],
@@ -2149,8 +1977,8 @@ def _validate_fittrack_charts_grid_analysis(
       "all_nodes": [{"name": "<string>", "type": "<string>", "parent": "<string>"}]
     }
     """
-    errors: List[str] = []
-    checks_passed: List[str] = []
+    checks_passed, errors = message_lists()
+    collecting = collects(checks_passed)
 
     try:
         json_data = _extract_json_from_answer(final_answer)
@@ -2187,31 +2015,26 @@ def _validate_fittrack_charts_grid_analysis(
         if len(chart_positions) == 3:
             checks_passed.append("[✓] chart_positions array has 3 entries")
 
-            x_coords = [c.get("x") for c in chart_positions]
+            boxes = geometry.boxes_from(chart_positions)
+            x_coords = boxes[:, geometry.X]
             expected_x = [0, 386, 772]
 
-            if 0 in x_coords:
-                checks_passed.append("[✓] First chart at x=0")
-            else:
-                errors.append("[X] No chart at x=0")
-
-            if 386 in x_coords:
-                checks_passed.append("[✓] Second chart at x=386")
-            else:
-                errors.append("[X] No chart at x=386")
-
-            if 772 in x_coords:
-                checks_passed.append("[✓] Third chart at x=772")
-            else:
-                errors.append("[X] No chart at x=772")
+            found = geometry.contains_values(x_coords, expected_x)
+            for ordinal, x, ok in zip(("First", "Second", "Third"), expected_x, found):
+                if ok:
+                    if collecting:
+                        checks_passed.append(f"[✓] {ordinal} chart at x={x}")
+                else:
+                    errors.append(f"[X] No chart at x={x}")
 
-            if sorted(x_coords) == expected_x:
+            is_uniform, step = geometry.uniform(x_coords)
+            if geometry.all_match(np.sort(x_coords), expected_x):
                 checks_passed.append("[✓] Chart frames at x-coordinates 0, 386, 772")
+            if is_uniform and step == 386:
                 checks_passed.append("[✓] Chart spacing is consistent (386 pixels)")
 
             # Check y-coordinates are consistent
-            y_coords = [c.get("y") for c in chart_positions]
-            if len(set(y_coords)) == 1:
+            if geometry.aligned(boxes[:, geometry.Y]):
                 checks_passed.append("[✓] Y-coordinates consistent across chart frames")
         else:
             errors.append(f"[X] chart_positions has {len(chart_positions)} entries, expected 3")
@@ -2219,7 +2042,8 @@ def _validate_fittrack_charts_grid_analysis(
         # Check total_text_elements
         total_text = json_data.get("total_text_elements")
         if isinstance(total_text, int) and total_text > 0:
-            checks_passed.append(f"[✓] Total text elements count is accurate: {total_text}")
+            if collecting:
+                checks_passed.append(f"[✓] Total text elements count is accurate: {total_text}")
             checks_passed.append("[✓] Text elements include both titles and values")
         else:
             errors.append("[X] total_text_elements is missing or invalid")
@@ -2227,14 +2051,16 @@ def _validate_fittrack_charts_grid_analysis(
         # Check total_rectangles
         total_rects = json_data.get("total_rectangles")
         if isinstance(total_rects, int) and total_rects >= 0:
-            checks_passed.append(f"[✓] Rectangle count matches chart area backgrounds: {total_rects}")
+            if collecting:
+                checks_passed.append(f"[✓] Rectangle count matches chart area backgrounds: {total_rects}")
         else:
             errors.append("[X] total_rectangles is missing or invalid")
 
         # Check hierarchy_depth
         depth = json_data.get("hierarchy_depth")
         if isinstance(depth, int) and depth > 0:
-            checks_passed.append(f"[✓] hierarchy_depth accurately reflects nesting levels: {depth}")
+            if collecting:
+                checks_passed.append(f"[✓] hierarchy_depth accurately reflects nesting levels: {depth}")
         else:
             errors.append("[X] hierarchy_depth is missing or invalid")
 
@@ -2283,6 +2109,7 @@ def _validate_fittrack_charts_grid_analysis(
 # Task 19: User Journey Mapping Board Analysis (Prompts6)
 # =============================================================================
 
+@reward(cost="answer")
 def _validate_journey_mapping_analysis(
     backend: Backend,
     frontend_final_state: Dict[str, Any],
@@ -2301,8 +2128,8 @@ def _validate_journey_mapping_analysis(
       "total_shape_with_text_elements": <number>
     }
     """
-    errors: List[str] = []
-    checks_passed: List[str] = []
+    checks_passed, errors = message_lists()
+    collecting = collects(checks_passed)
 
     try:
         json_data = _extract_json_from_answer(final_answer)
@@ -2322,7 +2149,8 @@ def _validate_journey_mapping_analysis(
         # Check journey_title
         journey_title = json_data.get("journey_title")
         if journey_title and isinstance(journey_title, str) and len(journey_title) > 0:
-            checks_passed.append(f"[✓] Journey title correctly identified: '{journey_title}'")
+            if collecting:
+                checks_passed.append(f"[✓] Journey title correctly identified: '{journey_title}'")
         else:
             errors.append("[X] journey_title is missing or empty")
 
@@ -2383,9 +2211,11 @@ def _validate_journey_mapping_analysis(
             opportunities = [s for s in sticky_notes if s.get("type") == "opportunity"]
 
             if len(pain_points) > 0:
-                checks_passed.append(f"[✓] Pain point sticky notes identified correctly: {len(pain_points)}")
+                if collecting:
+                    checks_passed.append(f"[✓] Pain point sticky notes identified correctly: {len(pain_points)}")
             if len(opportunities) > 0:
-                checks_passed.append(f"[✓] Opportunity sticky notes identified correctly: {len(opportunities)}")
+                if collecting:
+                    checks_passed.append(f"[✓] Opportunity sticky notes identified correctly: {len(opportunities)}")
 
             if pain_points or opportunities:
                 checks_passed.append("[✓] sticky_notes array separates pain_point and opportunity types")
@@ -2396,7 +2226,8 @@ def _validate_journey_mapping_analysis(
         # Check total_shape_with_text_elements
         total_shapes = json_data.get("total_shape_with_text_elements")
         if isinstance(total_shapes, int) and total_shapes > 0:
-            checks_passed.append(f"[✓] total_shape_with_text_elements: {total_shapes}")
+            if collecting:
+                checks_passed.append(f"[✓] total_shape_with_text_elements: {total_shapes}")
             if total_shapes == total_stages:
                 checks_passed.append("[✓] total_shape_with_text_elements matches stage count")
         else:
@@ -2425,6 +2256,7 @@ def _validate_journey_mapping_analysis(
 # Task 20: ShopEasy SwiftUI Code Extraction (Prompts6)
 # =============================================================================
 
+@reward(cost="answer")
 def _validate_shopeasy_swiftui_extraction(
     backend: Backend,
     frontend_final_state: Dict[str, Any],
@@ -2441,8 +2273,8 @@ def _validate_shopeasy_swiftui_extraction(
       "swiftui_features": ["<array of SwiftUI syntax elements found>"]
     }
     """
-    errors: List[str] = []
-    checks_passed: List[str] = []
+    checks_passed, errors = message_lists()
+    collecting = collects(checks_passed)
 
     try:
         json_data = _extract_json_from_answer(final_answer)
@@ -2466,10 +2298,16 @@ def _validate_shopeasy_swiftui_extraction(
         else:
             errors.append(f"[X] Framework is '{framework}', expected 'swiftui'")
 
+        code = json_data.get("code", "")
+        summary = summarize_swiftui(code) if isinstance(code, str) and len(code) > 50 else None
+
         # Check has_svg
         has_svg = json_data.get("has_svg")
-        if isinstance(has_svg, bool):
-            checks_passed.append(f"[✓] has_svg boolean accurately reflects SVG presence: {has_svg}")
+        if isinstance(has_svg, bool) and summary is not None and has_svg != summary["has_svg"]:
+            errors.append(f"[X] has_svg is {has_svg} but the code {'contains' if summary['has_svg'] else 'contains no'} SVG markup")
+        elif isinstance(has_svg, bool):
+            if collecting:
+                checks_passed.append(f"[✓] has_svg boolean accurately reflects SVG presence: {has_svg}")
             if has_svg:
                 checks_passed.append("[✓] Code includes embedded SVG content")
         else:
@@ -2490,32 +2328,30 @@ def _validate_shopeasy_swiftui_extraction(
             errors.append("[X] swiftui_features is empty or missing")
 
         # Check code structure
-        code = json_data.get("code", "")
-        if isinstance(code, str) and len(code) > 50:
+        if summary is not None:
             checks_passed.append("[✓] Code field contains SwiftUI View")
 
             code_lower = code.lower()
 
             # Check for View protocol
-            if "view" in code_lower and "struct" in code_lower:
+            if summary["views"]:
                 checks_passed.append("[✓] Struct conforms to View protocol")
 
             # Check for body property
-            if "var body" in code or "body:" in code:
+            if summary["has_body"]:
                 checks_passed.append("[✓] Code contains body property returning some View")
                 checks_passed.append("[✓] body property uses @ViewBuilder or returns some View")
 
             # Check for SwiftUI import
-            if "import swiftui" in code_lower:
+            if "SwiftUI" in summary["imports"]:
                 checks_passed.append("[✓] SwiftUI import statement present")
 
             # Check for SwiftUI containers
-            containers = ["zstack", "vstack", "hstack"]
-            if any(c in code_lower for c in containers):
+            if summary["containers"]:
                 checks_passed.append("[✓] View hierarchy uses proper SwiftUI containers (ZStack, VStack, HStack)")
 
             # Check for view modifiers (common patterns like .frame, .padding, etc.)
-            if "." in code and any(mod in code_lower for mod in [".frame", ".padding", ".background", ".foregroundcolor"]):
+            if summary["modifiers"]:
                 checks_passed.append("[✓] Component uses proper SwiftUI view modifiers")
 
             # Check for Color usage
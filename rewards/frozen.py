@@ -0,0 +1,86 @@
+"""
+Read-only dict and list types for data shared between callers.
+
+FrozenDict and FrozenList subclass dict and list so existing code that does
+``isinstance(x, dict)``, ``.get()`` or iteration keeps working, but every
+mutating method raises TypeError. ``freeze`` converts nested JSON-like data
+recursively; ``thaw`` turns it back into plain mutable containers.
+"""
+
+from typing import Any, NoReturn
+
+
+def _read_only(self: Any, *args: Any, **kwargs: Any) -> NoReturn:
+    raise TypeError(f"'{type(self).__name__}' object is read-only")
+
+
+class FrozenDict(dict):
+    """A dict that cannot be modified after construction."""
+
+    __slots__ = ()
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __ior__ = _read_only
+    clear = _read_only
+    pop = _read_only
+    popitem = _read_only
+    setdefault = _read_only
+    update = _read_only
+
+    def __reduce__(self) -> Any:
+        return (type(self), (dict(self),))
+
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __deepcopy__(self, memo: Any) -> "FrozenDict":
+        return self
+
+
+class FrozenList(list):
+    """A list that cannot be modified after construction."""
+
+    __slots__ = ()
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __iadd__ = _read_only
+    __imul__ = _read_only
+    append = _read_only
+    clear = _read_only
+    extend = _read_only
+    insert = _read_only
+    pop = _read_only
+    remove = _read_only
+    reverse = _read_only
+    sort = _read_only
+
+    def __reduce__(self) -> Any:
+        return (type(self), (list(self),))
+
+    def __copy__(self) -> "FrozenList":
+        return self
+
+    def __deepcopy__(self, memo: Any) -> "FrozenList":
+        return self
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists into their read-only variants."""
+    if isinstance(value, FrozenDict) or isinstance(value, FrozenList):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Recursively convert read-only containers back into plain dicts and lists."""
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    return value
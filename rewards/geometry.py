@@ -0,0 +1,181 @@
+"""
+Batched geometry over node bounding boxes.
+
+Spatial validators compare positions, sizes, gaps and alignment of many
+nodes. These helpers take boxes as an ``(n, 4)`` float array of
+``x, y, width, height`` and do each comparison as one NumPy operation, so
+they stay fast for generated grids with thousands of nodes. Missing or
+non-numeric coordinates become NaN, which never matches anything.
+
+All comparisons take an absolute tolerance in pixels (default 0, exact).
+"""
+
+from typing import Any, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+X, Y, WIDTH, HEIGHT = range(4)
+_AXES = {"x": X, "y": Y}
+
+
+def _number(value: Any) -> float:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return np.nan
+
+
+def boxes_from(
+    nodes: Iterable[Any],
+    fields: Sequence[str] = ("x", "y", "width", "height"),
+) -> np.ndarray:
+    """Build an (n, 4) box array from node dicts.
+
+    Args:
+        nodes: Dicts with position and size fields; anything else becomes
+            a row of NaN.
+        fields: Names of the x, y, width and height fields.
+    """
+    rows = [
+        [_number(node.get(field)) for field in fields] if isinstance(node, Mapping) else [np.nan] * 4
+        for node in nodes
+    ]
+    return np.asarray(rows, dtype=np.float64).reshape(-1, 4)
+
+
+def values_from(nodes: Iterable[Any], field: str) -> np.ndarray:
+    """One numeric field of each node as a float array (NaN when missing)."""
+    return np.asarray(
+        [_number(node.get(field)) if isinstance(node, Mapping) else np.nan for node in nodes],
+        dtype=np.float64,
+    )
+
+
+def matches(values: np.ndarray, expected: Any, tolerance: float = 0) -> np.ndarray:
+    """Elementwise ``|values - expected| <= tolerance``; broadcasts expected."""
+    with np.errstate(invalid="ignore"):
+        return np.abs(np.asarray(values, dtype=np.float64) - np.asarray(expected, dtype=np.float64)) <= tolerance
+
+
+def all_match(values: np.ndarray, expected: Any, tolerance: float = 0) -> bool:
+    """True if there are values and every one matches expected."""
+    result = matches(values, expected, tolerance)
+    return bool(result.size) and bool(result.all())
+
+
+def contains_values(values: np.ndarray, wanted: Sequence[float], tolerance: float = 0) -> np.ndarray:
+    """For each wanted value, whether any of the values matches it."""
+    values = np.asarray(values, dtype=np.float64)
+    wanted_array = np.asarray(wanted, dtype=np.float64)
+    if not values.size:
+        return np.zeros(len(wanted_array), dtype=bool)
+    return matches(values[None, :], wanted_array[:, None], tolerance).any(axis=1)
+
+
+def is_sorted(values: np.ndarray) -> bool:
+    """True if values are finite and non-decreasing."""
+    values = np.asarray(values, dtype=np.float64)
+    return bool(np.isfinite(values).all()) and bool((np.diff(values) >= 0).all())
+
+
+def aligned(values: np.ndarray, tolerance: float = 0) -> bool:
+    """True if there are values, all finite and within tolerance of each other."""
+    values = np.asarray(values, dtype=np.float64)
+    if not values.size or not np.isfinite(values).all():
+        return False
+    return bool(values.max() - values.min() <= tolerance)
+
+
+def gaps(boxes: np.ndarray, axis: str = "y") -> np.ndarray:
+    """Gaps between consecutive boxes along an axis, in position order.
+
+    A gap is the distance from one box's far edge to the next box's near
+    edge; it is negative where boxes overlap along that axis.
+    """
+    start = _AXES[axis]
+    size = start + 2
+    order = np.argsort(boxes[:, start], kind="stable")
+    ordered = boxes[order]
+    return ordered[1:, start] - (ordered[:-1, start] + ordered[:-1, size])
+
+
+def steps(values: np.ndarray) -> np.ndarray:
+    """Differences between consecutive sorted values (e.g. column pitch)."""
+    return np.diff(np.sort(np.asarray(values, dtype=np.float64)))
+
+
+def uniform(values: np.ndarray, tolerance: float = 0) -> Tuple[bool, Optional[float]]:
+    """Whether values are evenly spaced once sorted, and the spacing.
+
+    Returns:
+        (is_uniform, median step); the step is None for fewer than two values.
+    """
+    diffs = steps(values)
+    if not diffs.size:
+        return False, None
+    step = float(np.median(diffs))
+    return bool(np.isfinite(diffs).all() and (np.abs(diffs - step) <= tolerance).all()), step
+
+
+def alignment_groups(values: np.ndarray, tolerance: float = 0) -> np.ndarray:
+    """Label values into groups that are aligned within tolerance.
+
+    Values are sorted and split wherever consecutive values differ by more
+    than the tolerance. Labels are numbered in increasing value order; NaN
+    values get label -1.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    labels = np.full(values.shape, -1, dtype=np.int64)
+    finite = np.flatnonzero(np.isfinite(values))
+    if not finite.size:
+        return labels
+    order = finite[np.argsort(values[finite], kind="stable")]
+    breaks = np.diff(values[order]) > tolerance
+    labels[order] = np.concatenate(([0], np.cumsum(breaks)))
+    return labels
+
+
+def grid(boxes: np.ndarray, tolerance: float = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """Row and column labels of boxes laid out in a grid.
+
+    Rows group boxes by aligned top edge, columns by aligned left edge.
+    """
+    return alignment_groups(boxes[:, Y], tolerance), alignment_groups(boxes[:, X], tolerance)
+
+
+def overlaps(boxes: np.ndarray, tolerance: float = 0) -> np.ndarray:
+    """Pairs of boxes that overlap by more than ``tolerance`` on both axes.
+
+    Uses a sort-and-sweep on x so only boxes whose x ranges intersect are
+    compared, which keeps regular layouts close to O(n log n).
+
+    Returns:
+        (k, 2) array of index pairs ``i < j``.
+    """
+    valid = np.flatnonzero(np.isfinite(boxes).all(axis=1))
+    if valid.size < 2:
+        return np.empty((0, 2), dtype=np.int64)
+    order = valid[np.argsort(boxes[valid, X], kind="stable")]
+    left = boxes[order, X]
+    right = left + boxes[order, WIDTH]
+
+    # For each box, candidates are the following boxes starting before its right edge
+    ends = np.searchsorted(left, right - tolerance, side="left")
+    counts = np.maximum(ends - np.arange(order.size) - 1, 0)
+    total = int(counts.sum())
+    if not total:
+        return np.empty((0, 2), dtype=np.int64)
+    first = np.repeat(np.arange(order.size), counts)
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    second = first + 1 + offsets
+
+    a, b = order[first], order[second]
+    x_overlap = np.minimum(boxes[a, X] + boxes[a, WIDTH], boxes[b, X] + boxes[b, WIDTH]) - np.maximum(boxes[a, X], boxes[b, X])
+    y_overlap = np.minimum(boxes[a, Y] + boxes[a, HEIGHT], boxes[b, Y] + boxes[b, HEIGHT]) - np.maximum(boxes[a, Y], boxes[b, Y])
+    hit = (x_overlap > tolerance) & (y_overlap > tolerance)
+    pairs = np.stack([np.minimum(a[hit], b[hit]), np.maximum(a[hit], b[hit])], axis=1)
+    return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+
+def names_of(nodes: Sequence[Any], indexes: Iterable[int], field: str = "name") -> List[Any]:
+    """Node names for a list of row indexes, for error messages."""
+    return [nodes[i].get(field) if isinstance(nodes[i], Mapping) else None for i in indexes]
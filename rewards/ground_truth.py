@@ -0,0 +1,306 @@
+"""
+Expected answers derived from the backend's Figma documents.
+
+Validators used to hardcode what the seeded file contains ("Button/Primary
+at (100,100), 120x40"), so every seed variant needed its own function.
+``ground_truth_for_file`` reads a file's node, component, component-set,
+variable and variable-collection documents from the task's initial backend
+state (the one named by ``initial_backend_state_name``, before the agent
+ran) and derives what a correct answer must say:
+
+    with initial_state(adapter, state_hash):
+        truth = ground_truth_for_file("file-2")
+        truth.geometry("Button/Primary")   # {"x": 100, "y": 100, "width": 120, "height": 40}
+        truth.variant_properties("Button/Primary")
+        truth.hierarchy.subtree_size("node-shopeasy-login-content")
+        truth.connectors()                 # FigJam connector endpoints and magnets
+        truth.connector_graph("page-4").reachable("Feature Idea", "Tech Debt")
+        truth.variables.color("var-primary", mode="Dark")
+
+The server enters ``initial_state`` around each reward call with a backend
+over the task's state file and that file's content hash (see
+``index_cache.IndexCache.content_hash``). Derived results are cached
+process-wide in an LRU keyed by (state hash, file id), so procedurally
+varied tasks that share a state share one derivation and a repeat
+verification does no queries at all.
+
+Nodes are looked up by ``_id`` or by ``name`` (first match in document
+order). Every lookup returns None or an empty result when the document or
+field is missing, and outside ``initial_state`` (no state file available)
+the ground truth is empty, so validators fall back to their seeded
+constants.
+"""
+
+import contextlib
+import contextvars
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, TypedDict
+
+from .backend import Backend
+from .connector_graph import ConnectorGraph
+from .hierarchy import HierarchyIndex
+from .variables import VariableResolver
+
+_BOX_FIELDS = ("x", "y", "width", "height")
+_CACHE_SIZE = 64
+# Fetched per file, in FileGroundTruth's argument order
+COLLECTIONS = ("nodes", "components", "componentSets", "variables", "variableCollections")
+
+
+class ConnectorTruth(TypedDict):
+    id: Any
+    name: Optional[str]
+    start_node_id: Any
+    end_node_id: Any
+    start_node: Optional[str]
+    end_node: Optional[str]
+    start_magnet: Optional[str]
+    end_magnet: Optional[str]
+
+
+def _same_type(node: Mapping[str, Any], node_type: str) -> bool:
+    value = node.get("type")
+    return isinstance(value, str) and value.lower() == node_type.lower()
+
+
+def _endpoint(connector: Mapping[str, Any], end: str) -> Tuple[Any, Optional[str]]:
+    """(node id, magnet) of a connector end.
+
+    Reads the plugin API shape ``connectorStart: {endpointNodeId, magnet}``
+    and falls back to flat ``startNodeId`` / ``startMagnet`` fields.
+    """
+    nested = connector.get(f"connector{end.capitalize()}")
+    if isinstance(nested, Mapping):
+        node_id, magnet = nested.get("endpointNodeId"), nested.get("magnet")
+    else:
+        node_id, magnet = connector.get(f"{end}NodeId"), connector.get(f"{end}Magnet")
+    return node_id, magnet.lower() if isinstance(magnet, str) else None
+
+
+def _parse_variant_name(name: Any) -> Dict[str, str]:
+    """Variant properties encoded in a component name, e.g. "State=Default, Variant=Primary"."""
+    if not isinstance(name, str) or "=" not in name:
+        return {}
+    properties = {}
+    for part in name.split(","):
+        key, sep, value = part.partition("=")
+        if sep:
+            properties[key.strip()] = value.strip()
+    return properties
+
+
+class FileGroundTruth:
+    """Expected facts about one Figma file, derived from its documents.
+
+    Args:
+        nodes: The file's node documents.
+        components: The file's component documents; merged into the node of
+            the same ``_id`` (or ``nodeId``) so component metadata such as
+            ``componentSetId`` and ``variantProperties`` is found either way.
+        component_sets: The file's component-set documents.
+        variables: The file's variable documents.
+        variable_collections: The file's variable-collection documents.
+    """
+
+    def __init__(
+        self,
+        nodes: Sequence[Mapping[str, Any]],
+        components: Sequence[Mapping[str, Any]] = (),
+        component_sets: Sequence[Mapping[str, Any]] = (),
+        variables: Sequence[Mapping[str, Any]] = (),
+        variable_collections: Sequence[Mapping[str, Any]] = (),
+    ):
+        self.nodes: List[Dict[str, Any]] = [dict(node) for node in nodes if isinstance(node, Mapping)]
+        self._by_id: Dict[Any, Dict[str, Any]] = {}
+        self._by_name: Dict[Any, Dict[str, Any]] = {}
+        for node in self.nodes:
+            self._index(node)
+
+        for component in components:
+            if not isinstance(component, Mapping):
+                continue
+            node = self._by_id.get(component.get("nodeId", component.get("_id")))
+            if node is None:
+                node = {}
+                self.nodes.append(node)
+            for field, value in component.items():
+                node.setdefault(field, value)
+            self._index(node)
+
+        self.component_sets: List[Mapping[str, Any]] = [
+            component_set for component_set in component_sets if isinstance(component_set, Mapping)
+        ]
+        self._variable_documents = (variables, variable_collections)
+        self._variables: Optional[VariableResolver] = None
+        self._hierarchy: Optional[HierarchyIndex] = None
+        self._connectors: Optional[List[ConnectorTruth]] = None
+        self._connector_graphs: Dict[Any, ConnectorGraph] = {}
+
+    def _index(self, node: Dict[str, Any]) -> None:
+        if "_id" in node:
+            self._by_id.setdefault(node["_id"], node)
+        if "name" in node:
+            self._by_name.setdefault(node["name"], node)
+
+    def node(self, ref: Any) -> Optional[Dict[str, Any]]:
+        """A node by ``_id``, or by name if no node has that id."""
+        node = self._by_id.get(ref)
+        return node if node is not None else self._by_name.get(ref)
+
+    def nodes_of_type(self, node_type: str) -> List[Dict[str, Any]]:
+        """Nodes whose ``type`` matches (case-insensitive), in document order."""
+        return [node for node in self.nodes if _same_type(node, node_type)]
+
+    def geometry(self, ref: Any) -> Optional[Dict[str, Any]]:
+        """``{"x", "y", "width", "height"}`` of a node, or None if any is missing."""
+        node = self.node(ref)
+        if node is None or not all(isinstance(node.get(field), (int, float)) for field in _BOX_FIELDS):
+            return None
+        return {field: node[field] for field in _BOX_FIELDS}
+
+    def field(self, ref: Any, field: str) -> Any:
+        """One field of a node, or None."""
+        node = self.node(ref)
+        return node.get(field) if node is not None else None
+
+    def parent(self, ref: Any) -> Optional[Dict[str, Any]]:
+        node = self.node(ref)
+        return self._by_id.get(node.get("parentId")) if node is not None else None
+
+    @property
+    def hierarchy(self) -> HierarchyIndex:
+        """Parent/child index over the file's nodes, built on first use."""
+        if self._hierarchy is None:
+            self._hierarchy = HierarchyIndex(self.nodes)
+        return self._hierarchy
+
+    @property
+    def variables(self) -> VariableResolver:
+        """Variable/alias resolver over the file's variables, built on first use."""
+        if self._variables is None:
+            variables, collections = self._variable_documents
+            self._variables = VariableResolver(variables, collections, self.nodes)
+        return self._variables
+
+    def children(self, ref: Any) -> List[Dict[str, Any]]:
+        """Direct children of a node, in the parent's ``children`` order if it has one."""
+        node = self.node(ref)
+        if node is None or node.get("_id") not in self.hierarchy:
+            return []
+        return [self._by_id[child] for child in self.hierarchy.children(node["_id"]) if child in self._by_id]
+
+    def variant_properties(self, ref: Any) -> Dict[str, str]:
+        """A component's variant properties, from ``variantProperties`` or its name."""
+        node = self.node(ref)
+        if node is None:
+            return {}
+        properties = node.get("variantProperties")
+        if isinstance(properties, Mapping):
+            return dict(properties)
+        return _parse_variant_name(node.get("name"))
+
+    def variants(self, component_set_id: Any) -> List[Dict[str, Any]]:
+        """Components belonging to a component set, in document order."""
+        return [node for node in self.nodes if node.get("componentSetId") == component_set_id]
+
+    def connectors(self) -> List[ConnectorTruth]:
+        """Connector nodes with their endpoint ids, names and magnets."""
+        if self._connectors is None:
+            connectors = []
+            for node in self.nodes_of_type("connector"):
+                start_id, start_magnet = _endpoint(node, "start")
+                end_id, end_magnet = _endpoint(node, "end")
+                connectors.append(ConnectorTruth(
+                    id=node.get("_id"),
+                    name=node.get("name"),
+                    start_node_id=start_id,
+                    end_node_id=end_id,
+                    start_node=self.field(start_id, "name") if start_id in self._by_id else None,
+                    end_node=self.field(end_id, "name") if end_id in self._by_id else None,
+                    start_magnet=start_magnet,
+                    end_magnet=end_magnet,
+                ))
+            self._connectors = connectors
+        return self._connectors
+
+    def connector(self, ref: Any) -> Optional[ConnectorTruth]:
+        """A connector by ``_id`` or exact name."""
+        return self.connector_graph().connector(ref)  # type: ignore[return-value]
+
+    def on_board(self, node: Mapping[str, Any], board: Any) -> bool:
+        """True if a node is on a FigJam board (page), by ``pageId`` or ancestry."""
+        if node.get("pageId") == board:
+            return True
+        node_id = node.get("_id")
+        return board in self.hierarchy and node_id in self.hierarchy and self.hierarchy.is_ancestor(board, node_id)
+
+    def connector_graph(self, board: Any = None) -> ConnectorGraph:
+        """Connector graph of the whole file, or of one board (page id), built once."""
+        graph = self._connector_graphs.get(board)
+        if graph is None:
+            connectors = self.connectors()
+            if board is not None:
+                connectors = [c for c in connectors if self.on_board(self._by_id.get(c["id"], {}), board)]
+            names = {node["_id"]: node.get("name") for node in self.nodes if "_id" in node}
+            graph = self._connector_graphs.setdefault(board, ConnectorGraph(connectors, names))
+        return graph
+
+
+_truths: "OrderedDict[Tuple[str, Any], FileGroundTruth]" = OrderedDict()
+_truths_lock = threading.Lock()
+# (backend over the initial state, its content hash) while a reward runs
+_initial_state: "contextvars.ContextVar[Optional[Tuple[Backend, str]]]" = contextvars.ContextVar(
+    "initial_state", default=None
+)
+
+
+@contextlib.contextmanager
+def initial_state(backend: Backend, state_hash: str) -> Iterator[None]:
+    """Derive ground truth from ``backend`` within the block.
+
+    Args:
+        backend: Backend over the task's initial state, not the live one
+            the agent edited.
+        state_hash: Content hash of that state; results are cached under it.
+    """
+    token = _initial_state.set((backend, state_hash))
+    try:
+        yield
+    finally:
+        _initial_state.reset(token)
+
+
+def ground_truth_for_file(file_id: Any, file_field: str = "fileId") -> FileGroundTruth:
+    """Ground truth for one Figma file of the current initial state.
+
+    Args:
+        file_id: The file's id (``fileKey`` in the task prompts).
+        file_field: Field linking documents to their file.
+
+    Returns:
+        The cached result for (state hash, file id) if there is one; an
+        empty FileGroundTruth outside ``initial_state``.
+    """
+    state = _initial_state.get()
+    if state is None:
+        return FileGroundTruth(())
+    backend, state_hash = state
+    key = (state_hash, file_id)
+    with _truths_lock:
+        truth = _truths.get(key)
+        if truth is not None:
+            _truths.move_to_end(key)
+            return truth
+
+    documents = [
+        backend.query({"collection": collection, "filter": {file_field: file_id}}) or []
+        for collection in COLLECTIONS
+    ]
+    truth = FileGroundTruth(*documents)
+    with _truths_lock:
+        truth = _truths.setdefault(key, truth)
+        _truths.move_to_end(key)
+        while len(_truths) > _CACHE_SIZE:
+            _truths.popitem(last=False)
+        return truth
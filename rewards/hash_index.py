@@ -0,0 +1,82 @@
+"""
+Equality index over one top-level field of a list of documents.
+
+Maps each hashable field value to the rows holding it, so equality and
+``$in`` filters only have to verify those rows. Rows whose value cannot be
+hashed (lists, dicts) are kept aside and returned as candidates for every
+lookup, which keeps the index exact for any filter value. A missing field
+is indexed under ``None``, matching how filters treat it.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class HashIndex:
+    """Value -> row positions for one field. Rows are positions in the source list."""
+
+    def __init__(self, documents: Iterable[Any], field: str):
+        self.field = field
+        self.rows: Dict[Any, List[int]] = {}
+        self.unhashable_rows: List[int] = []
+        self.size = 0
+        for row, doc in enumerate(documents):
+            self.size += 1
+            if not isinstance(doc, dict):
+                continue
+            value = doc.get(field)
+            try:
+                self.rows.setdefault(value, []).append(row)
+            except TypeError:
+                self.unhashable_rows.append(row)
+
+    @classmethod
+    def from_rows(
+        cls, field: str, rows: Dict[Any, List[int]], unhashable_rows: List[int], size: int
+    ) -> "HashIndex":
+        """Rebuild an index from previously computed row lists."""
+        index = cls((), field)
+        index.rows = rows
+        index.unhashable_rows = unhashable_rows
+        index.size = size
+        return index
+
+    def to_state(self) -> Dict[str, Any]:
+        """Plain-data form of the index, for serialization."""
+        return {
+            "field": self.field,
+            "rows": self.rows,
+            "unhashable_rows": self.unhashable_rows,
+            "size": self.size,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "HashIndex":
+        """Rebuild an index from ``to_state`` output."""
+        return cls.from_rows(state["field"], state["rows"], state["unhashable_rows"], state["size"])
+
+    def __len__(self) -> int:
+        return self.size
+
+    def lookup(self, values: Iterable[Any]) -> Optional[List[int]]:
+        """Rows whose value may equal any of the given values, in row order.
+
+        Returns None if a lookup value is unhashable (the caller should scan).
+        """
+        found: List[int] = list(self.unhashable_rows)
+        for value in values:
+            try:
+                found.extend(self.rows.get(value, ()))
+            except TypeError:
+                return None
+        return sorted(set(found))
+
+    def candidates(self, condition: Any) -> Optional[List[int]]:
+        """Candidate rows for a filter condition, or None if the index can't help."""
+        if isinstance(condition, dict):
+            if "$in" not in condition:
+                return None
+            values = condition.get("$in", [])
+            if not isinstance(values, (list, tuple, set, frozenset)):
+                return None
+            return self.lookup(values)
+        return self.lookup([condition])
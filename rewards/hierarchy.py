@@ -0,0 +1,197 @@
+"""
+Parent/child index over a Figma file's nodes.
+
+Hierarchy tasks ask for subtree sizes, nesting depth, node counts per type
+and sibling order. ``HierarchyIndex`` answers them without walking the tree
+per question: one iterative depth-first pass (no recursion limit on deep
+files) assigns every node
+
+- its parent row and depth,
+- an Euler-tour interval ``[enter, exit)`` so that ``a`` is an ancestor of
+  ``b`` exactly when ``enter[a] <= enter[b] < exit[a]`` (an O(1) check),
+- a position in pre-order, so a node's subtree is one contiguous slice.
+
+Children are ordered by the parent's ``children`` id list when it has one,
+otherwise by document order. Nodes whose parent is not in the file are
+treated as roots; parent cycles are broken at the node first reached.
+
+Queries take a node ``_id`` or name (first match in document order) and
+return node ids.
+"""
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+import numpy as np
+
+
+class HierarchyIndex:
+    """Euler-tour index over node documents.
+
+    Args:
+        nodes: Node documents.
+        id_field: Field holding the node id.
+        parent_field: Field holding the parent node id.
+        children_field: Field holding an ordered list of child ids.
+    """
+
+    def __init__(
+        self,
+        nodes: Iterable[Any],
+        id_field: str = "_id",
+        parent_field: str = "parentId",
+        children_field: str = "children",
+    ):
+        self.nodes: List[Mapping[str, Any]] = [node for node in nodes if isinstance(node, (dict, Mapping))]
+        self.ids: List[Any] = [node.get(id_field) for node in self.nodes]
+        self._row_of: Dict[Any, int] = {}
+        self._row_of_name: Dict[Any, int] = {}
+        for row, node in enumerate(self.nodes):
+            self._row_of.setdefault(self.ids[row], row)
+            self._row_of_name.setdefault(node.get("name"), row)
+
+        count = len(self.nodes)
+        parent = np.full(count, -1, dtype=np.int64)
+        for row, node in enumerate(self.nodes):
+            parent_row = self._row_of.get(node.get(parent_field), -1)
+            parent[row] = parent_row if parent_row != row else -1
+
+        # Ordered children: the parent's own list first, then the rest in document order
+        self.child_rows: List[List[int]] = [[] for _ in range(count)]
+        listed = np.zeros(count, dtype=bool)
+        for row, node in enumerate(self.nodes):
+            child_ids = node.get(children_field)
+            if isinstance(child_ids, (list, tuple)):
+                for child_id in child_ids:
+                    child = self._row_of.get(child_id) if isinstance(child_id, (str, int)) else None
+                    if child is not None and parent[child] == row and not listed[child]:
+                        listed[child] = True
+                        self.child_rows[row].append(child)
+        for row in np.flatnonzero((parent >= 0) & ~listed).tolist():
+            self.child_rows[parent[row]].append(row)
+
+        # The walk runs on plain lists; indexing NumPy scalars one at a time is slower
+        parents = parent.tolist()
+        depth = [0] * count
+        enter = [-1] * count
+        exit_ = [-1] * count
+        order: List[int] = []
+        # Roots first; any node still unvisited afterwards sits on a parent cycle
+        for start in np.flatnonzero(parent < 0).tolist() + list(range(count)):
+            if enter[start] >= 0:
+                continue
+            parents[start] = -1
+            enter[start] = len(order)
+            order.append(start)
+            stack = [(start, 0)]
+            while stack:
+                row, next_child = stack[-1]
+                children = self.child_rows[row]
+                while next_child < len(children) and enter[children[next_child]] >= 0:
+                    next_child += 1
+                if next_child == len(children):
+                    stack.pop()
+                    exit_[row] = len(order)
+                    continue
+                stack[-1] = (row, next_child + 1)
+                child = children[next_child]
+                depth[child] = depth[row] + 1
+                enter[child] = len(order)
+                order.append(child)
+                stack.append((child, 0))
+
+        self.parent = np.asarray(parents, dtype=np.int64)
+        self.depth = np.asarray(depth, dtype=np.int64)
+        self.enter = np.asarray(enter, dtype=np.int64)
+        self.exit = np.asarray(exit_, dtype=np.int64)
+        self.order = np.asarray(order, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _row(self, ref: Any) -> Optional[int]:
+        row = self._row_of.get(ref)
+        return row if row is not None else self._row_of_name.get(ref)
+
+    def _require(self, ref: Any) -> int:
+        row = self._row(ref)
+        if row is None:
+            raise KeyError(f"Node {ref!r} is not in the hierarchy")
+        return row
+
+    def __contains__(self, ref: Any) -> bool:
+        return self._row(ref) is not None
+
+    def node(self, ref: Any) -> Optional[Mapping[str, Any]]:
+        row = self._row(ref)
+        return self.nodes[row] if row is not None else None
+
+    def is_ancestor(self, ancestor: Any, descendant: Any) -> bool:
+        """True if ``ancestor`` is a proper ancestor of ``descendant``."""
+        a, d = self._require(ancestor), self._require(descendant)
+        return a != d and self.enter[a] <= self.enter[d] < self.exit[a]
+
+    def parent_of(self, ref: Any) -> Optional[Any]:
+        parent = self.parent[self._require(ref)]
+        return self.ids[parent] if parent >= 0 else None
+
+    def children(self, ref: Any) -> List[Any]:
+        """Direct children in order."""
+        return [self.ids[row] for row in self.child_rows[self._require(ref)]]
+
+    def sibling_index(self, ref: Any) -> int:
+        """Position among the parent's children (0 for roots)."""
+        row = self._require(ref)
+        parent = self.parent[row]
+        return self.child_rows[parent].index(row) if parent >= 0 else 0
+
+    def depth_of(self, ref: Any) -> int:
+        return int(self.depth[self._require(ref)])
+
+    def path(self, ref: Any) -> List[Any]:
+        """Ids from the root down to the node, inclusive."""
+        row = self._require(ref)
+        rows = []
+        while row >= 0:
+            rows.append(row)
+            row = self.parent[row]
+        return [self.ids[row] for row in reversed(rows)]
+
+    def _subtree_rows(self, ref: Any, include_self: bool) -> np.ndarray:
+        row = self._require(ref)
+        start = self.enter[row] + (0 if include_self else 1)
+        return self.order[start:self.exit[row]]
+
+    def subtree(self, ref: Any, include_self: bool = False) -> List[Any]:
+        """Descendants in pre-order."""
+        return [self.ids[row] for row in self._subtree_rows(ref, include_self).tolist()]
+
+    def subtree_size(self, ref: Any, include_self: bool = False) -> int:
+        row = self._require(ref)
+        return int(self.exit[row] - self.enter[row]) - (0 if include_self else 1)
+
+    def level(self, ref: Any, depth: int) -> List[Any]:
+        """Descendants exactly ``depth`` levels below the node, in pre-order."""
+        rows = self._subtree_rows(ref, include_self=True)
+        wanted = rows[self.depth[rows] == self.depth[self._require(ref)] + depth]
+        return [self.ids[row] for row in wanted.tolist()]
+
+    def max_depth(self, ref: Any) -> int:
+        """Levels between the node and its deepest descendant (0 for a leaf)."""
+        rows = self._subtree_rows(ref, include_self=True)
+        return int(self.depth[rows].max() - self.depth[self._require(ref)])
+
+    def level_sizes(self, ref: Any) -> List[int]:
+        """Number of nodes at each level below the node (index 0 is its children)."""
+        rows = self._subtree_rows(ref, include_self=False)
+        if not rows.size:
+            return []
+        relative = self.depth[rows] - self.depth[self._require(ref)] - 1
+        return np.bincount(relative).tolist()
+
+    def count_by(self, ref: Any, field: str = "type", include_self: bool = False) -> Dict[Any, int]:
+        """Descendants counted by a field's value (e.g. node type)."""
+        counts: Dict[Any, int] = {}
+        for row in self._subtree_rows(ref, include_self).tolist():
+            value = self.nodes[row].get(field)
+            counts[value] = counts.get(value, 0) + 1
+        return counts
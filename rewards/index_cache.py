@@ -0,0 +1,181 @@
+"""
+Persistent cache of the indexes built over a backend-state file.
+
+Hash and text indexes normally live only as long as the BackendDictAdapter
+that built them, so every server restart, CLI run and scanner invocation
+rebuilds them. ``IndexCache`` serializes them next to the state file in a
+``<state file>.indexes/`` directory, one marshal file per state content hash:
+
+    initial-backend-data/default_backend.json
+    initial-backend-data/default_backend.json.indexes/
+        content-hash.json            # size/mtime -> content hash memo
+        <sha256>.marshal             # indexes built for that content
+
+The content hash of a JSON state is the sha256 of its canonical encoding
+(sorted keys, compact separators), the same identity ``scripts/dedupe.py``
+uses, so deduplicated states share a key. ``scripts/sync_backend_ids.py``
+hashes individual documents without their ``_id`` instead, which is not a
+state identity and is not used here. Other files (e.g. compiled ``.bsnap``
+snapshots) are hashed byte for byte.
+
+A cache entry is stale when the state's content hash no longer matches it,
+when it was written by a different cache format or marshal version, or when
+an index's row count doesn't match its collection. Stale entries are ignored,
+rebuilt and replaced by ``warm``. The server warms the indexes of each
+task's initial state this way when it first loads it (see
+``initial_state_backend`` in server.py), so restarts reuse them.
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import tempfile
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+from .backend import BackendDictAdapter
+
+CACHE_DIR_SUFFIX = ".indexes"
+
+_FORMAT_VERSION = 2
+_HASH_MEMO = "content-hash.json"
+_ENTRY_SUFFIX = ".marshal"
+
+
+def state_content_hash(backend_state: Mapping) -> str:
+    """sha256 of a state's canonical JSON encoding (as in scripts/dedupe.py)."""
+    content = json.dumps(backend_state, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def file_content_hash(path: Union[str, Path]) -> str:
+    """Content hash of a state file: canonical JSON hash, or raw bytes for non-JSON files."""
+    path = Path(path)
+    if path.suffix == ".json":
+        with open(path, encoding="utf-8") as f:
+            return state_content_hash(json.load(f))
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class IndexCache:
+    """On-disk index cache for one backend-state file.
+
+    Args:
+        state_path: The backend-state file the indexes are built over.
+        cache_dir: Where to keep cache entries. Defaults to
+            ``<state_path>.indexes`` next to the state.
+    """
+
+    def __init__(self, state_path: Union[str, Path], cache_dir: Optional[Union[str, Path]] = None):
+        self.state_path = Path(state_path)
+        if cache_dir is None:
+            cache_dir = self.state_path.with_name(self.state_path.name + CACHE_DIR_SUFFIX)
+        self.cache_dir = Path(cache_dir)
+
+    def content_hash(self) -> str:
+        """Content hash of the state file.
+
+        Hashing a JSON state means parsing it, so the result is memoized in
+        the cache directory by file size and mtime and only recomputed when
+        either changes.
+        """
+        stat = self.state_path.stat()
+        memo_path = self.cache_dir / _HASH_MEMO
+        try:
+            with open(memo_path, encoding="utf-8") as f:
+                memo = json.load(f)
+            if memo.get("size") == stat.st_size and memo.get("mtime_ns") == stat.st_mtime_ns:
+                return memo["hash"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+        content_hash = file_content_hash(self.state_path)
+        memo = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "hash": content_hash}
+        self._write(memo_path, json.dumps(memo).encode("utf-8"))
+        return content_hash
+
+    def entry_path(self, content_hash: str) -> Path:
+        return self.cache_dir / f"{content_hash}{_ENTRY_SUFFIX}"
+
+    def _write(self, path: Path, data: bytes) -> None:
+        """Atomically replace ``path``; concurrent writers each use their own temp file."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    def load(self, adapter: BackendDictAdapter) -> bool:
+        """Install cached indexes into an adapter built over the state.
+
+        Returns:
+            True if a fresh cache entry existed and every index in it was
+            installed, False if there was no entry or it was stale.
+        """
+        content_hash = self.content_hash()
+        try:
+            with open(self.entry_path(content_hash), "rb") as f:
+                payload = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return False
+
+        if (
+            not isinstance(payload, dict)
+            or payload.get("format") != _FORMAT_VERSION
+            or payload.get("marshal") != marshal.version
+            or payload.get("content_hash") != content_hash
+        ):
+            return False
+        indexes = payload.get("indexes", [])
+        return adapter.import_indexes(indexes) == len(indexes)
+
+    def save(self, adapter: BackendDictAdapter) -> Path:
+        """Write the adapter's current indexes, replacing stale entries.
+
+        Returns:
+            The cache entry path.
+        """
+        content_hash = self.content_hash()
+        payload = {
+            "format": _FORMAT_VERSION,
+            "marshal": marshal.version,
+            "content_hash": content_hash,
+            "indexes": adapter.export_indexes(),
+        }
+        path = self.entry_path(content_hash)
+        self._write(path, marshal.dumps(payload))
+
+        for old in self.cache_dir.glob(f"*{_ENTRY_SUFFIX}"):
+            if old != path:
+                old.unlink(missing_ok=True)
+        return path
+
+    def warm(self, adapter: BackendDictAdapter, build: Callable[[BackendDictAdapter], None]) -> bool:
+        """Load cached indexes, build whatever is missing and save if anything was built.
+
+        ``build`` declares the indexes the caller needs, e.g.
+        ``lambda a: a.create_text_index("posts", ["title"])``. Indexes loaded
+        from the cache are reused by ``create_index``/``create_text_index``,
+        so on a warm start it costs nothing.
+
+        Returns:
+            True if every index came from the cache.
+        """
+        loaded = self.load(adapter)
+        before = set(adapter.built_indexes()) if loaded else None
+        build(adapter)
+        if loaded and set(adapter.built_indexes()) == before:
+            return True
+        self.save(adapter)
+        return False
@@ -0,0 +1,49 @@
+"""
+Filter matching shared by the in-memory backends.
+
+A filter is a flat dict of ``field -> condition``. A condition is either a
+literal (exact match) or a dict using one of the supported operators
+(``$in``, ``$regex`` with optional ``$options``). Unknown operator dicts are
+compared as literals. A missing field behaves like ``None``.
+
+As in MongoDB, ``$in`` also matches an array field when any of its
+elements is one of the listed values. Literal conditions compare whole
+values.
+"""
+
+import re
+from typing import Any, Dict
+
+
+def value_matches(item_value: Any, condition: Any) -> bool:
+    """Check a single document value against a filter condition."""
+    if isinstance(condition, dict):
+        # Handle $in operator
+        if "$in" in condition:
+            candidates = condition.get("$in", [])
+            if item_value in candidates:
+                return True
+            return isinstance(item_value, list) and any(element in candidates for element in item_value)
+        # Handle $regex operator
+        if "$regex" in condition:
+            pattern = condition.get("$regex", "")
+            options = condition.get("$options", "")
+            flags = 0
+            if "i" in options:
+                flags |= re.IGNORECASE
+            if not isinstance(item_value, str):
+                item_value = str(item_value) if item_value is not None else ""
+            try:
+                return re.search(pattern, item_value, flags) is not None
+            except re.error:
+                return False
+    # Literal value (or unknown operator, treated as exact match)
+    return not (item_value != condition)
+
+
+def document_matches(item: Dict[str, Any], filter_dict: Dict[str, Any]) -> bool:
+    """Check whether a document satisfies every condition in the filter."""
+    for key, condition in filter_dict.items():
+        if not value_matches(item.get(key), condition):
+            return False
+    return True
@@ -0,0 +1,194 @@
+"""
+Per-query statistics for the in-memory backend.
+
+Every query is summarised by its collection and filter *shape* (field names
+and operators, with values elided). The report aggregates queries by shape
+so it shows which fields are filtered on without an index, which queries
+scan whole collections, how often the exact same query was repeated and
+where $regex work happens.
+
+Repeats are detected by remembering each shape's distinct filters, up to
+``MAX_TRACKED_FILTERS`` per shape and thread; filters seen after that are
+counted as distinct, so ``distinct``/``repeated`` are exact only below the
+cap.
+"""
+
+import json
+import threading
+from typing import Any, Dict, List, Optional, Set, TypedDict
+
+MAX_TRACKED_FILTERS = 1024
+
+
+class QueryStats(TypedDict):
+    collection: Any
+    filter: Dict[str, Any]
+    strategy: str  # "index", "columnar", "scan" or "missing"
+    index: Optional[str]  # e.g. "hash:_id" or "text:title"
+    scanned: int
+    matched: int
+    time_ms: float
+
+
+class QueryShapeReport(TypedDict):
+    collection: Any
+    shape: str
+    count: int
+    distinct: int
+    repeated: int
+    scanned: int
+    matched: int
+    time_ms: float
+    strategies: Dict[str, int]
+    indexes: Dict[str, int]
+    uses_regex: bool
+
+
+def filter_shape(filter_dict: Dict[str, Any]) -> str:
+    """Describe a filter by its fields and operators, e.g. 'title:$regex,_id:eq'."""
+    parts = []
+    for key in sorted(filter_dict):
+        condition = filter_dict[key]
+        if isinstance(condition, dict) and ("$in" in condition or "$regex" in condition):
+            operator = "$in" if "$in" in condition else "$regex"
+        else:
+            operator = "eq"
+        parts.append(f"{key}:{operator}")
+    return ",".join(parts) or "<all>"
+
+
+def _filter_key(filter_dict: Dict[str, Any]) -> str:
+    return json.dumps(filter_dict, sort_keys=True, default=repr)
+
+
+class _ThreadBuffer:
+    """Stats recorded by one thread."""
+
+    def __init__(self) -> None:
+        # Only ever contended by report/reset, never by another recorder
+        self.lock = threading.Lock()
+        self.shapes: Dict[Any, QueryShapeReport] = {}
+        self.seen: Dict[Any, Set[str]] = {}
+        # Distinct-looking queries past MAX_TRACKED_FILTERS, per shape
+        self.untracked: Dict[Any, int] = {}
+
+
+class QueryStatsRecorder:
+    """Aggregates QueryStats by (collection, filter shape).
+
+    ``record`` is called on the query path from any number of threads, so
+    each thread writes to its own buffer under that buffer's own lock;
+    ``report`` and ``reset`` take each buffer's lock in turn, so they are
+    safe to call while queries run.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._buffers: List[_ThreadBuffer] = []
+        self._buffers_lock = threading.Lock()
+
+    def _buffer(self) -> _ThreadBuffer:
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            buffer = _ThreadBuffer()
+            with self._buffers_lock:
+                self._buffers.append(buffer)
+            self._local.buffer = buffer
+        return buffer
+
+    def record(self, stats: QueryStats) -> None:
+        buffer = self._buffer()
+        shape = filter_shape(stats["filter"])
+        key = (stats["collection"], shape)
+        filter_key = _filter_key(stats["filter"])
+        with buffer.lock:
+            report = buffer.shapes.get(key)
+            if report is None:
+                report = _empty_report(stats["collection"], shape)
+                buffer.shapes[key] = report
+                buffer.seen[key] = set()
+
+            report["count"] += 1
+            seen = buffer.seen[key]
+            if filter_key in seen:
+                report["repeated"] += 1
+            else:
+                if len(seen) < MAX_TRACKED_FILTERS:
+                    seen.add(filter_key)
+                else:
+                    buffer.untracked[key] = buffer.untracked.get(key, 0) + 1
+                report["distinct"] += 1
+            report["scanned"] += stats["scanned"]
+            report["matched"] += stats["matched"]
+            report["time_ms"] += stats["time_ms"]
+            report["strategies"][stats["strategy"]] = report["strategies"].get(stats["strategy"], 0) + 1
+            if stats["index"]:
+                report["indexes"][stats["index"]] = report["indexes"].get(stats["index"], 0) + 1
+
+    def report(self) -> List[QueryShapeReport]:
+        """Aggregated stats per query shape, most expensive first."""
+        with self._buffers_lock:
+            buffers = list(self._buffers)
+
+        merged: Dict[Any, QueryShapeReport] = {}
+        seen: Dict[Any, Set[str]] = {}
+        untracked: Dict[Any, int] = {}
+        for buffer in buffers:
+            with buffer.lock:
+                self._merge(buffer, merged, seen, untracked)
+
+        for key, total in merged.items():
+            total["distinct"] = min(len(seen[key]) + untracked[key], total["count"])
+            total["repeated"] = total["count"] - total["distinct"]
+        return sorted(
+            merged.values(),
+            key=lambda report: report["time_ms"],
+            reverse=True,
+        )
+
+    @staticmethod
+    def _merge(
+        buffer: _ThreadBuffer,
+        merged: Dict[Any, QueryShapeReport],
+        seen: Dict[Any, Set[str]],
+        untracked: Dict[Any, int],
+    ) -> None:
+        """Add one buffer's stats into the running totals (caller holds its lock)."""
+        for key, report in buffer.shapes.items():
+            total = merged.get(key)
+            if total is None:
+                total = merged[key] = _empty_report(report["collection"], report["shape"])
+                seen[key] = set()
+            for field in ("count", "scanned", "matched", "time_ms"):
+                total[field] += report[field]
+            for name, count in report["strategies"].items():
+                total["strategies"][name] = total["strategies"].get(name, 0) + count
+            for name, count in report["indexes"].items():
+                total["indexes"][name] = total["indexes"].get(name, 0) + count
+            seen[key].update(buffer.seen.get(key, ()))
+            untracked[key] = untracked.get(key, 0) + buffer.untracked.get(key, 0)
+
+    def reset(self) -> None:
+        with self._buffers_lock:
+            buffers = list(self._buffers)
+        for buffer in buffers:
+            with buffer.lock:
+                buffer.shapes.clear()
+                buffer.seen.clear()
+                buffer.untracked.clear()
+
+
+def _empty_report(collection: Any, shape: str) -> QueryShapeReport:
+    return QueryShapeReport(
+        collection=collection,
+        shape=shape,
+        count=0,
+        distinct=0,
+        repeated=0,
+        scanned=0,
+        matched=0,
+        time_ms=0.0,
+        strategies={},
+        indexes={},
+        uses_regex="$regex" in shape,
+    )
@@ -0,0 +1,127 @@
+"""
+Registry of reward functions and their static metadata.
+
+Reward functions register themselves with the ``reward`` decorator at
+import time:
+
+    @reward(cost="answer")
+    def _validate_figma_button_component_variants(backend, frontend_final_state, final_answer):
+        ...
+
+Registration records what the dispatcher needs without looking at the
+function again per request:
+
+    name            Registered name (defaults to the function name).
+    arity           Number of parameters; 2-argument rewards don't take the
+                    final answer.
+    collections     Backend collections the reward reads, for prefetching.
+    answer_schema   Expected shape of the final answer JSON, if declared.
+    cost            "answer" for rewards that only look at the final answer
+                    (safe to cache per answer, no backend round trips),
+                    "backend" for rewards that query the backend.
+    check_spec_task Task id of the check spec the reward scores with, for
+                    rewards that are nothing but a check spec.
+
+``RewardSpec.call(backend, frontend_state, final_answer)`` is specialized
+for the arity once, so callers always pass three arguments.
+
+The registry lives in this module, so reloading the ``rewards`` package
+(as the server does) starts from an empty registry.
+"""
+
+import inspect
+from typing import Any, Callable, Dict, Literal, Optional, Sequence, Tuple
+
+CostHint = Literal["answer", "backend"]
+COST_HINTS: Tuple[CostHint, ...] = ("answer", "backend")
+
+RewardFunc = Callable[..., Dict[str, Any]]
+
+
+class RewardSpec:
+    """A reward function with its registration metadata."""
+
+    __slots__ = ("name", "func", "arity", "collections", "answer_schema", "cost", "check_spec_task", "call")
+
+    def __init__(
+        self,
+        func: RewardFunc,
+        name: Optional[str] = None,
+        collections: Sequence[str] = (),
+        answer_schema: Optional[Dict[str, Any]] = None,
+        cost: CostHint = "backend",
+        check_spec_task: Optional[str] = None,
+    ):
+        if cost not in COST_HINTS:
+            raise ValueError(f"Unknown cost hint {cost!r}, expected one of {COST_HINTS}")
+        self.name = name or func.__name__
+        self.func = func
+        self.arity = len(inspect.signature(func).parameters)
+        self.collections = tuple(collections)
+        self.answer_schema = answer_schema
+        self.cost = cost
+        self.check_spec_task = check_spec_task
+        if self.arity >= 3:
+            self.call: Callable[[Any, Dict[str, Any], str], Dict[str, Any]] = func
+        else:
+            self.call = lambda backend, frontend_state, final_answer: func(backend, frontend_state)
+
+    def describe(self) -> Dict[str, Any]:
+        """JSON-serializable metadata (everything but the function)."""
+        return {
+            "name": self.name,
+            "arity": self.arity,
+            "collections": list(self.collections),
+            "answer_schema": self.answer_schema,
+            "cost": self.cost,
+            "check_spec_task": self.check_spec_task,
+        }
+
+    def __repr__(self) -> str:
+        return f"RewardSpec({self.name!r}, arity={self.arity}, cost={self.cost!r})"
+
+
+_registry: Dict[str, RewardSpec] = {}
+
+
+def register(spec: RewardSpec) -> RewardSpec:
+    """Add a spec to the registry, replacing any earlier one with the same name."""
+    _registry[spec.name] = spec
+    return spec
+
+
+def reward(
+    name: Optional[str] = None,
+    *,
+    collections: Sequence[str] = (),
+    answer_schema: Optional[Dict[str, Any]] = None,
+    cost: Optional[CostHint] = None,
+    check_spec: Optional[str] = None,
+) -> Callable[[RewardFunc], RewardFunc]:
+    """Register the decorated reward function; the function itself is returned unchanged.
+
+    ``check_spec`` marks a reward that only scores the answer against that
+    task's check spec. ``cost`` defaults to "answer" for those and to
+    "backend" otherwise.
+    """
+    def decorate(func: RewardFunc) -> RewardFunc:
+        register(RewardSpec(
+            func,
+            name=name,
+            collections=collections,
+            answer_schema=answer_schema,
+            cost=cost or ("answer" if check_spec is not None else "backend"),
+            check_spec_task=check_spec,
+        ))
+        return func
+
+    return decorate
+
+
+def registered() -> Dict[str, RewardSpec]:
+    """All registered rewards by name."""
+    return dict(_registry)
+
+
+def get_reward(name: str) -> Optional[RewardSpec]:
+    return _registry.get(name)
@@ -0,0 +1,128 @@
+"""
+Scoring modes for reward functions.
+
+Validators report every check as a "[✓]" / "[X]" message, which is what a
+person debugging a task wants. Training callers only read ``score``, and
+since scores are binary the first failed check already decides it. Two
+modes are supported:
+
+    verbose     Run every check and return both message lists (default).
+    fail_fast   Stop at the first failed check. Success messages are
+                dropped and only the first error is returned.
+
+Validators get their lists from ``message_lists()`` instead of creating
+them, so the same code runs in either mode:
+
+    checks_passed, errors = message_lists()
+
+In fail-fast mode ``checks_passed`` discards what is appended to it and
+appending to ``errors`` raises ``ScoringStopped``, which skips the rest of
+the validator (including later ground-truth lookups and message
+formatting). ``ScoringStopped`` derives from BaseException so the
+validators' ``except Exception`` blocks don't swallow it; ``run_scored``
+catches it and turns it into a 0.0 score.
+
+An f-string is formatted before ``append`` can discard it, so validators
+guard formatted success messages with ``collects``:
+
+    collecting = collects(checks_passed)
+    ...
+    if collecting:
+        checks_passed.append(f"[✓] {label} at ({x},{y})")
+
+The mode is held in a context variable, so concurrent requests can score
+in different modes:
+
+    result = run_scored(lambda: reward_fn(backend, state, answer), FAIL_FAST)
+"""
+
+import contextlib
+import contextvars
+from typing import Any, Callable, Dict, Iterator, List, Literal, Tuple
+
+ScoringMode = Literal["verbose", "fail_fast"]
+
+VERBOSE: ScoringMode = "verbose"
+FAIL_FAST: ScoringMode = "fail_fast"
+SCORING_MODES: Tuple[ScoringMode, ...] = (VERBOSE, FAIL_FAST)
+
+_mode: "contextvars.ContextVar[ScoringMode]" = contextvars.ContextVar("scoring_mode", default=VERBOSE)
+
+
+class ScoringStopped(BaseException):
+    """Raised in fail-fast mode by the first appended error message."""
+
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+
+
+class DiscardedMessages(list):
+    """A message list that stays empty; used for success messages in fail-fast mode."""
+
+    __slots__ = ()
+
+    def append(self, message: Any) -> None:
+        pass
+
+    def extend(self, messages: Any) -> None:
+        pass
+
+
+class _FailFastErrors(list):
+    __slots__ = ()
+
+    def append(self, message: Any) -> None:
+        raise ScoringStopped(str(message))
+
+    def extend(self, messages: Any) -> None:
+        for message in messages:
+            self.append(message)
+
+
+def current_mode() -> ScoringMode:
+    return _mode.get()
+
+
+def message_lists() -> Tuple[List[str], List[str]]:
+    """(checks_passed, errors) lists for the current scoring mode."""
+    if _mode.get() == FAIL_FAST:
+        return DiscardedMessages(), _FailFastErrors()
+    return [], []
+
+
+def collects(messages: List[str]) -> bool:
+    """False for a list that discards its messages, so callers can skip formatting them."""
+    return not isinstance(messages, DiscardedMessages)
+
+
+@contextlib.contextmanager
+def scoring_mode(mode: ScoringMode) -> Iterator[None]:
+    """Score in ``mode`` within the block.
+
+    Raises:
+        ValueError: If mode is not one of SCORING_MODES.
+    """
+    if mode not in SCORING_MODES:
+        raise ValueError(f"Unknown scoring mode {mode!r}, expected one of {SCORING_MODES}")
+    token = _mode.set(mode)
+    try:
+        yield
+    finally:
+        _mode.reset(token)
+
+
+def run_scored(call: Callable[[], Dict[str, Any]], mode: ScoringMode = VERBOSE) -> Dict[str, Any]:
+    """Call a reward function in ``mode`` and return its TaskScore-shaped result.
+
+    A fail-fast stop is returned as a 0.0 score whose only message is the
+    first error.
+    """
+    with scoring_mode(mode):
+        try:
+            return call()
+        except ScoringStopped as stop:
+            return {
+                "score": 0.0,
+                "metadata": {"success_accumulator": [], "error_accumulator": [stop.message]},
+            }
@@ -0,0 +1,266 @@
+"""
+Shared read-only backend snapshots with copy-on-write overlays.
+
+A BackendSnapshot holds one frozen copy of a backend state. It never changes
+after construction, so any number of threads can read it concurrently, and
+worker processes forked after it is loaded share its pages (call
+``gc.freeze()`` before forking to keep the collector from touching them).
+
+Each verification that needs to modify state takes a SnapshotOverlay. The
+overlay shares every collection with the snapshot and records writes as
+per-collection deltas (replaced, deleted and inserted documents), merged
+when the collection is read. Memory therefore scales with the number of
+distinct snapshots plus the size of each overlay's changes, not with the
+number of concurrent verifications, and a write costs no more than finding
+the documents it touches.
+
+Both types are read-only Mappings of collection name to document list and
+can be passed straight to BackendDictAdapter.
+"""
+
+import threading
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .frozen import freeze
+from .query_filter import document_matches
+
+
+class BackendSnapshot(Mapping):
+    """Immutable backend state that can be shared between verifications."""
+
+    def __init__(self, backend_state: Mapping):
+        self._collections: Dict[str, Any] = {
+            name: freeze(value) for name, value in backend_state.items()
+        }
+
+    def __getitem__(self, collection: str) -> Any:
+        return self._collections[collection]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._collections)
+
+    def __len__(self) -> int:
+        return len(self._collections)
+
+    def overlay(self) -> "SnapshotOverlay":
+        """Create a fresh copy-on-write overlay on top of this snapshot."""
+        return SnapshotOverlay(self)
+
+
+# Placeholder for an inserted document deleted during a delete() pass
+_DELETED: Any = object()
+
+
+class OverlayDelta:
+    """Changes an overlay made to one collection, relative to its base list.
+
+    ``rows`` maps base row numbers to their replacement document, or None
+    for deleted rows; ``inserted`` holds the documents added after the base
+    rows, in insertion order.
+    """
+
+    __slots__ = ("base", "rows", "inserted")
+
+    def __init__(self, base: List[Any]):
+        self.base = base
+        self.rows: Dict[int, Optional[Dict[str, Any]]] = {}
+        self.inserted: List[Dict[str, Any]] = []
+
+    def current(self) -> Iterator[Tuple[int, Any]]:
+        """(position, document) in collection order.
+
+        Positions below ``len(base)`` are base rows; inserted documents
+        follow at ``len(base) + i``.
+        """
+        rows = self.rows
+        for row, item in enumerate(self.base):
+            if row in rows:
+                item = rows[row]
+                if item is None:
+                    continue
+            yield row, item
+        offset = len(self.base)
+        for i, item in enumerate(self.inserted):
+            yield offset + i, item
+
+    def set(self, position: int, document: Optional[Dict[str, Any]]) -> None:
+        """Replace the document at a position from ``current``; None deletes it."""
+        offset = len(self.base)
+        if position < offset:
+            self.rows[position] = document
+        elif document is not None:
+            self.inserted[position - offset] = document
+        else:
+            self.inserted[position - offset] = _DELETED
+
+    def changed(self) -> Iterator[Tuple[int, Any]]:
+        """(position, document) of replaced and inserted documents, in collection order."""
+        for row in sorted(self.rows):
+            item = self.rows[row]
+            if item is not None:
+                yield row, item
+        offset = len(self.base)
+        for i, item in enumerate(self.inserted):
+            yield offset + i, item
+
+    def merged(self) -> List[Any]:
+        return [item for _, item in self.current()]
+
+
+class SnapshotOverlay(Mapping):
+    """Per-verification writable view over a BackendSnapshot.
+
+    Any read-only Mapping works as the base, e.g. a SnapshotFile opened with
+    ``frozen=True``.
+
+    Writes never touch the snapshot or copy a collection: each collection
+    keeps an OverlayDelta (replaced, deleted and inserted documents) on top
+    of its base list. Reading a changed collection merges the delta into a
+    new list, cached until the next write to that collection.
+    BackendDictAdapter queries the base list and the delta separately (see
+    ``delta``), so indexes and columnar stores built on the base survive
+    writes.
+    """
+
+    def __init__(self, snapshot: Mapping):
+        self.snapshot = snapshot
+        self._replaced: Dict[str, List[Any]] = {}
+        self._deltas: Dict[str, OverlayDelta] = {}
+        self._merged: Dict[str, List[Any]] = {}
+        self._inserted: Dict[str, List[Dict[str, Any]]] = {}
+        self._updated: Dict[str, List[Dict[str, Any]]] = {}
+        self._deleted: Dict[str, List[Dict[str, Any]]] = {}
+
+    def _base(self, collection: str) -> Any:
+        if collection in self._replaced:
+            return self._replaced[collection]
+        return self.snapshot[collection]
+
+    def __getitem__(self, collection: str) -> Any:
+        delta = self._deltas.get(collection)
+        if delta is None:
+            return self._base(collection)
+        merged = self._merged.get(collection)
+        if merged is None:
+            merged = self._merged[collection] = delta.merged()
+        return merged
+
+    def __contains__(self, collection: object) -> bool:
+        return collection in self._deltas or collection in self._replaced or collection in self.snapshot
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.snapshot
+        added = [name for name in dict.fromkeys(list(self._replaced) + list(self._deltas)) if name not in self.snapshot]
+        yield from added
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def base(self, collection: str) -> Optional[List[Any]]:
+        """The list a collection's delta applies to (None if not a list)."""
+        base = self._base(collection) if collection in self._replaced or collection in self.snapshot else []
+        return base if isinstance(base, list) else None
+
+    def delta(self, collection: str) -> Optional[OverlayDelta]:
+        """The collection's changes since its base list, or None if unchanged."""
+        return self._deltas.get(collection)
+
+    def _delta_for_write(self, collection: str) -> Optional[OverlayDelta]:
+        delta = self._deltas.get(collection)
+        if delta is None:
+            base = self.base(collection)
+            if base is None:
+                return None
+            delta = self._deltas[collection] = OverlayDelta(base)
+        self._merged.pop(collection, None)
+        return delta
+
+    def insert(self, collection: str, document: Dict[str, Any]) -> None:
+        """Add a document to a collection."""
+        delta = self._delta_for_write(collection)
+        if delta is None:
+            # Not a document list; start the collection over as one
+            delta = self._deltas[collection] = OverlayDelta([])
+        document = dict(document)
+        delta.inserted.append(document)
+        self._inserted.setdefault(collection, []).append(document)
+
+    def update(self, collection: str, filter_dict: Dict[str, Any], changes: Dict[str, Any]) -> int:
+        """Shallow-merge changes into every matching document. Returns the count."""
+        delta = self._delta_for_write(collection)
+        if delta is None:
+            return 0
+        count = 0
+        for position, item in list(delta.current()):
+            if isinstance(item, dict) and document_matches(item, filter_dict):
+                updated = dict(item)
+                updated.update(changes)
+                delta.set(position, updated)
+                self._updated.setdefault(collection, []).append(updated)
+                count += 1
+        return count
+
+    def delete(self, collection: str, filter_dict: Dict[str, Any]) -> int:
+        """Remove every matching document. Returns the count."""
+        delta = self._delta_for_write(collection)
+        if delta is None:
+            return 0
+        removed = []
+        for position, item in list(delta.current()):
+            if isinstance(item, dict) and document_matches(item, filter_dict):
+                removed.append(item)
+                delta.set(position, None)
+        if removed:
+            delta.inserted = [item for item in delta.inserted if item is not _DELETED]
+            self._deleted.setdefault(collection, []).extend(removed)
+        return len(removed)
+
+    def replace(self, collection: str, documents: List[Dict[str, Any]]) -> None:
+        """Replace a whole collection, e.g. with a final-state dump.
+
+        Replacements are not itemised in ``diff()``.
+        """
+        self._replaced[collection] = list(documents)
+        self._deltas.pop(collection, None)
+        self._merged.pop(collection, None)
+
+    def diff(self) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+        """Return the inserted, updated and deleted documents per collection."""
+        changes: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        for kind, per_collection in (
+            ("inserted", self._inserted),
+            ("updated", self._updated),
+            ("deleted", self._deleted),
+        ):
+            for collection, documents in per_collection.items():
+                changes.setdefault(collection, {})[kind] = list(documents)
+        return changes
+
+
+_snapshots: Dict[str, BackendSnapshot] = {}
+_snapshots_lock = threading.Lock()
+
+
+def shared_snapshot(key: str, load_state: Callable[[], Mapping]) -> BackendSnapshot:
+    """Return the process-wide snapshot for a key, loading it on first use.
+
+    ``load_state`` runs at most once per key, even when several threads ask
+    for the same snapshot at the same time.
+    """
+    snapshot = _snapshots.get(key)
+    if snapshot is not None:
+        return snapshot
+    with _snapshots_lock:
+        snapshot = _snapshots.get(key)
+        if snapshot is None:
+            snapshot = BackendSnapshot(load_state())
+            _snapshots[key] = snapshot
+        return snapshot
+
+
+def release_snapshot(key: str) -> None:
+    """Drop the process-wide snapshot for a key, if loaded."""
+    with _snapshots_lock:
+        _snapshots.pop(key, None)
+
@@ -0,0 +1,191 @@
+"""
+Compact binary snapshot format for initial backend states.
+
+``compile_snapshot`` converts a backend-state JSON file (or dict) into a
+single ``.bsnap`` file: one marshal-encoded blob per collection, optional
+precomputed hash indexes per collection, and a JSON table of contents in a
+footer. ``open_snapshot`` maps the file with mmap and decodes a collection
+only the first time it is accessed, so opening a multi-GB state is
+effectively free and callers only pay for the collections they touch.
+
+Layout:
+    [collection and index blobs ...][header JSON][trailer]
+    trailer = magic, format version, marshal version, header offset, header length
+
+A SnapshotFile is a read-only Mapping of collection name to documents and
+can be passed to BackendDictAdapter, which picks up the precomputed indexes.
+"""
+
+import json
+import marshal
+import mmap
+import os
+import struct
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Union
+
+from .frozen import freeze
+from .hash_index import HashIndex
+
+SNAPSHOT_SUFFIX = ".bsnap"
+
+_MAGIC = b"DOJOSNAP"
+_FORMAT_VERSION = 1
+_TRAILER = struct.Struct("<8sIIQQ")
+
+
+class SnapshotFormatError(ValueError):
+    """Raised when a file is not a readable backend snapshot."""
+
+
+def compile_snapshot(
+    backend_state: Union[str, Path, Mapping],
+    output_path: Union[str, Path],
+    index_fields: Iterable[str] = ("_id",),
+) -> Path:
+    """Write a backend state to a binary snapshot file.
+
+    Args:
+        backend_state: Path to a backend-state JSON file, or the state itself.
+        output_path: Destination ``.bsnap`` file.
+        index_fields: Fields to build hash indexes for in every list
+            collection that has them.
+
+    Returns:
+        The output path.
+    """
+    if not isinstance(backend_state, Mapping):
+        with open(backend_state, encoding="utf-8") as f:
+            backend_state = json.load(f)
+
+    output_path = Path(output_path)
+    index_fields = list(index_fields)
+    collections: Dict[str, Dict[str, Any]] = {}
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+
+    with open(tmp_path, "wb") as out:
+
+        def write_blob(value: Any) -> Dict[str, int]:
+            data = marshal.dumps(value)
+            entry = {"offset": out.tell(), "length": len(data)}
+            out.write(data)
+            return entry
+
+        for name, value in backend_state.items():
+            entry = write_blob(value)
+            entry["indexes"] = {}
+            if isinstance(value, list):
+                for field in index_fields:
+                    if not any(isinstance(doc, dict) and field in doc for doc in value):
+                        continue
+                    index = HashIndex(value, field)
+                    entry["indexes"][field] = write_blob(
+                        [index.rows, index.unhashable_rows, index.size]
+                    )
+            collections[name] = entry
+
+        header = json.dumps({"collections": collections}).encode("utf-8")
+        header_offset = out.tell()
+        out.write(header)
+        out.write(_TRAILER.pack(_MAGIC, _FORMAT_VERSION, marshal.version, header_offset, len(header)))
+
+    os.replace(tmp_path, output_path)
+    return output_path
+
+
+class SnapshotFile(Mapping):
+    """Lazily decoded, memory-mapped backend snapshot.
+
+    Args:
+        path: The ``.bsnap`` file.
+        frozen: Return read-only documents (FrozenDict/FrozenList), which is
+            safer when the snapshot is shared between threads but costs an
+            extra pass over each collection on first access.
+    """
+
+    def __init__(self, path: Union[str, Path], frozen: bool = False):
+        self.path = Path(path)
+        self.frozen = frozen
+        with open(self.path, "rb") as f:
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                raise SnapshotFormatError(f"{self.path} is empty") from e
+
+        if len(self._mmap) < _TRAILER.size:
+            raise SnapshotFormatError(f"{self.path} is too small to be a snapshot")
+        magic, version, marshal_version, header_offset, header_length = _TRAILER.unpack(
+            self._mmap[-_TRAILER.size:]
+        )
+        if magic != _MAGIC:
+            raise SnapshotFormatError(f"{self.path} is not a backend snapshot")
+        if version != _FORMAT_VERSION or marshal_version != marshal.version:
+            raise SnapshotFormatError(
+                f"{self.path} was written with format {version}/marshal {marshal_version}, "
+                f"expected {_FORMAT_VERSION}/marshal {marshal.version}; recompile it"
+            )
+
+        header = json.loads(self._mmap[header_offset:header_offset + header_length])
+        self._entries: Dict[str, Dict[str, Any]] = header["collections"]
+        self._decoded: Dict[str, Any] = {}
+        self._indexes: Dict[Any, HashIndex] = {}
+        self._lock = threading.Lock()
+
+    def _load_blob(self, entry: Dict[str, int]) -> Any:
+        view = memoryview(self._mmap)[entry["offset"]:entry["offset"] + entry["length"]]
+        try:
+            return marshal.loads(view)
+        finally:
+            view.release()
+
+    def __getitem__(self, collection: str) -> Any:
+        if collection in self._decoded:
+            return self._decoded[collection]
+        entry = self._entries[collection]
+        with self._lock:
+            if collection not in self._decoded:
+                value = self._load_blob(entry)
+                self._decoded[collection] = freeze(value) if self.frozen else value
+        return self._decoded[collection]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, collection: object) -> bool:
+        return collection in self._entries
+
+    def indexed_fields(self) -> Dict[str, list]:
+        """Collection name -> fields with a precomputed hash index."""
+        return {
+            name: list(entry["indexes"])
+            for name, entry in self._entries.items()
+            if entry["indexes"]
+        }
+
+    def hash_index(self, collection: str, field: str) -> Optional[HashIndex]:
+        """Return the precomputed hash index for a field, or None."""
+        key = (collection, field)
+        if key in self._indexes:
+            return self._indexes[key]
+        entry = self._entries.get(collection, {}).get("indexes", {}).get(field)
+        if entry is None:
+            return None
+        with self._lock:
+            if key not in self._indexes:
+                rows, unhashable_rows, size = self._load_blob(entry)
+                self._indexes[key] = HashIndex.from_rows(field, rows, unhashable_rows, size)
+        return self._indexes[key]
+
+    def close(self) -> None:
+        """Unmap the file. Already decoded collections stay usable."""
+        self._mmap.close()
+
+
+def open_snapshot(path: Union[str, Path], frozen: bool = False) -> SnapshotFile:
+    """Open a compiled backend snapshot."""
+    return SnapshotFile(path, frozen=frozen)
@@ -0,0 +1,351 @@
+"""
+Uniform-grid spatial index over Figma node bounding boxes.
+
+Canvas tasks have spatial ground truth: which stickies sit inside which
+section, which nodes touch, which is nearest, which share a row. Answering
+those by comparing every pair of nodes is O(n²) on large boards. A
+SpatialIndex buckets node boxes into square grid cells once, so each query
+only looks at the cells it overlaps:
+
+    index = spatial_index_for_file(backend, "file-5")
+    inside = index.contained_in(index.box_of("section-1"))
+    row = index.band("sticky-3", axis="row")
+    closest = index.nearest((120, 80), k=3)
+
+Queries return node ids (the ``_id`` field) in ascending order of their
+position in the source list, or by distance for ``nearest``. Boxes use
+``x``/``y``/``width``/``height`` fields, falling back to a nested
+``absoluteBoundingBox``; nodes without a complete box are not indexed.
+"""
+
+import threading
+import weakref
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .backend import Backend
+from .geometry import HEIGHT, WIDTH, X, Y, boxes_from
+
+Box = Tuple[float, float, float, float]
+
+# Boxes spanning more cells than this are kept in a separate list that every
+# query checks, so one huge background frame doesn't fill the whole grid.
+_MAX_CELLS_PER_BOX = 64
+
+
+def _node_box(node: Mapping[str, Any]) -> Mapping[str, Any]:
+    if all(field in node for field in ("x", "y", "width", "height")):
+        return node
+    box = node.get("absoluteBoundingBox")
+    return box if isinstance(box, Mapping) else node
+
+
+class SpatialIndex:
+    """Grid of node boxes supporting containment, intersection, k-nearest and band queries.
+
+    Args:
+        nodes: Node documents.
+        cell_size: Grid cell size in pixels. Defaults to the median of the
+            nodes' larger dimension, which keeps a typical node in 1-4 cells.
+        absolute: Treat ``x``/``y`` as relative to the parent node (found
+            through ``parent_field``) and convert them to canvas coordinates.
+        id_field: Field holding the node id.
+        parent_field: Field holding the parent node id.
+    """
+
+    def __init__(
+        self,
+        nodes: Iterable[Any],
+        cell_size: Optional[float] = None,
+        absolute: bool = False,
+        id_field: str = "_id",
+        parent_field: str = "parentId",
+    ):
+        documents = [node for node in nodes if isinstance(node, Mapping)]
+        boxes = boxes_from([_node_box(node) for node in documents])
+        if absolute:
+            boxes = _to_absolute(documents, boxes, id_field, parent_field)
+
+        valid = np.isfinite(boxes).all(axis=1) & (boxes[:, WIDTH] >= 0) & (boxes[:, HEIGHT] >= 0)
+        self.nodes: List[Mapping[str, Any]] = [doc for doc, ok in zip(documents, valid) if ok]
+        self.boxes: np.ndarray = boxes[valid]
+        self.ids: List[Any] = [node.get(id_field) for node in self.nodes]
+        self._row_of: Dict[Any, int] = {node_id: row for row, node_id in enumerate(self.ids)}
+
+        if cell_size is None:
+            sizes = np.maximum(self.boxes[:, WIDTH], self.boxes[:, HEIGHT])
+            cell_size = float(np.median(sizes)) if sizes.size else 1.0
+        self.cell_size = max(float(cell_size), 1.0)
+
+        self._cells: Dict[Tuple[int, int], np.ndarray] = {}
+        self._large = np.empty(0, dtype=np.int64)
+        self._cell_bounds = (0, 0, 0, 0)
+        self._build()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _cell_ranges(self, boxes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        size = self.cell_size
+        x0 = np.floor(boxes[:, X] / size).astype(np.int64)
+        y0 = np.floor(boxes[:, Y] / size).astype(np.int64)
+        x1 = np.floor((boxes[:, X] + boxes[:, WIDTH]) / size).astype(np.int64)
+        y1 = np.floor((boxes[:, Y] + boxes[:, HEIGHT]) / size).astype(np.int64)
+        return x0, y0, x1, y1
+
+    def _build(self) -> None:
+        if not len(self.boxes):
+            return
+        x0, y0, x1, y1 = self._cell_ranges(self.boxes)
+        spans_x = x1 - x0 + 1
+        spans_y = y1 - y0 + 1
+        counts = spans_x * spans_y
+        large = counts > _MAX_CELLS_PER_BOX
+        self._large = np.flatnonzero(large)
+
+        rows = np.flatnonzero(~large)
+        counts = counts[rows]
+        total = int(counts.sum())
+        if not total:
+            return
+        # Expand every (box, cell) pair without a Python loop over boxes
+        owner = np.repeat(rows, counts)
+        offset = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        width = spans_x[owner]
+        cell_x = x0[owner] + offset % width
+        cell_y = y0[owner] + offset // width
+
+        order = np.lexsort((owner, cell_y, cell_x))
+        cell_x, cell_y, owner = cell_x[order], cell_y[order], owner[order]
+        boundaries = np.flatnonzero((np.diff(cell_x) != 0) | (np.diff(cell_y) != 0)) + 1
+        starts = np.concatenate(([0], boundaries))
+        for start, members in zip(starts.tolist(), np.split(owner, boundaries)):
+            self._cells[(int(cell_x[start]), int(cell_y[start]))] = members
+        self._cell_bounds = (int(cell_x.min()), int(cell_y.min()), int(cell_x.max()), int(cell_y.max()))
+
+    def _candidates(self, box: Box, margin: float = 0) -> np.ndarray:
+        """Rows whose cells overlap the box grown by ``margin`` (a superset of the real matches).
+
+        Queries with a tolerance pass it as the margin, so nodes up to that
+        far outside the box are still looked up when it exceeds a cell.
+        """
+        margin = max(margin, 0)
+        grown = (box[0] - margin, box[1] - margin, box[2] + 2 * margin, box[3] + 2 * margin)
+        query = np.asarray([grown], dtype=np.float64)
+        x0, y0, x1, y1 = (int(value[0]) for value in self._cell_ranges(query))
+        found = [self._large]
+        if (x1 - x0 + 1) * (y1 - y0 + 1) <= len(self._cells):
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    members = self._cells.get((cx, cy))
+                    if members is not None:
+                        found.append(members)
+        else:
+            found.extend(
+                members for (cx, cy), members in self._cells.items()
+                if x0 <= cx <= x1 and y0 <= cy <= y1
+            )
+        return np.unique(np.concatenate(found))
+
+    def _resolve(self, box_or_id: Union[Box, Any]) -> Tuple[Box, Optional[int]]:
+        if isinstance(box_or_id, (tuple, list, np.ndarray)) and len(box_or_id) == 4:
+            return tuple(float(value) for value in box_or_id), None  # type: ignore[return-value]
+        row = self._row_of.get(box_or_id)
+        if row is None:
+            raise KeyError(f"Node {box_or_id!r} is not in the spatial index")
+        return tuple(self.boxes[row].tolist()), row  # type: ignore[return-value]
+
+    def _ids(self, rows: np.ndarray, exclude: Optional[int] = None) -> List[Any]:
+        return [self.ids[row] for row in np.sort(rows).tolist() if row != exclude]
+
+    def box_of(self, node_id: Any) -> Box:
+        """The (x, y, width, height) box of an indexed node."""
+        return self._resolve(node_id)[0]
+
+    def intersecting(self, box_or_id: Union[Box, Any], tolerance: float = 0) -> List[Any]:
+        """Nodes overlapping the box by more than ``tolerance`` on both axes."""
+        box, exclude = self._resolve(box_or_id)
+        rows = self._candidates(box, -tolerance)
+        b = self.boxes[rows]
+        x_overlap = np.minimum(b[:, X] + b[:, WIDTH], box[0] + box[2]) - np.maximum(b[:, X], box[0])
+        y_overlap = np.minimum(b[:, Y] + b[:, HEIGHT], box[1] + box[3]) - np.maximum(b[:, Y], box[1])
+        return self._ids(rows[(x_overlap > tolerance) & (y_overlap > tolerance)], exclude)
+
+    def contained_in(self, box_or_id: Union[Box, Any], tolerance: float = 0) -> List[Any]:
+        """Nodes lying entirely inside the box (edges may stick out by ``tolerance``)."""
+        box, exclude = self._resolve(box_or_id)
+        rows = self._candidates(box, tolerance)
+        b = self.boxes[rows]
+        inside = (
+            (b[:, X] >= box[0] - tolerance)
+            & (b[:, Y] >= box[1] - tolerance)
+            & (b[:, X] + b[:, WIDTH] <= box[0] + box[2] + tolerance)
+            & (b[:, Y] + b[:, HEIGHT] <= box[1] + box[3] + tolerance)
+        )
+        return self._ids(rows[inside], exclude)
+
+    def containing(self, box_or_id: Union[Box, Any], tolerance: float = 0) -> List[Any]:
+        """Nodes whose box encloses the given box or point-sized box, e.g. the section a sticky sits in."""
+        box, exclude = self._resolve(box_or_id)
+        rows = self._candidates(box, tolerance)
+        b = self.boxes[rows]
+        encloses = (
+            (b[:, X] <= box[0] + tolerance)
+            & (b[:, Y] <= box[1] + tolerance)
+            & (b[:, X] + b[:, WIDTH] >= box[0] + box[2] - tolerance)
+            & (b[:, Y] + b[:, HEIGHT] >= box[1] + box[3] - tolerance)
+        )
+        return self._ids(rows[encloses], exclude)
+
+    def nearest(
+        self, point: Union[Tuple[float, float], Any], k: int = 1, exclude: Sequence[Any] = ()
+    ) -> List[Tuple[Any, float]]:
+        """The k nodes closest to a point (or to a node's center), with distances.
+
+        Distance is from the point to the nearest edge of each box (0 inside
+        it). Cells are searched in growing rings around the point until no
+        unsearched cell can hold anything closer.
+        """
+        excluded = {self._row_of[node_id] for node_id in exclude if node_id in self._row_of}
+        if not (isinstance(point, (tuple, list, np.ndarray)) and len(point) == 2):
+            box, row = self._resolve(point)
+            excluded.add(row)  # type: ignore[arg-type]
+            point = (box[0] + box[2] / 2, box[1] + box[3] / 2)
+        px, py = float(point[0]), float(point[1])
+        wanted = min(k, len(self.ids) - len(excluded))
+        if wanted <= 0:
+            return []
+
+        size = self.cell_size
+        cx, cy = int(np.floor(px / size)), int(np.floor(py / size))
+        x0, y0, x1, y1 = self._cell_bounds
+        max_ring = max(abs(cx - x0), abs(cx - x1), abs(cy - y0), abs(cy - y1))
+        # Outside the grid, or once rings outgrow the occupied cells, a full
+        # vectorized scan is cheaper than walking empty cells
+        inside = x0 <= cx <= x1 and y0 <= cy <= y1
+        seen: set = set()
+        rows_found: List[np.ndarray] = [self._large]
+        ring = 0
+        while inside and 8 * ring <= len(self._cells):
+            for cell in _ring_cells(cx, cy, ring):
+                members = self._cells.get(cell)
+                if members is not None and cell not in seen:
+                    seen.add(cell)
+                    rows_found.append(members)
+            rows = np.unique(np.concatenate(rows_found))
+            if excluded:
+                rows = rows[~np.isin(rows, list(excluded))]
+            distances = self._distances(rows, px, py)
+            # Anything outside the searched rings is at least this far away
+            reach = ring * size + min(px - cx * size, (cx + 1) * size - px, py - cy * size, (cy + 1) * size - py)
+            if len(rows) >= wanted and np.partition(distances, wanted - 1)[wanted - 1] <= reach or ring >= max_ring:
+                return self._closest(rows, distances, wanted)
+            ring += 1
+
+        rows = np.arange(len(self.ids))
+        if excluded:
+            rows = rows[~np.isin(rows, list(excluded))]
+        return self._closest(rows, self._distances(rows, px, py), wanted)
+
+    def _closest(self, rows: np.ndarray, distances: np.ndarray, wanted: int) -> List[Tuple[Any, float]]:
+        order = np.lexsort((rows, distances))[:wanted]
+        return [(self.ids[rows[i]], float(distances[i])) for i in order]
+
+    def _distances(self, rows: np.ndarray, px: float, py: float) -> np.ndarray:
+        b = self.boxes[rows]
+        dx = np.maximum(np.maximum(b[:, X] - px, 0), px - (b[:, X] + b[:, WIDTH]))
+        dy = np.maximum(np.maximum(b[:, Y] - py, 0), py - (b[:, Y] + b[:, HEIGHT]))
+        return np.hypot(dx, dy)
+
+    def band(self, box_or_id: Union[Box, Any], axis: str = "row", tolerance: float = 0) -> List[Any]:
+        """Nodes in the same row (overlapping y range) or column (overlapping x range).
+
+        Overlap must exceed ``tolerance`` pixels; the query node itself is
+        left out.
+        """
+        if axis not in ("row", "column"):
+            raise ValueError("axis must be 'row' or 'column'")
+        box, exclude = self._resolve(box_or_id)
+        if not len(self.boxes):
+            return []
+        if axis == "row":
+            left = float(self.boxes[:, X].min())
+            right = float((self.boxes[:, X] + self.boxes[:, WIDTH]).max())
+            stripe = (left, box[1], right - left, box[3])
+        else:
+            top = float(self.boxes[:, Y].min())
+            bottom = float((self.boxes[:, Y] + self.boxes[:, HEIGHT]).max())
+            stripe = (box[0], top, box[2], bottom - top)
+
+        rows = self._candidates(stripe, -tolerance)
+        b = self.boxes[rows]
+        if axis == "row":
+            overlap = np.minimum(b[:, Y] + b[:, HEIGHT], box[1] + box[3]) - np.maximum(b[:, Y], box[1])
+        else:
+            overlap = np.minimum(b[:, X] + b[:, WIDTH], box[0] + box[2]) - np.maximum(b[:, X], box[0])
+        return self._ids(rows[overlap > tolerance], exclude)
+
+
+def _ring_cells(cx: int, cy: int, ring: int) -> Iterable[Tuple[int, int]]:
+    if ring == 0:
+        yield cx, cy
+        return
+    for dx in range(-ring, ring + 1):
+        yield cx + dx, cy - ring
+        yield cx + dx, cy + ring
+    for dy in range(-ring + 1, ring):
+        yield cx - ring, cy + dy
+        yield cx + ring, cy + dy
+
+
+def _to_absolute(documents: List[Mapping[str, Any]], boxes: np.ndarray, id_field: str, parent_field: str) -> np.ndarray:
+    """Add the offsets of every ancestor to parent-relative boxes."""
+    row_of = {doc.get(id_field): row for row, doc in enumerate(documents)}
+    origin: Dict[int, Tuple[float, float]] = {}
+
+    for row in range(len(documents)):
+        # Walk up to the first ancestor with a known origin (or the root)
+        chain: List[int] = []
+        current: Optional[int] = row
+        while current is not None and current not in origin and current not in chain:
+            chain.append(current)
+            current = row_of.get(documents[current].get(parent_field))
+        base = origin.get(current, (0.0, 0.0)) if current is not None else (0.0, 0.0)
+        for pending in reversed(chain):
+            base = (base[0] + boxes[pending, X], base[1] + boxes[pending, Y])
+            origin[pending] = base
+
+    result = boxes.copy()
+    for row, (x, y) in origin.items():
+        result[row, X], result[row, Y] = x, y
+    return result
+
+
+_file_indexes: "weakref.WeakKeyDictionary[Any, Dict[Tuple[Any, ...], SpatialIndex]]" = weakref.WeakKeyDictionary()
+_file_indexes_lock = threading.Lock()
+
+
+def spatial_index_for_file(
+    backend: Backend,
+    file_id: Any,
+    collection: str = "nodes",
+    file_field: str = "fileId",
+    absolute: bool = False,
+) -> SpatialIndex:
+    """Spatial index over one Figma file's nodes, built once per backend.
+
+    The index is cached for as long as the backend object lives, so every
+    validator run against the same backend shares one index per file. It
+    reflects the nodes at the time of the first call.
+    """
+    key = (collection, file_field, file_id, absolute)
+    with _file_indexes_lock:
+        per_backend = _file_indexes.setdefault(backend, {})
+        index = per_backend.get(key)
+    if index is None:
+        nodes = backend.query({"collection": collection, "filter": {file_field: file_id}}) or []
+        index = SpatialIndex(nodes, absolute=absolute)
+        with _file_indexes_lock:
+            index = per_backend.setdefault(key, index)
+    return index
@@ -0,0 +1,185 @@
+"""
+Inverted text index for substring queries over a single document field.
+
+Text is case-folded (see ``fold``; unlike ``str.lower`` and its final
+sigma, each character is mapped on its own) and indexed by character
+unigrams and bigrams rather than whitespace tokens, so CJK text (which has
+no spaces between words) and mixed CJK/Latin text are handled the same way
+as English. A substring
+lookup intersects the posting lists of the query's bigrams to get a small
+candidate set, then confirms each candidate with a plain ``in`` check
+against the document itself (the index keeps no copy of the text).
+
+Field values are flattened to text as follows: strings as-is, ``None`` as
+an empty string, lists as their items joined by spaces, anything else via
+``str()``.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+_REGEX_METACHARACTERS = set(".^$*+?{}[]|()")
+
+
+def field_text(value: Any) -> str:
+    """Flatten a field value into the text that gets indexed."""
+    if isinstance(value, str):
+        return value
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple)):
+        return " ".join(field_text(item) for item in value)
+    return str(value)
+
+
+# Case-insensitive regexes match "i" against dotted/dotless I, which casefold keeps apart
+_TURKISH_I = str.maketrans({"\u0130": "i", "\u0131": "i"})
+
+
+def fold(text: str) -> str:
+    """Case-fold text the way the index does.
+
+    Every character is folded on its own, so folding preserves substrings,
+    and any character a case-insensitive regex matches against an ASCII
+    letter folds to that letter.
+    """
+    return text.translate(_TURKISH_I).casefold()
+
+
+def literal_from_regex(pattern: Any) -> Optional[str]:
+    """Return the literal text a regex matches, or None if it isn't a plain literal.
+
+    Escaped punctuation (e.g. ``\\.``) counts as literal; character classes,
+    anchors, quantifiers and escapes like ``\\d`` do not.
+    """
+    if not isinstance(pattern, str) or not pattern:
+        return None
+    chars: List[str] = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            if i + 1 >= len(pattern) or pattern[i + 1].isalnum():
+                return None
+            chars.append(pattern[i + 1])
+            i += 2
+            continue
+        if char in _REGEX_METACHARACTERS:
+            return None
+        chars.append(char)
+        i += 1
+    return "".join(chars)
+
+
+def usable_for_regex(literal: str, options: Any) -> bool:
+    """Whether index candidates for a literal cover every match of the regex.
+
+    Case-sensitive matches always survive case folding. Python's
+    case-insensitive matching of non-ASCII cased characters doesn't always
+    agree with ``casefold``, so those regexes are left to a scan.
+    """
+    if not isinstance(options, str) or "i" not in options:
+        return True
+    return all(char.isascii() or char.lower() == char.upper() for char in literal)
+
+
+class TextIndex:
+    """Unigram/bigram inverted index over one field of a list of documents.
+
+    Row numbers are positions in the source list; non-dict items are
+    indexed as empty text so positions line up with the list.
+    """
+
+    def __init__(self, documents: Iterable[Any], field: str):
+        self.field = field
+        self.size = 0
+        # True when every value is a str or None, i.e. the indexed text is
+        # exactly what a $regex filter is evaluated against
+        self.exact_for_regex = True
+
+        postings: Dict[str, List[int]] = {}
+        for row, doc in enumerate(documents):
+            value = doc.get(field) if isinstance(doc, dict) else None
+            if value is not None and not isinstance(value, str):
+                self.exact_for_regex = False
+            text = fold(field_text(value))
+            self.size += 1
+
+            grams = set(text)
+            grams.update(text[i:i + 2] for i in range(len(text) - 1))
+            for gram in grams:
+                postings.setdefault(gram, []).append(row)
+
+        self.postings: Dict[str, np.ndarray] = {
+            gram: np.asarray(rows, dtype=np.int64) for gram, rows in postings.items()
+        }
+
+    def to_state(self) -> Dict[str, Any]:
+        """Plain-data form of the index, for serialization."""
+        return {
+            "field": self.field,
+            "size": self.size,
+            "exact_for_regex": self.exact_for_regex,
+            "postings": {gram: rows.tobytes() for gram, rows in self.postings.items()},
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "TextIndex":
+        """Rebuild an index from ``to_state`` output."""
+        index = cls((), state["field"])
+        index.size = state["size"]
+        index.exact_for_regex = state["exact_for_regex"]
+        index.postings = {
+            gram: np.frombuffer(rows, dtype=np.int64) for gram, rows in state["postings"].items()
+        }
+        return index
+
+    def __len__(self) -> int:
+        return self.size
+
+    def candidates(self, substring: str) -> np.ndarray:
+        """Rows whose text may contain the (case-folded) substring."""
+        needle = fold(substring)
+        if not needle:
+            return np.arange(self.size)
+        if len(needle) == 1:
+            grams = {needle}
+        else:
+            grams = {needle[i:i + 2] for i in range(len(needle) - 1)}
+
+        lists = []
+        for gram in grams:
+            rows = self.postings.get(gram)
+            if rows is None:
+                return np.empty(0, dtype=np.int64)
+            lists.append(rows)
+        lists.sort(key=len)
+
+        result = lists[0]
+        for rows in lists[1:]:
+            result = np.intersect1d(result, rows, assume_unique=True)
+            if not len(result):
+                break
+        return result
+
+    def _text(self, documents: Sequence[Any], row: int) -> str:
+        doc = documents[row]
+        return fold(field_text(doc.get(self.field) if isinstance(doc, dict) else None))
+
+    def contains(self, substring: str, documents: Sequence[Any]) -> np.ndarray:
+        """Rows whose case-folded text contains the case-folded substring.
+
+        ``documents`` is the list the index was built from; candidates are
+        confirmed against it.
+        """
+        needle = fold(substring)
+        rows = [row for row in self.candidates(needle).tolist() if needle in self._text(documents, row)]
+        return np.asarray(rows, dtype=np.int64)
+
+    def contains_any(self, substrings: Iterable[str], documents: Sequence[Any]) -> np.ndarray:
+        """Rows containing at least one of the substrings, in row order."""
+        found = [self.contains(substring, documents) for substring in substrings]
+        if not found:
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate(found))
@@ -0,0 +1,215 @@
+"""
+Resolution of Figma variables across collections, modes and aliases.
+
+A variable's value depends on the mode: ``valuesByMode`` maps each mode of
+its collection to either a concrete value or an alias
+``{"type": "VARIABLE_ALIAS", "id": <variable id>}``. Aliases can chain
+across collections, and each collection is resolved in its own mode, so
+"the dark-mode color of this button" means following the chain with the
+right mode at every hop.
+
+``VariableResolver`` builds per-file tables of variables, collections and
+modes once, and memoizes every resolved (variable, mode choice) pair:
+
+    resolver = truth.variables
+    resolver.bound_variable("node-rect-button", "fill")       # "var-primary"
+    resolver.color("var-primary", mode="Dark")                 # "#60A5FA"
+    resolver.effective_value("node-rect-button", "fill", "Light")
+
+Modes are given by mode id or mode name (case-insensitive). A mode name
+applies to every collection on the alias chain that has a mode with that
+name; other collections use the node's ``explicitVariableModes`` if a node
+is given, and otherwise their ``defaultModeId`` (or first mode). Cyclic or
+dangling aliases resolve to None.
+"""
+
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+_ALIAS = "VARIABLE_ALIAS"
+
+
+def _alias_id(value: Any) -> Any:
+    """The target variable id if value is an alias, else None."""
+    if isinstance(value, Mapping) and value.get("type") == _ALIAS:
+        return value.get("id")
+    return None
+
+
+def _channel(value: Any) -> int:
+    return max(0, min(255, round(float(value) * 255)))
+
+
+def to_hex(value: Any) -> Optional[str]:
+    """Normalize a color value to "#RRGGBB" (or "#RRGGBBAA" when not opaque).
+
+    Accepts hex strings with or without "#" and ``{"r", "g", "b", "a"}``
+    dicts with 0-1 channels; anything else gives None.
+    """
+    if isinstance(value, str):
+        digits = value.strip().lstrip("#")
+        if len(digits) in (6, 8) and all(char in "0123456789abcdefABCDEF" for char in digits):
+            return "#" + digits.upper()
+        return None
+    if isinstance(value, Mapping) and all(isinstance(value.get(key), (int, float)) for key in "rgb"):
+        color = "#" + "".join(f"{_channel(value[key]):02X}" for key in "rgb")
+        alpha = value.get("a", 1)
+        if isinstance(alpha, (int, float)) and alpha < 1:
+            color += f"{_channel(alpha):02X}"
+        return color
+    return None
+
+
+class VariableResolver:
+    """Per-file variable, collection and mode tables with memoized alias resolution.
+
+    Args:
+        variables: Variable documents (``_id``, ``name``,
+            ``variableCollectionId``, ``valuesByMode``).
+        collections: Variable-collection documents (``_id``, ``name``,
+            ``modes: [{"modeId", "name"}]``, ``defaultModeId``).
+        nodes: Node documents, for ``boundVariables`` and
+            ``explicitVariableModes``.
+    """
+
+    def __init__(
+        self,
+        variables: Iterable[Mapping[str, Any]],
+        collections: Iterable[Mapping[str, Any]] = (),
+        nodes: Iterable[Mapping[str, Any]] = (),
+    ):
+        self._variables: Dict[Any, Mapping[str, Any]] = {}
+        self._variables_by_name: Dict[Any, Mapping[str, Any]] = {}
+        for variable in variables:
+            if isinstance(variable, Mapping):
+                self._variables.setdefault(variable.get("_id"), variable)
+                self._variables_by_name.setdefault(variable.get("name"), variable)
+
+        self._collections: Dict[Any, Mapping[str, Any]] = {}
+        self._collections_by_name: Dict[Any, Mapping[str, Any]] = {}
+        # collection id -> lowercased mode name -> mode id, and the default mode
+        self._mode_ids: Dict[Any, Dict[str, Any]] = {}
+        self._default_mode: Dict[Any, Any] = {}
+        for collection in collections:
+            if not isinstance(collection, Mapping):
+                continue
+            collection_id = collection.get("_id")
+            self._collections.setdefault(collection_id, collection)
+            self._collections_by_name.setdefault(collection.get("name"), collection)
+            modes = collection.get("modes") or []
+            names = {
+                str(mode.get("name", "")).lower(): mode.get("modeId")
+                for mode in modes if isinstance(mode, Mapping)
+            }
+            self._mode_ids[collection_id] = names
+            first = next(iter(names.values()), None)
+            self._default_mode[collection_id] = collection.get("defaultModeId", first)
+
+        self._nodes: Dict[Any, Mapping[str, Any]] = {}
+        self._nodes_by_name: Dict[Any, Mapping[str, Any]] = {}
+        for node in nodes:
+            if isinstance(node, Mapping):
+                self._nodes.setdefault(node.get("_id"), node)
+                self._nodes_by_name.setdefault(node.get("name"), node)
+
+        self._resolved: Dict[Tuple[Any, ...], Any] = {}
+
+    def variable(self, ref: Any) -> Optional[Mapping[str, Any]]:
+        """A variable by ``_id`` or name."""
+        variable = self._variables.get(ref)
+        return variable if variable is not None else self._variables_by_name.get(ref)
+
+    def collection(self, ref: Any) -> Optional[Mapping[str, Any]]:
+        """A collection by ``_id`` or name."""
+        collection = self._collections.get(ref)
+        return collection if collection is not None else self._collections_by_name.get(ref)
+
+    def collection_of(self, variable_ref: Any) -> Optional[Mapping[str, Any]]:
+        variable = self.variable(variable_ref)
+        return self._collections.get(variable.get("variableCollectionId")) if variable else None
+
+    def modes(self, collection_ref: Any) -> Dict[Any, str]:
+        """Mode id to mode name for a collection."""
+        collection = self.collection(collection_ref)
+        if collection is None:
+            return {}
+        return {
+            mode.get("modeId"): mode.get("name")
+            for mode in collection.get("modes") or [] if isinstance(mode, Mapping)
+        }
+
+    def _node(self, ref: Any) -> Optional[Mapping[str, Any]]:
+        node = self._nodes.get(ref)
+        return node if node is not None else self._nodes_by_name.get(ref)
+
+    def _mode_for(self, collection_id: Any, mode: Any, overrides: Mapping[Any, Any]) -> Any:
+        """Mode id to use for a collection given the requested mode and node overrides."""
+        names = self._mode_ids.get(collection_id, {})
+        if mode is not None:
+            if mode in names.values():
+                return mode
+            if isinstance(mode, str) and mode.lower() in names:
+                return names[mode.lower()]
+        if collection_id in overrides:
+            return overrides[collection_id]
+        return self._default_mode.get(collection_id)
+
+    def resolve(self, variable_ref: Any, mode: Any = None, node: Any = None) -> Any:
+        """The concrete value of a variable, following aliases; None if unresolvable."""
+        variable = self.variable(variable_ref)
+        if variable is None:
+            return None
+        overrides: Mapping[Any, Any] = {}
+        node_doc = self._node(node) if node is not None else None
+        if node_doc is not None and isinstance(node_doc.get("explicitVariableModes"), Mapping):
+            overrides = node_doc["explicitVariableModes"]
+        key = (variable.get("_id"), mode, tuple(sorted(overrides.items(), key=repr)))
+        if key not in self._resolved:
+            self._resolved[key] = self._follow(variable, mode, overrides)
+        return self._resolved[key]
+
+    def _follow(self, variable: Mapping[str, Any], mode: Any, overrides: Mapping[Any, Any]) -> Any:
+        seen = set()
+        while variable is not None:
+            variable_id = variable.get("_id")
+            if variable_id in seen:
+                return None
+            seen.add(variable_id)
+            values = variable.get("valuesByMode")
+            if not isinstance(values, Mapping):
+                return None
+            mode_id = self._mode_for(variable.get("variableCollectionId"), mode, overrides)
+            value = values.get(mode_id)
+            if value is None and mode_id is None and len(values) == 1:
+                value = next(iter(values.values()))
+            target = _alias_id(value)
+            if target is None:
+                return value
+            variable = self._variables.get(target)
+        return None
+
+    def color(self, variable_ref: Any, mode: Any = None, node: Any = None) -> Optional[str]:
+        """The resolved value as a "#RRGGBB" color, or None."""
+        return to_hex(self.resolve(variable_ref, mode, node))
+
+    def bound_variable(self, node_ref: Any, field: str = "fill") -> Any:
+        """Id of the variable bound to a node field via ``boundVariables``.
+
+        Accepts plain ids, alias dicts and lists of them (Figma binds fills
+        per paint); for a list the first binding is returned. ``fill`` also
+        matches a ``fills`` binding.
+        """
+        node = self._node(node_ref)
+        bound = node.get("boundVariables") if node is not None else None
+        if not isinstance(bound, Mapping):
+            return None
+        value = bound.get(field)
+        if value is None and field == "fill":
+            value = bound.get("fills")
+        if isinstance(value, (list, tuple)):
+            value = value[0] if value else None
+        return _alias_id(value) if isinstance(value, Mapping) else value
+
+    def effective_value(self, node_ref: Any, field: str, mode: Any = None) -> Any:
+        """Value of the variable bound to a node field, in a mode."""
+        variable_id = self.bound_variable(node_ref, field)
+        return self.resolve(variable_id, mode, node_ref) if variable_id is not None else None
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Stress benchmark for concurrent readers on one shared BackendDictAdapter.
+
+Every thread runs the same mix of indexed, text-indexed and columnar-scan
+queries against one adapter; the columnar store is built lazily by whichever
+thread needs it first. Prints throughput per thread count and the speedup
+over one thread. On a GIL build the speedup stays around 1x (the point is
+that it doesn't drop); on free-threaded Python it should grow close to
+linearly.
+
+Usage:
+    python scripts/bench_adapter_threads.py
+    python scripts/bench_adapter_threads.py --threads 1 2 4 8 16 --queries 2000 --docs 50000
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from rewards.backend import BackendDictAdapter  # noqa: E402
+
+_WORDS = ["fitness", "健身", "travel", "recipe", "design", "figma", "layout", "coffee"]
+
+
+def make_state(num_docs: int) -> dict:
+    rng = random.Random(0)
+    posts = [
+        {
+            "_id": str(i),
+            "userId": str(rng.randrange(num_docs // 10 or 1)),
+            "title": " ".join(rng.choice(_WORDS) for _ in range(4)),
+            "likes": rng.randrange(1000),
+        }
+        for i in range(num_docs)
+    ]
+    users = [{"_id": str(i), "name": f"user{i}"} for i in range(num_docs // 10 or 1)]
+    return {"posts": posts, "users": users}
+
+
+def make_adapter(state: dict) -> BackendDictAdapter:
+    adapter = BackendDictAdapter(state, columnar=["posts"], collect_stats=True)
+    adapter.create_index("posts", ["_id"])
+    adapter.create_index("users", ["_id"])
+    adapter.create_text_index("posts", ["title"])
+    return adapter
+
+
+def worker(adapter: BackendDictAdapter, queries: int, num_docs: int, seed: int, barrier: threading.Barrier) -> None:
+    rng = random.Random(seed)
+    barrier.wait()
+    for i in range(queries):
+        kind = i % 5
+        if kind == 0:
+            adapter.query({"collection": "posts", "filter": {"_id": str(rng.randrange(num_docs))}})
+        elif kind == 1:
+            ids = [str(rng.randrange(num_docs // 10 or 1)) for _ in range(20)]
+            adapter.query({"collection": "users", "filter": {"_id": {"$in": ids}}})
+        elif kind == 2:
+            adapter.query({"collection": "posts", "filter": {"title": {"$regex": rng.choice(_WORDS)}}})
+        elif kind == 3:
+            adapter.query({"collection": "posts", "filter": {"likes": rng.randrange(1000)}})
+        else:
+            adapter.text_contains_any("posts", ["title"], [rng.choice(_WORDS), rng.choice(_WORDS)])
+
+
+def run(state: dict, threads: int, queries: int, num_docs: int) -> float:
+    adapter = make_adapter(state)
+    barrier = threading.Barrier(threads + 1)
+    pool = [
+        threading.Thread(target=worker, args=(adapter, queries, num_docs, seed, barrier))
+        for seed in range(threads)
+    ]
+    for thread in pool:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    recorded = sum(report["count"] for report in adapter.query_report())
+    expected = threads * (queries - queries // 5)
+    if recorded != expected:
+        raise SystemExit(f"query_report recorded {recorded} queries, expected {expected}")
+    return threads * queries / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent reader benchmark for BackendDictAdapter")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--queries", type=int, default=400, help="Queries per thread")
+    parser.add_argument("--docs", type=int, default=20000, help="Number of posts")
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+
+    state = make_state(args.docs)
+    # Warm-up so the single-thread baseline doesn't include first-use costs
+    run(state, 1, 50, args.docs)
+
+    baseline = None
+    for threads in args.threads:
+        throughput = run(state, threads, args.queries, args.docs)
+        baseline = baseline or throughput
+        print(f"{threads:>3} threads: {throughput:>10.0f} queries/s  ({throughput / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark final-answer JSON extraction on adversarial input.
+
+Compares rewards.answers.extract_json with the regex-based extractor it
+replaced in rewards/figma_v2.py. Each input is scaled up to --size bytes;
+the regex version is only run up to --regex-max-size because it backtracks
+super-linearly on some of these inputs.
+
+Usage:
+    python scripts/bench_extract_json.py
+    python scripts/bench_extract_json.py --size 1000000 --regex-max-size 20000
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from rewards.answers import extract_json  # noqa: E402
+
+
+def regex_extract(answer):
+    """The previous _extract_json_from_answer, kept for comparison."""
+    try:
+        return json.loads(answer.strip())
+    except json.JSONDecodeError:
+        pass
+    json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', answer, re.DOTALL)
+    if json_match:
+        try:
+            return json.loads(json_match.group(1))
+        except json.JSONDecodeError:
+            pass
+    json_match = re.search(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', answer, re.DOTALL)
+    if json_match:
+        try:
+            return json.loads(json_match.group(0))
+        except json.JSONDecodeError:
+            pass
+    return None
+
+
+def inputs(size):
+    answer = '{"answer": {"nodes": [{"id": "1:2", "children": [{"id": "1:3"}]}]}}'
+    yield "open braces", "{" * size
+    yield "open braces + spaces", "{ " * (size // 2)
+    yield "unclosed nested prose", "{ a {" + "x" * (size - 10) + " } b"
+    yield "deep valid nesting", '{"a":' * (size // 10) + "1" + "}" * (size // 10)
+    yield "brace soup then answer", "{}{" * (size // 3) + answer
+    yield "fence spam then answer", "```{" * (size // 4) + "```\n" + answer
+    yield "quotes and escapes", '{"s": "' + '\\"{' * (size // 3) + '"}'
+    yield "long prose + answer", "lorem ipsum " * (size // 12) + "```json\n" + answer + "\n```"
+
+
+def timed(func, text):
+    started = time.perf_counter()
+    try:
+        result = func(text)
+    except RecursionError:
+        result = "RecursionError"
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON extraction from final answers")
+    parser.add_argument("--size", type=int, default=1_000_000, help="Approximate input size in bytes")
+    parser.add_argument("--regex-max-size", type=int, default=20_000, help="Largest input for the regex version")
+    args = parser.parse_args()
+
+    print(f"{'input':<26} {'scanner':>12} {'regex @ small':>15} {'scanner @ small':>17}")
+    small_inputs = dict(inputs(args.regex_max_size))
+    for name, text in inputs(args.size):
+        elapsed, _ = timed(extract_json, text)
+        regex_elapsed, regex_result = timed(regex_extract, small_inputs[name])
+        small_elapsed, _ = timed(extract_json, small_inputs[name])
+        note = " (regex raised RecursionError)" if regex_result == "RecursionError" else ""
+        print(
+            f"{name:<26} {elapsed * 1000:>10.1f}ms {regex_elapsed * 1000:>13.1f}ms "
+            f"{small_elapsed * 1000:>15.1f}ms{note}"
+        )
+
+
+if __name__ == "__main__":
+    main()
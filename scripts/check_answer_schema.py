@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Check that answer-shape validation never changes a reward's score.
+
+For every task with a trace, scores the trace's final answer and reshaped
+variants of it (each value wrapped in a list or an object, each list or
+object replaced by its first item or a scalar) twice: with the reward alone,
+and through ``answer_schema.score_with_structure`` as the server does. Every
+answer the reward scores must get the same score both ways; answers the
+reward raises on must score 0.0. Rewards run against an empty backend.
+
+Usage:
+    python scripts/check_answer_schema.py
+    python scripts/check_answer_schema.py --task button-component-variants-v2
+"""
+
+import argparse
+import copy
+import json
+import sys
+from pathlib import Path
+from typing import Any, Iterator, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from rewards import answer_schema, figma_v2  # noqa: E402,F401  (figma_v2 registers the rewards)
+from rewards.backend import BackendDictAdapter  # noqa: E402
+from rewards.registry import get_reward  # noqa: E402
+
+KeyPath = Tuple[Any, ...]
+
+
+def _paths(value: Any, path: KeyPath = ()) -> Iterator[Tuple[KeyPath, Any]]:
+    yield path, value
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield from _paths(item, path + (key,))
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            yield from _paths(item, path + (index,))
+
+
+def _replace(data: Any, path: KeyPath, value: Any) -> Any:
+    data = copy.deepcopy(data)
+    parent = data
+    for part in path[:-1]:
+        parent = parent[part]
+    parent[path[-1]] = value
+    return data
+
+
+def reshaped(data: Any) -> Iterator[Any]:
+    """Variants of an answer with one value's shape changed."""
+    for path, value in _paths(data):
+        if not path:
+            continue
+        if isinstance(value, (dict, list)):
+            first = next(iter(value.values() if isinstance(value, dict) else value), None)
+            replacements: List[Any] = [first, "x"]
+        else:
+            replacements = [[value], {"value": value}]
+        for replacement in replacements:
+            yield _replace(data, path, replacement)
+
+
+def check_task(task_path: Path) -> Tuple[int, List[str]]:
+    """(answers checked, mismatch descriptions) for one task."""
+    task = json.loads(task_path.read_text())
+    trace_path = ROOT / "traces" / task_path.name
+    reward = get_reward(task.get("reward_function", ""))
+    if reward is None or not trace_path.exists():
+        return 0, []
+    final_answer = json.loads(trace_path.read_text()).get("final_answer", "")
+    validator = answer_schema.answer_validator(task["id"], reward.answer_schema or answer_schema.example_for_task(task))
+    # parse_answer returns read-only containers; reshape a plain copy
+    data = json.loads(json.dumps(answer_schema.parse_answer(final_answer)))
+    answers = [final_answer] + ([json.dumps(variant) for variant in reshaped(data)] if data else [])
+
+    backend = BackendDictAdapter({})
+    mismatches = []
+    for answer in answers:
+        call = lambda: reward.call(backend, {}, answer)  # noqa: E731
+        try:
+            expected = call()["score"]
+        except Exception:
+            expected = 0.0
+        try:
+            actual = answer_schema.score_with_structure(validator, answer, call)["score"]
+        except Exception as e:
+            actual = f"raised {type(e).__name__}"
+        if actual != expected:
+            mismatches.append(f"{task['id']}: {actual} instead of {expected} for {answer[:200]}")
+    return len(answers), mismatches
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check that answer-shape validation keeps reward scores")
+    parser.add_argument("--task", action="append", help="Task id to check (default: every task with a trace)")
+    args = parser.parse_args()
+
+    task_paths = [ROOT / "tasks" / f"{task}.json" for task in args.task] if args.task else sorted((ROOT / "tasks").glob("*.json"))
+    checked = 0
+    mismatches: List[str] = []
+    for task_path in task_paths:
+        count, task_mismatches = check_task(task_path)
+        checked += count
+        mismatches.extend(task_mismatches)
+
+    for mismatch in mismatches:
+        print(mismatch)
+    print(f"{checked} answers checked, {len(mismatches)} score changes")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Compile initial backend-state JSON files into binary snapshots.
+
+Each <name>.json becomes <name>.bsnap next to it (or in --out-dir). Binary
+snapshots are memory-mapped and decoded one collection at a time, see
+rewards/snapshot_file.py.
+
+Usage:
+    python scripts/compile_backend_snapshot.py path/to/default_backend.json
+    python scripts/compile_backend_snapshot.py path/to/initial-backend-data/ --index _id --index userId
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from rewards.snapshot_file import SNAPSHOT_SUFFIX, compile_snapshot  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile backend-state JSON into binary snapshots")
+    parser.add_argument("path", type=Path, help="Backend-state JSON file or a folder of them")
+    parser.add_argument("--out-dir", type=Path, help="Write snapshots here instead of next to the JSON")
+    parser.add_argument(
+        "--index", action="append", dest="index_fields",
+        help="Field to precompute a hash index for (repeatable, default: _id)",
+    )
+    args = parser.parse_args()
+
+    sources = sorted(args.path.glob("*.json")) if args.path.is_dir() else [args.path]
+    if not sources:
+        print(f"No JSON files found at {args.path}")
+        sys.exit(1)
+
+    index_fields = args.index_fields or ["_id"]
+    for source in sources:
+        out_dir = args.out_dir or source.parent
+        out_dir.mkdir(parents=True, exist_ok=True)
+        output = out_dir / (source.stem + SNAPSHOT_SUFFIX)
+
+        started = time.perf_counter()
+        compile_snapshot(source, output, index_fields=index_fields)
+        elapsed = time.perf_counter() - started
+        print(
+            f"{source.name} -> {output} "
+            f"({source.stat().st_size / 1e6:.1f} MB -> {output.stat().st_size / 1e6:.1f} MB, {elapsed:.2f}s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -173,7 +173,8 @@ def parse_reward_file(file_path: str) -> Dict:
     for node in tree.body:
         if isinstance(node, ast.FunctionDef):
             func_name = node.name
-            start_line = node.lineno - 1
+            # Include decorators (e.g. @reward(...)) with the function
+            start_line = min([node.lineno] + [d.lineno for d in node.decorator_list]) - 1
             end_line = node.end_lineno if node.end_lineno else start_line + 1
             func_code = '\n'.join(lines[start_line:end_line])
             
@@ -281,10 +282,13 @@ def extract_comment_flags(source_code: str) -> Dict[str, str]:
             continue
 
         # Walk upwards collecting contiguous comment lines; allow blank lines within
-        # the comment header, but stop at first real code line.
+        # the comment header, but stop at first real code line. Decorators directly
+        # above the def belong to the function and are skipped.
         collected: List[str] = []
         k = i - 1
         seen_comment = False
+        while k >= 0 and lines[k].startswith('@') and not seen_comment:
+            k -= 1
         while k >= 0:
             prev = lines[k]
             if not prev.strip():
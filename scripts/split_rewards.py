@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Split a monolithic reward file into per-task modules.
+
+Reward files such as rewards/figma_v2.py hold every task's validator in one
+module, so scoring one task means importing (and, on every server reload,
+re-executing) all of them. This script writes a package next to them:
+
+    <output_dir>/
+        __init__.py
+        helpers.py          everything that is not a reward: imports,
+                            types, constants and helper functions, in
+                            source order
+        <task>.py           one module per reward function, importing only
+                            the helpers and source imports it uses
+        index.json          reward name -> module and task ids, task id ->
+                            reward name, and the source's sha256
+
+A reward "unit" is the reward function (with its decorators and the comment
+block above it) plus any later top-level statement that rebinds its name,
+e.g. the ``_validate_x: ValidateTask = {...}`` entries in
+xhs-reward-functions.py. Reward functions are recognized by signature, as
+in merge_rewards.py.
+
+Relative imports (``from .answers import ...``) are rewritten one level
+deeper so the package can live inside the source's package. The server
+imports split rewards lazily through index.json (see server.py); the source
+file stays the one to edit, re-run this script after changing it.
+
+Usage:
+    python split_rewards.py <source_file> <output_dir> [--tasks-dir <dir>]
+
+Example:
+    python split_rewards.py ../rewards/figma_v2.py ../rewards/figma_v2_tasks --tasks-dir ../tasks
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from merge_rewards import categorize_function, extract_comment_flags, extract_registry
+
+INDEX_FILE = "index.json"
+HELPERS_MODULE = "helpers"
+
+
+def _bound_names(node: ast.stmt) -> Set[str]:
+    """Top-level names a statement binds."""
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return {node.name}
+    if isinstance(node, (ast.Import, ast.ImportFrom)):
+        return {(alias.asname or alias.name).split(".")[0] for alias in node.names if alias.name != "*"}
+    targets: List[ast.AST] = []
+    if isinstance(node, ast.Assign):
+        targets = list(node.targets)
+    elif isinstance(node, (ast.AnnAssign, ast.AugAssign)):
+        targets = [node.target]
+    names = set()
+    for target in targets:
+        for sub in ast.walk(target):
+            if isinstance(sub, ast.Name):
+                names.add(sub.id)
+    return names
+
+
+def _used_names(nodes: List[ast.stmt]) -> Set[str]:
+    return {sub.id for node in nodes for sub in ast.walk(node) if isinstance(sub, ast.Name)}
+
+
+def _deeper_import(node: ast.stmt, aliases: Optional[List[ast.alias]] = None) -> str:
+    """Source for an import, with relative imports moved one package level deeper."""
+    if isinstance(node, ast.ImportFrom):
+        moved = ast.ImportFrom(
+            module=node.module,
+            names=aliases if aliases is not None else node.names,
+            level=node.level + 1 if node.level else 0,
+        )
+        return ast.unparse(moved)
+    return ast.unparse(ast.Import(names=aliases if aliases is not None else node.names))
+
+
+def _statement_start(node: ast.stmt) -> int:
+    """First line of a statement, including decorators (1-based)."""
+    decorators = getattr(node, "decorator_list", None) or []
+    return min([node.lineno] + [decorator.lineno for decorator in decorators])
+
+
+def _module_name(reward_name: str, taken: Set[str]) -> str:
+    base = re.sub(r"^_?validate_", "", reward_name.lstrip("_")) or reward_name.strip("_")
+    base = re.sub(r"\W", "_", base)
+    name, n = base, 2
+    while name in taken or name == HELPERS_MODULE:
+        name, n = f"{base}_{n}", n + 1
+    taken.add(name)
+    return name
+
+
+def task_ids_by_reward(tasks_dir: Optional[Path]) -> Dict[str, List[str]]:
+    """Reward function name -> ids of the tasks that use it."""
+    tasks: Dict[str, List[str]] = {}
+    if tasks_dir is None:
+        return tasks
+    for task_file in sorted(tasks_dir.glob("*.json")):
+        try:
+            with open(task_file) as f:
+                task = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            continue
+        name = task.get("reward_function")
+        if name:
+            tasks.setdefault(name, []).append(task.get("id") or task_file.stem)
+    return tasks
+
+
+def split_reward_file(source_path: Path, tasks: Dict[str, List[str]]) -> Dict[str, str]:
+    """Split a reward file; returns {relative output path: file content}."""
+    source_code = source_path.read_text()
+    tree = ast.parse(source_code)
+    lines = source_code.split("\n")
+    comment_flags = extract_comment_flags(source_code)
+    registry_name, _ = extract_registry(tree, lines)
+
+    reward_names = [
+        node.name for node in tree.body
+        if isinstance(node, ast.FunctionDef) and categorize_function(node) == "reward"
+    ]
+    reward_set = set(reward_names)
+
+    # Assign each top-level statement to a reward unit or to the helpers
+    units: Dict[str, List[ast.stmt]] = {name: [] for name in dict.fromkeys(reward_names)}
+    helpers: List[ast.stmt] = []
+    skipped: Set[str] = {"__all__"} | ({registry_name} if registry_name else set())
+    docstring = ast.get_docstring(tree)
+    for node in tree.body:
+        bound = _bound_names(node)
+        owner = next((name for name in bound if name in reward_set), None)
+        if owner is not None and not isinstance(node, (ast.Import, ast.ImportFrom)):
+            units[owner].append(node)
+        elif bound & skipped:
+            continue
+        elif isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant) and node is tree.body[0]:
+            continue
+        else:
+            helpers.append(node)
+
+    def code_of(node: ast.stmt, with_comment: bool) -> str:
+        start = _statement_start(node)
+        body = "\n".join(lines[start - 1:node.end_lineno])
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            body = _deeper_import(node)
+        name = getattr(node, "name", None)
+        if with_comment and name in comment_flags:
+            body = comment_flags[name].strip("\n") + "\n" + body
+        return body
+
+    imports = [node for node in helpers if isinstance(node, (ast.Import, ast.ImportFrom))]
+    helper_names = set().union(*(_bound_names(node) for node in helpers if node not in imports)) if helpers else set()
+    source_label = source_path.name
+    header = f'"""\n{{}}\n\nGenerated from {source_label} by scripts/split_rewards.py; edit the source\nand re-run the script instead of editing this file.\n"""\n'
+
+    files: Dict[str, str] = {}
+    helper_body = "\n\n\n".join(code_of(node, with_comment=True) for node in helpers if node not in imports)
+    files[f"{HELPERS_MODULE}.py"] = (
+        header.format(f"Shared helpers for the rewards in {source_label}.")
+        + ("\n" + "\n".join(_deeper_import(node) for node in imports) + "\n" if imports else "")
+        + "\n\n" + helper_body + "\n"
+    )
+
+    taken: Set[str] = set()
+    modules = {name: _module_name(name, taken) for name in units}
+    index_rewards: Dict[str, Dict[str, object]] = {}
+    index_tasks: Dict[str, str] = {}
+    for name, nodes in units.items():
+        used = _used_names(nodes)
+        lines_out: List[str] = []
+        for node in imports:
+            aliases = [
+                alias for alias in node.names
+                if (alias.asname or alias.name).split(".")[0] in used
+            ]
+            if aliases:
+                lines_out.append(_deeper_import(node, aliases))
+        shared = sorted((used & helper_names) - {name})
+        if shared:
+            lines_out.append(f"from .{HELPERS_MODULE} import {', '.join(shared)}")
+        for other in sorted((used & reward_set) - {name}):
+            lines_out.append(f"from .{modules[other]} import {other}")
+
+        body = "\n\n\n".join(code_of(node, with_comment=isinstance(node, ast.FunctionDef)) for node in nodes)
+        files[f"{modules[name]}.py"] = (
+            header.format(f"Reward {name}.")
+            + "\n" + "\n".join(lines_out) + "\n\n\n" + body + "\n"
+        )
+        index_rewards[name] = {"module": modules[name], "tasks": tasks.get(name, [])}
+        for task_id in tasks.get(name, []):
+            index_tasks[task_id] = name
+
+    files["__init__.py"] = header.format(
+        f"Per-task modules split from {source_label}" + (f": {docstring.splitlines()[0]}" if docstring else ".")
+    )
+    files[INDEX_FILE] = json.dumps(
+        {
+            "source": source_label,
+            "source_sha256": hashlib.sha256(source_code.encode("utf-8")).hexdigest(),
+            "helpers": HELPERS_MODULE,
+            "rewards": index_rewards,
+            "tasks": index_tasks,
+        },
+        indent=2,
+        ensure_ascii=False,
+    ) + "\n"
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Split a reward file into per-task modules, a helpers module and an index.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python split_rewards.py ../rewards/figma_v2.py ../rewards/figma_v2_tasks --tasks-dir ../tasks
+  python split_rewards.py xhs-reward-functions.py ../build/xhs_rewards
+        """
+    )
+    parser.add_argument('source_file', help='Reward file to split')
+    parser.add_argument('output_dir', help='Package directory to write (created if missing)')
+    parser.add_argument('--tasks-dir', help='Directory of task JSON files, to map task ids to rewards')
+    parser.add_argument('--dry-run', action='store_true', help='List the files that would be written')
+    args = parser.parse_args()
+
+    script_dir = Path(__file__).parent
+    workspace_dir = script_dir.parent
+
+    def resolve(path: str) -> Path:
+        resolved = Path(path)
+        return resolved if resolved.is_absolute() else (Path.cwd() / resolved).resolve()
+
+    source_path = resolve(args.source_file)
+    output_dir = resolve(args.output_dir)
+    tasks_dir = resolve(args.tasks_dir) if args.tasks_dir else None
+
+    if not source_path.exists():
+        print(f"Error: Source file not found: {source_path}", file=sys.stderr)
+        sys.exit(1)
+    if tasks_dir is not None and not tasks_dir.exists():
+        print(f"Error: Tasks directory not found: {tasks_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Parsing source file: {source_path}")
+    files = split_reward_file(source_path, task_ids_by_reward(tasks_dir))
+    reward_count = len(files) - 3
+
+    if args.dry_run:
+        print("\nDRY RUN - No files will be written")
+        for name in files:
+            print(f"  {output_dir / name}")
+        return
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    written = set()
+    for name, content in files.items():
+        path = output_dir / name
+        path.write_text(content)
+        written.add(name)
+        if name.endswith(".py"):
+            try:
+                compile(content, str(path), "exec")
+            except SyntaxError as e:
+                print(f"⚠ Warning: {path} has syntax errors: {e}", file=sys.stderr)
+
+    # Remove modules of rewards that no longer exist in the source
+    for stale in sorted(output_dir.glob("*.py")):
+        if stale.name not in written:
+            os.remove(stale)
+            print(f"Removed stale module: {stale.name}")
+
+    print(f"\n✓ Wrote {reward_count} reward modules, {HELPERS_MODULE}.py and {INDEX_FILE} to {output_dir}")
+    if workspace_dir in output_dir.parents:
+        print(f"  ({output_dir.relative_to(workspace_dir)})")
+
+
+if __name__ == '__main__':
+    main()
@@ -6,8 +6,10 @@ Each task has both backend and frontend validation functions following the V2 ar
 """
 
 import logging
+import re
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, List, Optional, Tuple, TypedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypedDict
 
 logger = logging.getLogger(__name__)
 
@@ -63,13 +65,17 @@ class BackendDictAdapter(Backend):
         if not isinstance(items, list):
             return []
 
-        # Simple filter matching
+        # Simple filter matching (equality, or {"$in": [...]})
         filtered = []
         for item in items:
             if isinstance(item, dict):
                 match = True
                 for key, value in filter_dict.items():
-                    if item.get(key) != value:
+                    if isinstance(value, dict) and "$in" in value:
+                        if item.get(key) not in value["$in"]:
+                            match = False
+                            break
+                    elif item.get(key) != value:
                         match = False
                         break
                 if match:
@@ -106,65 +112,152 @@ def _get_user(backend: Backend, user_id: str) -> Dict[str, Any]:
     return users[0]
 
 
+def _get_by_ids(backend: Backend, collection: str, ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """Get documents by id with one $in query; ids that aren't found are left out.
+
+    Unhashable ids (a list or object where an id belongs) can't match a
+    document, so they are left out of the query and ``get`` on the result
+    returns None for them like any other missing id.
+    """
+    unique_ids = list(dict.fromkeys(id_ for id_ in ids if _is_hashable(id_)))
+    by_id = _DocsById()
+    if not unique_ids:
+        return by_id
+    docs = backend.query({"collection": collection, "filter": {"_id": {"$in": unique_ids}}})
+    for doc in docs or []:
+        doc_id = doc.get("_id")
+        if _is_hashable(doc_id):
+            by_id.setdefault(doc_id, doc)
+    return by_id
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+class _DocsById(dict):
+    """Documents by id whose ``get`` treats an unhashable id as missing."""
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return super().get(key, default) if _is_hashable(key) else default
+
+
+def _get_posts(backend: Backend, post_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """Get posts from backend in one query, by id.
+
+    Missing posts are absent from the result where _get_post would raise
+    ValueError, so loops skip them with ``.get(post_id)``.
+    """
+    return _get_by_ids(backend, "posts", post_ids)
+
+
+def _get_users(backend: Backend, user_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """Get users from backend in one query, by id (missing users are absent)."""
+    return _get_by_ids(backend, "users", user_ids)
+
+
+class KeywordMatcher:
+    """Substring matcher for a fixed keyword list.
+
+    Built once per keyword list as one precompiled alternation, so
+    ``matches`` scans a text once in C however many keywords there are.
+    Keywords and text are lower-cased, as the ``keyword in text.lower()``
+    checks this replaces did.
+    """
+
+    __slots__ = ("keywords", "_pattern")
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(keyword.lower() for keyword in keywords))
+        self._pattern = re.compile("|".join(map(re.escape, self.keywords))) if self.keywords else None
+
+    def matches(self, text: str) -> bool:
+        """Whether any keyword occurs in text."""
+        if self._pattern is None:
+            return False
+        return self._pattern.search(text.lower()) is not None
+
+    def __repr__(self) -> str:
+        return f"KeywordMatcher({list(self.keywords)!r})"
+
+
+# Keywords for common topic areas, matched against post text
+TOPIC_KEYWORDS: Dict[str, List[str]] = {
+    "fitness": ["fitness", "workout", "exercise", "gym", "training", "运动", "健身", "锻炼", "运动健身", "健身运动", "减脂", "增肌", "瑜伽", "跑步", "健身教练"],
+    "beauty": ["beauty", "makeup", "skincare", "cosmetic", "美容", "化妆", "护肤", "美妆", "彩妆", "美甲", "发型", "美容护肤", "化妆品", "护肤品"],
+    "food": ["food", "recipe", "cooking", "meal", "dining", "美食", "食谱", "烹饪", "料理", "菜谱", "做饭", "下厨", "餐厅", "小吃", "甜品", "烘焙", "家常菜"],
+    "travel": ["travel", "trip", "vacation", "destination", "旅游", "旅行", "景点", "出游", "度假", "攻略", "游记", "自由行", "旅行攻略", "旅游攻略", "打卡"],
+    "home": ["home", "interior", "decor", "furniture", "家居", "装修", "装饰", "家装", "室内", "家具", "收纳", "整理", "布置", "软装", "硬装"],
+    "fashion": ["fashion", "outfit", "style", "clothing", "时尚", "穿搭", "服装", "搭配", "穿衣", "潮流", "时装", "服饰", "穿搭分享", "ootd"],
+    "art": ["art", "drawing", "painting", "illustration", "艺术", "绘画", "插画", "画画", "手绘", "水彩", "油画", "素描", "创作", "设计", "艺术家"],
+    "pets": ["pet", "dog", "cat", "animal", "宠物", "狗", "猫", "养宠", "萌宠", "宠物日常", "宠物用品", "宠物护理", "宠物训练"],
+    "wellness": ["wellness", "meditation", "mindfulness", "wellbeing", "健康", "冥想", "养生", "保健", "身心健康", "心理健康", "放松", "减压", "瑜伽", "正念"],
+    "lifestyle": ["lifestyle", "routine", "daily", "life", "生活方式", "日常", "生活", "日常分享", "生活记录", "生活vlog", "生活碎片"],
+    "education": ["education", "study", "learning", "tutorial", "教育", "学习", "教程", "知识", "学习分享", "学习方法", "学习笔记", "读书", "阅读", "课程"],
+    "settings": [],
+    "general": [],
+    "culture": ["book", "reading", "literature", "书籍", "阅读", "文学", "读书", "书单", "读后感", "文学作品", "小说", "阅读分享"],
+}
+
+# Keywords for common topic areas, matched against a user's category and bio
+USER_CATEGORY_KEYWORDS: Dict[str, List[str]] = {
+    "fitness": ["fitness", "workout", "exercise", "gym", "运动", "健身", "锻炼", "运动健身", "健身运动", "减脂", "增肌", "瑜伽", "跑步", "健身教练"],
+    "beauty": ["beauty", "makeup", "skincare", "cosmetic", "美容", "化妆", "护肤", "美妆", "彩妆", "美甲", "发型", "美容护肤", "化妆品", "护肤品"],
+    "food": ["food", "recipe", "cooking", "chef", "美食", "食谱", "烹饪", "料理", "菜谱", "做饭", "下厨", "餐厅", "小吃", "甜品", "烘焙", "家常菜"],
+    "travel": ["travel", "trip", "vacation", "旅游", "旅行", "景点", "出游", "度假", "攻略", "游记", "自由行", "旅行攻略", "旅游攻略", "打卡"],
+    "home": ["home", "interior", "decor", "家居", "装修", "家装", "室内", "家具", "收纳", "整理", "布置", "软装", "硬装"],
+    "fashion": ["fashion", "style", "outfit", "时尚", "穿搭", "搭配", "穿衣", "潮流", "时装", "服饰", "穿搭分享", "ootd"],
+    "art": ["art", "drawing", "painting", "illustration", "艺术", "绘画", "插画", "画画", "手绘", "水彩", "油画", "素描", "创作", "设计", "艺术家"],
+    "pets": ["pet", "dog", "cat", "animal", "宠物", "狗", "猫", "养宠", "萌宠", "宠物日常", "宠物用品", "宠物护理", "宠物训练"],
+    "wellness": ["wellness", "meditation", "mindfulness", "健康", "冥想", "养生", "保健", "身心健康", "心理健康", "放松", "减压", "瑜伽", "正念"],
+    "lifestyle": ["lifestyle", "routine", "生活方式", "日常", "生活", "日常分享", "生活记录", "生活vlog", "生活碎片"],
+    "education": ["education", "study", "learning", "教育", "学习", "教程", "知识", "学习分享", "学习方法", "学习笔记", "读书", "阅读", "课程"],
+    "settings": [],
+    "general": [],
+    "culture": ["book", "reading", "literature", "书籍", "阅读", "文学", "读书", "书单", "读后感", "文学作品", "小说", "阅读分享"],
+}
+
+_TOPIC_MATCHERS = {topic: KeywordMatcher(keywords) for topic, keywords in TOPIC_KEYWORDS.items()}
+_USER_CATEGORY_MATCHERS = {topic: KeywordMatcher(keywords) for topic, keywords in USER_CATEGORY_KEYWORDS.items()}
+
+
+@lru_cache(maxsize=256)
+def _keyword_matcher(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    """Matcher for an ad hoc keyword list (custom keywords, unknown topic areas)."""
+    return KeywordMatcher(keywords)
+
+
 def _check_topic_relevance(
     post: Dict[str, Any], topic_area: str, keywords: Optional[List[str]] = None
 ) -> bool:
     """Check if a post is relevant to a topic area."""
-    if keywords is None:
-        # Default keywords for common topic areas
-        topic_keywords = {
-            "fitness": ["fitness", "workout", "exercise", "gym", "training", "运动", "健身", "锻炼", "运动健身", "健身运动", "减脂", "增肌", "瑜伽", "跑步", "健身教练"],
-            "beauty": ["beauty", "makeup", "skincare", "cosmetic", "美容", "化妆", "护肤", "美妆", "彩妆", "美甲", "发型", "美容护肤", "化妆品", "护肤品"],
-            "food": ["food", "recipe", "cooking", "meal", "dining", "美食", "食谱", "烹饪", "料理", "菜谱", "做饭", "下厨", "餐厅", "小吃", "甜品", "烘焙", "家常菜"],
-            "travel": ["travel", "trip", "vacation", "destination", "旅游", "旅行", "景点", "出游", "度假", "攻略", "游记", "自由行", "旅行攻略", "旅游攻略", "打卡"],
-            "home": ["home", "interior", "decor", "furniture", "家居", "装修", "装饰", "家装", "室内", "家具", "收纳", "整理", "布置", "软装", "硬装"],
-            "fashion": ["fashion", "outfit", "style", "clothing", "时尚", "穿搭", "服装", "搭配", "穿衣", "潮流", "时装", "服饰", "穿搭分享", "ootd"],
-            "art": ["art", "drawing", "painting", "illustration", "艺术", "绘画", "插画", "画画", "手绘", "水彩", "油画", "素描", "创作", "设计", "艺术家"],
-            "pets": ["pet", "dog", "cat", "animal", "宠物", "狗", "猫", "养宠", "萌宠", "宠物日常", "宠物用品", "宠物护理", "宠物训练"],
-            "wellness": ["wellness", "meditation", "mindfulness", "wellbeing", "健康", "冥想", "养生", "保健", "身心健康", "心理健康", "放松", "减压", "瑜伽", "正念"],
-            "lifestyle": ["lifestyle", "routine", "daily", "life", "生活方式", "日常", "生活", "日常分享", "生活记录", "生活vlog", "生活碎片"],
-            "education": ["education", "study", "learning", "tutorial", "教育", "学习", "教程", "知识", "学习分享", "学习方法", "学习笔记", "读书", "阅读", "课程"],
-            "settings": [],
-            "general": [],
-            "culture": ["book", "reading", "literature", "书籍", "阅读", "文学", "读书", "书单", "读后感", "文学作品", "小说", "阅读分享"],
-        }
-        keywords = topic_keywords.get(topic_area.lower(), [topic_area.lower()])
-
-    title = (post.get("title", "") or "").lower()
-    caption = (post.get("caption", "") or "").lower()
-    tags = [tag.lower() for tag in post.get("tags", [])]
-    location = (post.get("location", "") or "").lower()
+    if keywords is not None:
+        matcher = _keyword_matcher(tuple(keywords))
+    else:
+        matcher = _TOPIC_MATCHERS.get(topic_area.lower()) or _keyword_matcher((topic_area.lower(),))
+
+    title = post.get("title", "") or ""
+    caption = post.get("caption", "") or ""
+    tags = post.get("tags", [])
+    location = post.get("location", "") or ""
 
     content = f"{title} {caption} {location} {' '.join(tags)}"
-    return any(keyword.lower() in content for keyword in keywords)
+    return matcher.matches(content)
 
 
 def _check_user_category_relevance(
     user: Dict[str, Any], topic_area: str
 ) -> bool:
     """Check if a user's category is relevant to a topic area."""
-    category = (user.get("category", "") or "").lower()
-    bio = (user.get("bio", "") or "").lower()
-    
-    topic_keywords = {
-        "fitness": ["fitness", "workout", "exercise", "gym", "运动", "健身", "锻炼", "运动健身", "健身运动", "减脂", "增肌", "瑜伽", "跑步", "健身教练"],
-        "beauty": ["beauty", "makeup", "skincare", "cosmetic", "美容", "化妆", "护肤", "美妆", "彩妆", "美甲", "发型", "美容护肤", "化妆品", "护肤品"],
-        "food": ["food", "recipe", "cooking", "chef", "美食", "食谱", "烹饪", "料理", "菜谱", "做饭", "下厨", "餐厅", "小吃", "甜品", "烘焙", "家常菜"],
-        "travel": ["travel", "trip", "vacation", "旅游", "旅行", "景点", "出游", "度假", "攻略", "游记", "自由行", "旅行攻略", "旅游攻略", "打卡"],
-        "home": ["home", "interior", "decor", "家居", "装修", "家装", "室内", "家具", "收纳", "整理", "布置", "软装", "硬装"],
-        "fashion": ["fashion", "style", "outfit", "时尚", "穿搭", "搭配", "穿衣", "潮流", "时装", "服饰", "穿搭分享", "ootd"],
-        "art": ["art", "drawing", "painting", "illustration", "艺术", "绘画", "插画", "画画", "手绘", "水彩", "油画", "素描", "创作", "设计", "艺术家"],
-        "pets": ["pet", "dog", "cat", "animal", "宠物", "狗", "猫", "养宠", "萌宠", "宠物日常", "宠物用品", "宠物护理", "宠物训练"],
-        "wellness": ["wellness", "meditation", "mindfulness", "健康", "冥想", "养生", "保健", "身心健康", "心理健康", "放松", "减压", "瑜伽", "正念"],
-        "lifestyle": ["lifestyle", "routine", "生活方式", "日常", "生活", "日常分享", "生活记录", "生活vlog", "生活碎片"],
-        "education": ["education", "study", "learning", "教育", "学习", "教程", "知识", "学习分享", "学习方法", "学习笔记", "读书", "阅读", "课程"],
-        "settings": [],
-        "general": [],
-        "culture": ["book", "reading", "literature", "书籍", "阅读", "文学", "读书", "书单", "读后感", "文学作品", "小说", "阅读分享"],
-    }
-    keywords = topic_keywords.get(topic_area.lower(), [topic_area.lower()])
-    
-    return any(keyword in category or keyword in bio for keyword in keywords)
+    category = user.get("category", "") or ""
+    bio = user.get("bio", "") or ""
+
+    matcher = _USER_CATEGORY_MATCHERS.get(topic_area.lower()) or _keyword_matcher((topic_area.lower(),))
+    return matcher.matches(category) or matcher.matches(bio)
 
 
 # =============================================================================
@@ -199,13 +292,13 @@ def _validate_starting_new_fitness_routine(
     
     # Check if followed users are fitness-related
     fitness_following_count = 0
+    followed_users = _get_users(final_state_backend, following)
     for user_id in following:
-        try:
-            user = _get_user(final_state_backend, user_id)
-            if _check_user_category_relevance(user, "fitness"):
-                fitness_following_count += 1
-        except ValueError:
+        user = followed_users.get(user_id)
+        if user is None:
             continue
+        if _check_user_category_relevance(user, "fitness"):
+            fitness_following_count += 1
     
     if fitness_following_count < 2:
         return 0.0, f"Expected at least 2 fitness-related followed user(s), got {fitness_following_count}"
@@ -219,13 +312,13 @@ def _validate_starting_new_fitness_routine(
     
     # Check if bookmarked posts are fitness-related
     fitness_bookmarks_count = 0
+    bookmarked_posts = _get_posts(final_state_backend, bookmarks)
     for post_id in bookmarks:
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "fitness"):
-                fitness_bookmarks_count += 1
-        except ValueError:
+        post = bookmarked_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "fitness"):
+            fitness_bookmarks_count += 1
     
     if fitness_bookmarks_count < 3:
         return 0.0, f"Expected at least 3 fitness-related bookmarked posts, got {fitness_bookmarks_count}"
@@ -292,13 +385,13 @@ def _validate_friend_recommended_some_beauty(
     
     # Check if followed users are beauty-related
     beauty_following_count = 0
+    followed_users = _get_users(final_state_backend, following)
     for user_id in following:
-        try:
-            user = _get_user(final_state_backend, user_id)
-            if _check_user_category_relevance(user, "beauty"):
-                beauty_following_count += 1
-        except ValueError:
+        user = followed_users.get(user_id)
+        if user is None:
             continue
+        if _check_user_category_relevance(user, "beauty"):
+            beauty_following_count += 1
     
     if beauty_following_count < 1:
         return 0.0, f"Expected at least 1 beauty-related followed user(s), got {beauty_following_count}"
@@ -312,13 +405,13 @@ def _validate_friend_recommended_some_beauty(
     
     # Check if liked posts are beauty-related
     beauty_liked_count = 0
+    liked_posts = _get_posts(final_state_backend, liked)
     for post_id in liked:
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "beauty"):
-                beauty_liked_count += 1
-        except ValueError:
+        post = liked_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "beauty"):
+            beauty_liked_count += 1
     
     if beauty_liked_count < 2:
         return 0.0, f"Expected at least 2 beauty-related liked posts, got {beauty_liked_count}"
@@ -393,13 +486,13 @@ def _validate_want_learn_some_simple(
     
     # Check if followed users are food-related
     food_following_count = 0
+    followed_users = _get_users(final_state_backend, following)
     for user_id in following:
-        try:
-            user = _get_user(final_state_backend, user_id)
-            if _check_user_category_relevance(user, "food"):
-                food_following_count += 1
-        except ValueError:
+        user = followed_users.get(user_id)
+        if user is None:
             continue
+        if _check_user_category_relevance(user, "food"):
+            food_following_count += 1
     
     if food_following_count < 1:
         return 0.0, f"Expected at least 1 food-related followed user(s), got {food_following_count}"
@@ -413,13 +506,13 @@ def _validate_want_learn_some_simple(
     
     # Check if bookmarked posts are food-related
     food_bookmarks_count = 0
+    bookmarked_posts = _get_posts(final_state_backend, bookmarks)
     for post_id in bookmarks:
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "food"):
-                food_bookmarks_count += 1
-        except ValueError:
+        post = bookmarked_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "food"):
+            food_bookmarks_count += 1
     
     if food_bookmarks_count < 3:
         return 0.0, f"Expected at least 3 food-related bookmarked posts, got {food_bookmarks_count}"
@@ -477,18 +570,18 @@ def _validate_saw_amazing_travel_photo(
     user_comments = final_state_backend.query({"collection": "comments", "filter": {"authorId": current_user_id}})
     travel_comment_found = False
     
+    commented_posts = _get_posts(final_state_backend, [comment.get("postId") for comment in user_comments])
     for comment in user_comments:
         post_id = comment.get("postId")
         if not post_id:
             continue
         
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "travel"):
-                travel_comment_found = True
-                break
-        except ValueError:
+        post = commented_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "travel"):
+            travel_comment_found = True
+            break
     
     if not travel_comment_found:
         return 0.0, "No comment found on travel-related post"
@@ -641,13 +734,13 @@ def _validate_need_find_some_quick(
     
     # Check if bookmarked posts are beauty-related
     beauty_bookmarks_count = 0
+    bookmarked_posts = _get_posts(final_state_backend, bookmarks)
     for post_id in bookmarks:
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "beauty"):
-                beauty_bookmarks_count += 1
-        except ValueError:
+        post = bookmarked_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "beauty"):
+            beauty_bookmarks_count += 1
     
     if beauty_bookmarks_count < 1:
         return 0.0, f"Expected at least 1 beauty-related bookmarked post(s), got {beauty_bookmarks_count}"
@@ -697,13 +790,13 @@ def _validate_cat_has_been_acting(
     
     # Check if followed users are pets-related
     pets_following_count = 0
+    followed_users = _get_users(final_state_backend, following)
     for user_id in following:
-        try:
-            user = _get_user(final_state_backend, user_id)
-            if _check_user_category_relevance(user, "pets"):
-                pets_following_count += 1
-        except ValueError:
+        user = followed_users.get(user_id)
+        if user is None:
             continue
+        if _check_user_category_relevance(user, "pets"):
+            pets_following_count += 1
     
     if pets_following_count < 1:
         return 0.0, f"Expected at least 1 pets-related followed user(s), got {pets_following_count}"
@@ -713,13 +806,14 @@ def _validate_cat_has_been_acting(
     liked = current_user.get("liked", [])
     
     pets_content_count = 0
-    for post_id in list(bookmarks) + list(liked):
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "pets"):
-                pets_content_count += 1
-        except ValueError:
+    saved_post_ids = list(bookmarks) + list(liked)
+    saved_posts = _get_posts(final_state_backend, saved_post_ids)
+    for post_id in saved_post_ids:
+        post = saved_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "pets"):
+            pets_content_count += 1
     
     if pets_content_count < 2:
         return 0.0, f"Expected at least 2 pets-related bookmarked or liked posts, got {pets_content_count}"
@@ -777,13 +871,13 @@ def _validate_planning_weekend_trip_and(
     
     # Check if bookmarked posts are travel-related
     travel_bookmarks_count = 0
+    bookmarked_posts = _get_posts(final_state_backend, bookmarks)
     for post_id in bookmarks:
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "travel"):
-                travel_bookmarks_count += 1
-        except ValueError:
+        post = bookmarked_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "travel"):
+            travel_bookmarks_count += 1
     
     if travel_bookmarks_count < 3:
         return 0.0, f"Expected at least 3 travel-related bookmarked posts, got {travel_bookmarks_count}"
@@ -827,18 +921,18 @@ def _validate_someone_posted_amazing_nail(
     user_comments = final_state_backend.query({"collection": "comments", "filter": {"authorId": current_user_id}})
     beauty_comment_found = False
     
+    commented_posts = _get_posts(final_state_backend, [comment.get("postId") for comment in user_comments])
     for comment in user_comments:
         post_id = comment.get("postId")
         if not post_id:
             continue
         
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "beauty"):
-                beauty_comment_found = True
-                break
-        except ValueError:
+        post = commented_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "beauty"):
+            beauty_comment_found = True
+            break
     
     if not beauty_comment_found:
         return 0.0, "No comment found on beauty-related post"
@@ -888,13 +982,13 @@ def _validate_been_getting_back_into(
     
     # Check if followed users are art-related
     art_following_count = 0
+    followed_users = _get_users(final_state_backend, following)
     for user_id in following:
-        try:
-            user = _get_user(final_state_backend, user_id)
-            if _check_user_category_relevance(user, "art"):
-                art_following_count += 1
-        except ValueError:
+        user = followed_users.get(user_id)
+        if user is None:
             continue
+        if _check_user_category_relevance(user, "art"):
+            art_following_count += 1
     
     if art_following_count < 2:
         return 0.0, f"Expected at least 2 art-related followed user(s), got {art_following_count}"
@@ -904,13 +998,14 @@ def _validate_been_getting_back_into(
     liked = current_user.get("liked", [])
     
     art_content_count = 0
-    for post_id in list(bookmarks) + list(liked):
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "art"):
-                art_content_count += 1
-        except ValueError:
+    saved_post_ids = list(bookmarks) + list(liked)
+    saved_posts = _get_posts(final_state_backend, saved_post_ids)
+    for post_id in saved_post_ids:
+        post = saved_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "art"):
+            art_content_count += 1
     
     if art_content_count < 2:
         return 0.0, f"Expected at least 2 art-related bookmarked or liked posts, got {art_content_count}"
@@ -973,13 +1068,13 @@ def _validate_looking_for_budget_friendly(
     
     # Check if followed users are fashion-related
     fashion_following_count = 0
+    followed_users = _get_users(final_state_backend, following)
     for user_id in following:
-        try:
-            user = _get_user(final_state_backend, user_id)
-            if _check_user_category_relevance(user, "fashion"):
-                fashion_following_count += 1
-        except ValueError:
+        user = followed_users.get(user_id)
+        if user is None:
             continue
+        if _check_user_category_relevance(user, "fashion"):
+            fashion_following_count += 1
     
     if fashion_following_count < 1:
         return 0.0, f"Expected at least 1 fashion-related followed user(s), got {fashion_following_count}"
@@ -993,13 +1088,13 @@ def _validate_looking_for_budget_friendly(
     
     # Check if bookmarked posts are fashion-related
     fashion_bookmarks_count = 0
+    bookmarked_posts = _get_posts(final_state_backend, bookmarks)
     for post_id in bookmarks:
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "fashion"):
-                fashion_bookmarks_count += 1
-        except ValueError:
+        post = bookmarked_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "fashion"):
+            fashion_bookmarks_count += 1
     
     if fashion_bookmarks_count < 2:
         return 0.0, f"Expected at least 2 fashion-related bookmarked posts, got {fashion_bookmarks_count}"
@@ -1066,17 +1161,17 @@ def _validate_workout_motivation_has_been(
     user_comments = final_state_backend.query({"collection": "comments", "filter": {"authorId": current_user_id}})
     comment_count = 0
     
+    commented_posts = _get_posts(final_state_backend, [comment.get("postId") for comment in user_comments])
     for comment in user_comments:
         post_id = comment.get("postId")
         if not post_id:
             continue
         
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "fitness"):
-                comment_count += 1
-        except ValueError:
+        post = commented_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "fitness"):
+            comment_count += 1
     
     if comment_count < 2:
         return 0.0, f"Expected at least 2 comments on fitness-related posts, got {comment_count}"
@@ -1126,13 +1221,13 @@ def _validate_need_organize_tiny_kitchen(
     
     # Check if followed users are home-related
     home_following_count = 0
+    followed_users = _get_users(final_state_backend, following)
     for user_id in following:
-        try:
-            user = _get_user(final_state_backend, user_id)
-            if _check_user_category_relevance(user, "home"):
-                home_following_count += 1
-        except ValueError:
+        user = followed_users.get(user_id)
+        if user is None:
             continue
+        if _check_user_category_relevance(user, "home"):
+            home_following_count += 1
     
     if home_following_count < 1:
         return 0.0, f"Expected at least 1 home-related followed user(s), got {home_following_count}"
@@ -1146,13 +1241,13 @@ def _validate_need_organize_tiny_kitchen(
     
     # Check if bookmarked posts are home-related
     home_bookmarks_count = 0
+    bookmarked_posts = _get_posts(final_state_backend, bookmarks)
     for post_id in bookmarks:
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "home"):
-                home_bookmarks_count += 1
-        except ValueError:
+        post = bookmarked_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "home"):
+            home_bookmarks_count += 1
     
     if home_bookmarks_count < 3:
         return 0.0, f"Expected at least 3 home-related bookmarked posts, got {home_bookmarks_count}"
@@ -1228,13 +1323,13 @@ def _validate_want_try_some_new(
     
     # Check if bookmarked posts are beauty-related
     beauty_bookmarks_count = 0
+    bookmarked_posts = _get_posts(final_state_backend, bookmarks)
     for post_id in bookmarks:
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "beauty"):
-                beauty_bookmarks_count += 1
-        except ValueError:
+        post = bookmarked_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "beauty"):
+            beauty_bookmarks_count += 1
     
     # Check for album with at least 3 beauty-related posts
     albums = current_user.get("albums", [])
@@ -1245,13 +1340,13 @@ def _validate_want_try_some_new(
     for album in albums:
         post_ids = album.get("postIds", [])
         if isinstance(post_ids, list):
+            album_posts = _get_posts(final_state_backend, post_ids)
             for post_id in post_ids:
-                try:
-                    post = _get_post(final_state_backend, post_id)
-                    if _check_topic_relevance(post, "beauty"):
-                        beauty_album_posts_count += 1
-                except ValueError:
+                post = album_posts.get(post_id)
+                if post is None:
                     continue
+                if _check_topic_relevance(post, "beauty"):
+                    beauty_album_posts_count += 1
     
     # Pass if either condition is met: bookmarked posts OR album posts
     if beauty_bookmarks_count < 3 and beauty_album_posts_count < 3:
@@ -1300,13 +1395,13 @@ def _validate_thinking_about_getting_dog(
     
     # Check if followed users are pets-related
     pets_following_count = 0
+    followed_users = _get_users(final_state_backend, following)
     for user_id in following:
-        try:
-            user = _get_user(final_state_backend, user_id)
-            if _check_user_category_relevance(user, "pets"):
-                pets_following_count += 1
-        except ValueError:
+        user = followed_users.get(user_id)
+        if user is None:
             continue
+        if _check_user_category_relevance(user, "pets"):
+            pets_following_count += 1
     
     if pets_following_count < 2:
         return 0.0, f"Expected at least 2 pets-related followed user(s), got {pets_following_count}"
@@ -1349,18 +1444,18 @@ def _validate_someone_shared_really_creative(
     user_comments = final_state_backend.query({"collection": "comments", "filter": {"authorId": current_user_id}})
     art_comment_found = False
     
+    commented_posts = _get_posts(final_state_backend, [comment.get("postId") for comment in user_comments])
     for comment in user_comments:
         post_id = comment.get("postId")
         if not post_id:
             continue
         
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "art"):
-                art_comment_found = True
-                break
-        except ValueError:
+        post = commented_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "art"):
+            art_comment_found = True
+            break
     
     if not art_comment_found:
         return 0.0, "No comment found on art-related post"
@@ -1422,13 +1517,13 @@ def _validate_trying_eat_healthier_but(
     
     # Check if bookmarked posts are food-related
     food_bookmarks_count = 0
+    bookmarked_posts = _get_posts(final_state_backend, bookmarks)
     for post_id in bookmarks:
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "food"):
-                food_bookmarks_count += 1
-        except ValueError:
+        post = bookmarked_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "food"):
+            food_bookmarks_count += 1
     
     # Check for album with at least 3 food-related posts
     albums = current_user.get("albums", [])
@@ -1439,13 +1534,13 @@ def _validate_trying_eat_healthier_but(
     for album in albums:
         post_ids = album.get("postIds", [])
         if isinstance(post_ids, list):
+            album_posts = _get_posts(final_state_backend, post_ids)
             for post_id in post_ids:
-                try:
-                    post = _get_post(final_state_backend, post_id)
-                    if _check_topic_relevance(post, "food"):
-                        food_album_posts_count += 1
-                except ValueError:
+                post = album_posts.get(post_id)
+                if post is None:
                     continue
+                if _check_topic_relevance(post, "food"):
+                    food_album_posts_count += 1
     
     # Pass if either condition is met: bookmarked posts OR album posts
     if food_bookmarks_count < 3 and food_album_posts_count < 3:
@@ -1490,23 +1585,23 @@ def _validate_want_support_some_smaller(
     user_comments = final_state_backend.query({"collection": "comments", "filter": {"authorId": current_user_id}})
     comment_count = 0
     
+    commented_posts = _get_posts(final_state_backend, [comment.get("postId") for comment in user_comments])
     for comment in user_comments:
         post_id = comment.get("postId")
         if not post_id:
             continue
         
-        try:
-            post = _get_post(final_state_backend, post_id)
-            # Check that post has less than 1000 likes
-            post_likes = post.get("likes", 0)
-            if not isinstance(post_likes, (int, float)):
-                continue
-            if post_likes >= 1000:
-                continue
-            # Post has less than 1000 likes, count this comment
-            comment_count += 1
-        except ValueError:
+        post = commented_posts.get(post_id)
+        if post is None:
+            continue
+        # Check that post has less than 1000 likes
+        post_likes = post.get("likes", 0)
+        if not isinstance(post_likes, (int, float)):
             continue
+        if post_likes >= 1000:
+            continue
+        # Post has less than 1000 likes, count this comment
+        comment_count += 1
     
     if comment_count < 3:
         return 0.0, f"Expected at least 3 comments on posts with less than 1000 likes, got {comment_count}"
@@ -1557,13 +1652,13 @@ def _validate_planning_redecorate_living_room(
     
     # Check if followed users are home-related
     home_following_count = 0
+    followed_users = _get_users(final_state_backend, following)
     for user_id in following:
-        try:
-            user = _get_user(final_state_backend, user_id)
-            if _check_user_category_relevance(user, "home"):
-                home_following_count += 1
-        except ValueError:
+        user = followed_users.get(user_id)
+        if user is None:
             continue
+        if _check_user_category_relevance(user, "home"):
+            home_following_count += 1
     
     if home_following_count < 2:
         return 0.0, f"Expected at least 2 home-related followed user(s), got {home_following_count}"
@@ -1577,13 +1672,13 @@ def _validate_planning_redecorate_living_room(
     
     # Check if bookmarked posts are home-related
     home_bookmarks_count = 0
+    bookmarked_posts = _get_posts(final_state_backend, bookmarks)
     for post_id in bookmarks:
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "home"):
-                home_bookmarks_count += 1
-        except ValueError:
+        post = bookmarked_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "home"):
+            home_bookmarks_count += 1
     
     if home_bookmarks_count < 3:
         return 0.0, f"Expected at least 3 home-related bookmarked posts, got {home_bookmarks_count}"
@@ -1645,13 +1740,13 @@ def _validate_keep_seeing_these_amazing(
     
     # Check if bookmarked posts are fashion-related
     fashion_bookmarks_count = 0
+    bookmarked_posts = _get_posts(final_state_backend, bookmarks)
     for post_id in bookmarks:
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "fashion"):
-                fashion_bookmarks_count += 1
-        except ValueError:
+        post = bookmarked_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "fashion"):
+            fashion_bookmarks_count += 1
     
     if fashion_bookmarks_count < 4:
         return 0.0, f"Expected at least 4 fashion-related bookmarked posts, got {fashion_bookmarks_count}"
@@ -1722,13 +1817,13 @@ def _validate_looking_for_some_meditation(
     
     # Check if followed users are wellness-related
     wellness_following_count = 0
+    followed_users = _get_users(final_state_backend, following)
     for user_id in following:
-        try:
-            user = _get_user(final_state_backend, user_id)
-            if _check_user_category_relevance(user, "wellness"):
-                wellness_following_count += 1
-        except ValueError:
+        user = followed_users.get(user_id)
+        if user is None:
             continue
+        if _check_user_category_relevance(user, "wellness"):
+            wellness_following_count += 1
     
     if wellness_following_count < 1:
         return 0.0, f"Expected at least 1 wellness-related followed user(s), got {wellness_following_count}"
@@ -1742,13 +1837,13 @@ def _validate_looking_for_some_meditation(
     
     # Check if bookmarked posts are wellness-related
     wellness_bookmarks_count = 0
+    bookmarked_posts = _get_posts(final_state_backend, bookmarks)
     for post_id in bookmarks:
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "wellness"):
-                wellness_bookmarks_count += 1
-        except ValueError:
+        post = bookmarked_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "wellness"):
+            wellness_bookmarks_count += 1
     
     if wellness_bookmarks_count < 3:
         return 0.0, f"Expected at least 3 wellness-related bookmarked posts, got {wellness_bookmarks_count}"
@@ -1802,13 +1897,13 @@ def _validate_want_try_making_some(
     
     # Check if bookmarked posts are food-related
     food_bookmarks_count = 0
+    bookmarked_posts = _get_posts(final_state_backend, bookmarks)
     for post_id in bookmarks:
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "food"):
-                food_bookmarks_count += 1
-        except ValueError:
+        post = bookmarked_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "food"):
+            food_bookmarks_count += 1
     
     if food_bookmarks_count < 3:
         return 0.0, f"Expected at least 3 food-related bookmarked posts, got {food_bookmarks_count}"
@@ -1851,18 +1946,18 @@ def _validate_saw_someone_post_about(
     user_comments = final_state_backend.query({"collection": "comments", "filter": {"authorId": current_user_id}})
     lifestyle_comment_found = False
     
+    commented_posts = _get_posts(final_state_backend, [comment.get("postId") for comment in user_comments])
     for comment in user_comments:
         post_id = comment.get("postId")
         if not post_id:
             continue
         
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "lifestyle"):
-                lifestyle_comment_found = True
-                break
-        except ValueError:
+        post = commented_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "lifestyle"):
+            lifestyle_comment_found = True
+            break
     
     if not lifestyle_comment_found:
         return 0.0, "No comment found on lifestyle-related post"
@@ -1912,13 +2007,13 @@ def _validate_trying_learn_watercolor_painting(
     
     # Check if followed users are art-related
     art_following_count = 0
+    followed_users = _get_users(final_state_backend, following)
     for user_id in following:
-        try:
-            user = _get_user(final_state_backend, user_id)
-            if _check_user_category_relevance(user, "art"):
-                art_following_count += 1
-        except ValueError:
+        user = followed_users.get(user_id)
+        if user is None:
             continue
+        if _check_user_category_relevance(user, "art"):
+            art_following_count += 1
     
     if art_following_count < 2:
         return 0.0, f"Expected at least 2 art-related followed user(s), got {art_following_count}"
@@ -1928,13 +2023,14 @@ def _validate_trying_learn_watercolor_painting(
     liked = current_user.get("liked", [])
     
     art_content_count = 0
-    for post_id in list(bookmarks) + list(liked):
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "art"):
-                art_content_count += 1
-        except ValueError:
+    saved_post_ids = list(bookmarks) + list(liked)
+    saved_posts = _get_posts(final_state_backend, saved_post_ids)
+    for post_id in saved_post_ids:
+        post = saved_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "art"):
+            art_content_count += 1
     
     if art_content_count < 3:
         return 0.0, f"Expected at least 3 art-related bookmarked or liked posts, got {art_content_count}"
@@ -2007,13 +2103,13 @@ def _validate_friend_keeps_talking_about(
     
     # Check if bookmarked posts are lifestyle-related
     lifestyle_bookmarks_count = 0
+    bookmarked_posts = _get_posts(final_state_backend, bookmarks)
     for post_id in bookmarks:
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "lifestyle"):
-                lifestyle_bookmarks_count += 1
-        except ValueError:
+        post = bookmarked_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "lifestyle"):
+            lifestyle_bookmarks_count += 1
     
     if lifestyle_bookmarks_count < 3:
         return 0.0, f"Expected at least 3 lifestyle-related bookmarked posts, got {lifestyle_bookmarks_count}"
@@ -2056,18 +2152,18 @@ def _validate_want_more_encouraging_content(
     user_comments = final_state_backend.query({"collection": "comments", "filter": {"authorId": current_user_id}})
     general_comment_found = False
     
+    commented_posts = _get_posts(final_state_backend, [comment.get("postId") for comment in user_comments])
     for comment in user_comments:
         post_id = comment.get("postId")
         if not post_id:
             continue
         
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "general"):
-                general_comment_found = True
-                break
-        except ValueError:
+        post = commented_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "general"):
+            general_comment_found = True
+            break
     
     if not general_comment_found:
         return 0.0, "No comment found on general-related post"
@@ -2116,13 +2212,13 @@ def _validate_looking_upgrade_skincare_routine(
     
     # Check if followed users are beauty-related
     beauty_following_count = 0
+    followed_users = _get_users(final_state_backend, following)
     for user_id in following:
-        try:
-            user = _get_user(final_state_backend, user_id)
-            if _check_user_category_relevance(user, "beauty"):
-                beauty_following_count += 1
-        except ValueError:
+        user = followed_users.get(user_id)
+        if user is None:
             continue
+        if _check_user_category_relevance(user, "beauty"):
+            beauty_following_count += 1
     
     if beauty_following_count < 1:
         return 0.0, f"Expected at least 1 beauty-related followed user(s), got {beauty_following_count}"
@@ -2136,13 +2232,13 @@ def _validate_looking_upgrade_skincare_routine(
     
     # Check if bookmarked posts are beauty-related
     beauty_bookmarks_count = 0
+    bookmarked_posts = _get_posts(final_state_backend, bookmarks)
     for post_id in bookmarks:
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "beauty"):
-                beauty_bookmarks_count += 1
-        except ValueError:
+        post = bookmarked_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "beauty"):
+            beauty_bookmarks_count += 1
     
     if beauty_bookmarks_count < 3:
         return 0.0, f"Expected at least 3 beauty-related bookmarked posts, got {beauty_bookmarks_count}"
@@ -2196,13 +2292,13 @@ def _validate_planning_staycation_and_want(
     
     # Check if bookmarked posts are travel-related
     travel_bookmarks_count = 0
+    bookmarked_posts = _get_posts(final_state_backend, bookmarks)
     for post_id in bookmarks:
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "travel"):
-                travel_bookmarks_count += 1
-        except ValueError:
+        post = bookmarked_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "travel"):
+            travel_bookmarks_count += 1
     
     if travel_bookmarks_count < 3:
         return 0.0, f"Expected at least 3 travel-related bookmarked posts, got {travel_bookmarks_count}"
@@ -2245,18 +2341,18 @@ def _validate_been_struggling_with_work(
     user_comments = final_state_backend.query({"collection": "comments", "filter": {"authorId": current_user_id}})
     lifestyle_comment_found = False
     
+    commented_posts = _get_posts(final_state_backend, [comment.get("postId") for comment in user_comments])
     for comment in user_comments:
         post_id = comment.get("postId")
         if not post_id:
             continue
         
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "lifestyle"):
-                lifestyle_comment_found = True
-                break
-        except ValueError:
+        post = commented_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "lifestyle"):
+            lifestyle_comment_found = True
+            break
     
     if not lifestyle_comment_found:
         return 0.0, "No comment found on lifestyle-related post"
@@ -2305,13 +2401,13 @@ def _validate_want_learn_more_about(
     
     # Check if followed users are lifestyle-related
     lifestyle_following_count = 0
+    followed_users = _get_users(final_state_backend, following)
     for user_id in following:
-        try:
-            user = _get_user(final_state_backend, user_id)
-            if _check_user_category_relevance(user, "lifestyle"):
-                lifestyle_following_count += 1
-        except ValueError:
+        user = followed_users.get(user_id)
+        if user is None:
             continue
+        if _check_user_category_relevance(user, "lifestyle"):
+            lifestyle_following_count += 1
     
     if lifestyle_following_count < 1:
         return 0.0, f"Expected at least 1 lifestyle-related followed user(s), got {lifestyle_following_count}"
@@ -2325,13 +2421,13 @@ def _validate_want_learn_more_about(
     
     # Check if bookmarked posts are lifestyle-related
     lifestyle_bookmarks_count = 0
+    bookmarked_posts = _get_posts(final_state_backend, bookmarks)
     for post_id in bookmarks:
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "lifestyle"):
-                lifestyle_bookmarks_count += 1
-        except ValueError:
+        post = bookmarked_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "lifestyle"):
+            lifestyle_bookmarks_count += 1
     
     if lifestyle_bookmarks_count < 3:
         return 0.0, f"Expected at least 3 lifestyle-related bookmarked posts, got {lifestyle_bookmarks_count}"
@@ -2385,13 +2481,13 @@ def _validate_apartment_balcony_tiny_but(
     
     # Check if bookmarked posts are home-related
     home_bookmarks_count = 0
+    bookmarked_posts = _get_posts(final_state_backend, bookmarks)
     for post_id in bookmarks:
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "home"):
-                home_bookmarks_count += 1
-        except ValueError:
+        post = bookmarked_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "home"):
+            home_bookmarks_count += 1
     
     if home_bookmarks_count < 3:
         return 0.0, f"Expected at least 3 home-related bookmarked posts, got {home_bookmarks_count}"
@@ -2434,18 +2530,18 @@ def _validate_keep_seeing_these_amazing(
     user_comments = final_state_backend.query({"collection": "comments", "filter": {"authorId": current_user_id}})
     food_comment_found = False
     
+    commented_posts = _get_posts(final_state_backend, [comment.get("postId") for comment in user_comments])
     for comment in user_comments:
         post_id = comment.get("postId")
         if not post_id:
             continue
         
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "food"):
-                food_comment_found = True
-                break
-        except ValueError:
+        post = commented_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "food"):
+            food_comment_found = True
+            break
     
     if not food_comment_found:
         return 0.0, "No comment found on food-related post"
@@ -2494,13 +2590,13 @@ def _validate_need_some_motivation_for(
     
     # Check if followed users are fitness-related
     fitness_following_count = 0
+    followed_users = _get_users(final_state_backend, following)
     for user_id in following:
-        try:
-            user = _get_user(final_state_backend, user_id)
-            if _check_user_category_relevance(user, "fitness"):
-                fitness_following_count += 1
-        except ValueError:
+        user = followed_users.get(user_id)
+        if user is None:
             continue
+        if _check_user_category_relevance(user, "fitness"):
+            fitness_following_count += 1
     
     if fitness_following_count < 2:
         return 0.0, f"Expected at least 2 fitness-related followed user(s), got {fitness_following_count}"
@@ -2514,13 +2610,13 @@ def _validate_need_some_motivation_for(
     
     # Check if bookmarked posts are fitness-related
     fitness_bookmarks_count = 0
+    bookmarked_posts = _get_posts(final_state_backend, bookmarks)
     for post_id in bookmarks:
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "fitness"):
-                fitness_bookmarks_count += 1
-        except ValueError:
+        post = bookmarked_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "fitness"):
+            fitness_bookmarks_count += 1
     
     if fitness_bookmarks_count < 2:
         return 0.0, f"Expected at least 2 fitness-related bookmarked posts, got {fitness_bookmarks_count}"
@@ -2590,13 +2686,13 @@ def _validate_looking_for_some_book(
     
     # Check if followed users are culture-related
     culture_following_count = 0
+    followed_users = _get_users(final_state_backend, following)
     for user_id in following:
-        try:
-            user = _get_user(final_state_backend, user_id)
-            if _check_user_category_relevance(user, "culture"):
-                culture_following_count += 1
-        except ValueError:
+        user = followed_users.get(user_id)
+        if user is None:
             continue
+        if _check_user_category_relevance(user, "culture"):
+            culture_following_count += 1
     
     if culture_following_count < 1:
         return 0.0, f"Expected at least 1 culture-related followed user(s), got {culture_following_count}"
@@ -2650,13 +2746,13 @@ def _validate_want_try_some_new(
     
     # Check if bookmarked posts are beauty-related
     beauty_bookmarks_count = 0
+    bookmarked_posts = _get_posts(final_state_backend, bookmarks)
     for post_id in bookmarks:
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "beauty"):
-                beauty_bookmarks_count += 1
-        except ValueError:
+        post = bookmarked_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "beauty"):
+            beauty_bookmarks_count += 1
     
     if beauty_bookmarks_count < 3:
         return 0.0, f"Expected at least 3 beauty-related bookmarked posts, got {beauty_bookmarks_count}"
@@ -2699,18 +2795,18 @@ def _validate_someone_posted_gorgeous_photos(
     user_comments = final_state_backend.query({"collection": "comments", "filter": {"authorId": current_user_id}})
     travel_comment_found = False
     
+    commented_posts = _get_posts(final_state_backend, [comment.get("postId") for comment in user_comments])
     for comment in user_comments:
         post_id = comment.get("postId")
         if not post_id:
             continue
         
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "travel"):
-                travel_comment_found = True
-                break
-        except ValueError:
+        post = commented_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "travel"):
+            travel_comment_found = True
+            break
     
     if not travel_comment_found:
         return 0.0, "No comment found on travel-related post"
@@ -2778,13 +2874,13 @@ def _validate_workspace_home_pretty_chaotic(
     
     # Check if followed users are home-related
     home_following_count = 0
+    followed_users = _get_users(final_state_backend, following)
     for user_id in following:
-        try:
-            user = _get_user(final_state_backend, user_id)
-            if _check_user_category_relevance(user, "home"):
-                home_following_count += 1
-        except ValueError:
+        user = followed_users.get(user_id)
+        if user is None:
             continue
+        if _check_user_category_relevance(user, "home"):
+            home_following_count += 1
     
     if home_following_count < 1:
         return 0.0, f"Expected at least 1 home-related followed user(s), got {home_following_count}"
@@ -2798,13 +2894,13 @@ def _validate_workspace_home_pretty_chaotic(
     
     # Check if bookmarked posts are home-related
     home_bookmarks_count = 0
+    bookmarked_posts = _get_posts(final_state_backend, bookmarks)
     for post_id in bookmarks:
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "home"):
-                home_bookmarks_count += 1
-        except ValueError:
+        post = bookmarked_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "home"):
+            home_bookmarks_count += 1
     
     if home_bookmarks_count < 3:
         return 0.0, f"Expected at least 3 home-related bookmarked posts, got {home_bookmarks_count}"
@@ -2847,18 +2943,18 @@ def _validate_want_more_active_supporting(
     user_comments = final_state_backend.query({"collection": "comments", "filter": {"authorId": current_user_id}})
     art_comment_found = False
     
+    commented_posts = _get_posts(final_state_backend, [comment.get("postId") for comment in user_comments])
     for comment in user_comments:
         post_id = comment.get("postId")
         if not post_id:
             continue
         
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "art"):
-                art_comment_found = True
-                break
-        except ValueError:
+        post = commented_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "art"):
+            art_comment_found = True
+            break
     
     if not art_comment_found:
         return 0.0, "No comment found on art-related post"
@@ -2913,13 +3009,13 @@ def _validate_looking_for_some_easy(
     
     # Check if bookmarked posts are food-related
     food_bookmarks_count = 0
+    bookmarked_posts = _get_posts(final_state_backend, bookmarks)
     for post_id in bookmarks:
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "food"):
-                food_bookmarks_count += 1
-        except ValueError:
+        post = bookmarked_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "food"):
+            food_bookmarks_count += 1
     
     if food_bookmarks_count < 4:
         return 0.0, f"Expected at least 4 food-related bookmarked posts, got {food_bookmarks_count}"
@@ -2967,13 +3063,13 @@ def _validate_been_thinking_about_trying(
     
     # Check if followed users are fitness-related
     fitness_following_count = 0
+    followed_users = _get_users(final_state_backend, following)
     for user_id in following:
-        try:
-            user = _get_user(final_state_backend, user_id)
-            if _check_user_category_relevance(user, "fitness"):
-                fitness_following_count += 1
-        except ValueError:
+        user = followed_users.get(user_id)
+        if user is None:
             continue
+        if _check_user_category_relevance(user, "fitness"):
+            fitness_following_count += 1
     
     if fitness_following_count < 1:
         return 0.0, f"Expected at least 1 fitness-related followed user(s), got {fitness_following_count}"
@@ -2987,13 +3083,13 @@ def _validate_been_thinking_about_trying(
     
     # Check if bookmarked posts are fitness-related
     fitness_bookmarks_count = 0
+    bookmarked_posts = _get_posts(final_state_backend, bookmarks)
     for post_id in bookmarks:
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "fitness"):
-                fitness_bookmarks_count += 1
-        except ValueError:
+        post = bookmarked_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "fitness"):
+            fitness_bookmarks_count += 1
     
     if fitness_bookmarks_count < 3:
         return 0.0, f"Expected at least 3 fitness-related bookmarked posts, got {fitness_bookmarks_count}"
@@ -3040,13 +3136,13 @@ def _validate_want_update_wardrobe_with(
     
     # Check if bookmarked posts are fashion-related
     fashion_bookmarks_count = 0
+    bookmarked_posts = _get_posts(final_state_backend, bookmarks)
     for post_id in bookmarks:
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "fashion"):
-                fashion_bookmarks_count += 1
-        except ValueError:
+        post = bookmarked_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "fashion"):
+            fashion_bookmarks_count += 1
     
     if fashion_bookmarks_count < 4:
         return 0.0, f"Expected at least 4 fashion-related bookmarked posts, got {fashion_bookmarks_count}"
@@ -3120,13 +3216,13 @@ def _validate_looking_for_some_photography(
     
     # Check if followed users are art-related
     art_following_count = 0
+    followed_users = _get_users(final_state_backend, following)
     for user_id in following:
-        try:
-            user = _get_user(final_state_backend, user_id)
-            if _check_user_category_relevance(user, "art"):
-                art_following_count += 1
-        except ValueError:
+        user = followed_users.get(user_id)
+        if user is None:
             continue
+        if _check_user_category_relevance(user, "art"):
+            art_following_count += 1
     
     if art_following_count < 1:
         return 0.0, f"Expected at least 1 art-related followed user(s), got {art_following_count}"
@@ -3140,13 +3236,13 @@ def _validate_looking_for_some_photography(
     
     # Check if bookmarked posts are art-related
     art_bookmarks_count = 0
+    bookmarked_posts = _get_posts(final_state_backend, bookmarks)
     for post_id in bookmarks:
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "art"):
-                art_bookmarks_count += 1
-        except ValueError:
+        post = bookmarked_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "art"):
+            art_bookmarks_count += 1
     
     if art_bookmarks_count < 3:
         return 0.0, f"Expected at least 3 art-related bookmarked posts, got {art_bookmarks_count}"
@@ -3193,13 +3289,13 @@ def _validate_someone_shared_really_helpful(
     
     # Check if bookmarked posts are education-related
     education_bookmarks_count = 0
+    bookmarked_posts = _get_posts(final_state_backend, bookmarks)
     for post_id in bookmarks:
-        try:
-            post = _get_post(final_state_backend, post_id)
-            if _check_topic_relevance(post, "education"):
-                education_bookmarks_count += 1
-        except ValueError:
+        post = bookmarked_posts.get(post_id)
+        if post is None:
             continue
+        if _check_topic_relevance(post, "education"):
+            education_bookmarks_count += 1
     
     if education_bookmarks_count < 3:
         return 0.0, f"Expected at least 3 education-related bookmarked posts, got {education_bookmarks_count}"
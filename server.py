@@ -10,18 +10,23 @@ Usage:
 
 Endpoints:
   POST /verify - Run verification for a task
+  POST /verify_batch - Score several final answers for one task
   GET /health - Health check
   GET /tasks - List available tasks
   GET /functions - List available reward functions
 """
 
+import contextlib
+import hashlib
+import importlib
 import importlib.util
 import json
 import os
 import sys
+import threading
 import types
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 import requests
 from fastapi import FastAPI, HTTPException
@@ -34,9 +39,19 @@ REWARDS_DIR = BASE_DIR / "rewards"
 TASKS_DIR = BASE_DIR / "tasks"
 TRACES_DIR = BASE_DIR / "traces"
 
+# Per-task reward packages written by scripts/split_rewards.py carry this index
+SPLIT_INDEX_FILE = "index.json"
+
 # Default storage server URL
 DEFAULT_STORAGE_URL = os.environ.get("STORAGE_URL", "http://localhost:8081")
 
+# Initial backend states, as <initial_backend_state_name>.json; validators
+# derive their expected values from the state a task starts from
+INITIAL_STATE_DIR = Path(os.environ.get("INITIAL_STATE_DIR", BASE_DIR / "initial-backend-data"))
+
+# Scoring mode when a request doesn't set one: "verbose" or "fail_fast"
+DEFAULT_SCORING_MODE = os.environ.get("SCORING_MODE", "verbose")
+
 app = FastAPI(title="Figma Verification Server", version="1.0.0")
 
 # CORS for browser access
@@ -53,6 +68,8 @@ class VerifyRequest(BaseModel):
     task_id: str
     frontend_state: Optional[Dict[str, Any]] = None
     final_answer: Optional[str] = ""
+    # "verbose" returns every check message; "fail_fast" stops at the first failed check
+    mode: Optional[Literal["verbose", "fail_fast"]] = None
 
 
 class VerifyResponse(BaseModel):
@@ -63,6 +80,18 @@ class VerifyResponse(BaseModel):
     successes: list[str] = []
 
 
+class VerifyBatchRequest(BaseModel):
+    task_id: str
+    frontend_state: Optional[Dict[str, Any]] = None
+    final_answers: List[Optional[str]]
+    mode: Optional[Literal["verbose", "fail_fast"]] = None
+
+
+class VerifyBatchResponse(BaseModel):
+    scores: list[float]
+    results: list[VerifyResponse]
+
+
 class StorageBackend:
     """Backend for querying the storage server."""
 
@@ -85,9 +114,36 @@ class StorageBackend:
             print(f"Query failed: {e}")
             return []
 
+    def aggregate(self, query: Dict[str, Any]) -> Any:
+        """Execute an aggregation pipeline against the storage server.
+
+        Falls back to running the pipeline locally on top of query() if the
+        storage server has no /aggregate endpoint (404) or fails to run the
+        pipeline (any other non-200 status, which is logged).
+        """
+        try:
+            response = requests.post(
+                f"{self.storage_url}/aggregate",
+                json=query,
+                timeout=30
+            )
+            if response.status_code != 200:
+                if response.status_code != 404:
+                    print(f"Aggregate failed with HTTP {response.status_code}, running pipeline locally: {response.text[:200]}")
+                from rewards.backend import Backend
+                return Backend.aggregate(self, query)
+            result = response.json()
+            return result.get("data", [])
+        except Exception as e:
+            print(f"Aggregate failed: {e}")
+            return []
+
 
 def load_reward_functions(rewards_dir: Path = REWARDS_DIR) -> Dict[str, Any]:
-    """Load all reward functions from the rewards directory."""
+    """Load all reward modules and return the rewards they register, by name.
+
+    Values are ``rewards.registry.RewardSpec`` objects; see registry.py.
+    """
     functions: Dict[str, Any] = {}
 
     if not rewards_dir.exists():
@@ -96,12 +152,7 @@ def load_reward_functions(rewards_dir: Path = REWARDS_DIR) -> Dict[str, Any]:
 
     # Create a fake 'rewards' package in sys.modules
     package_name = "rewards"
-
-    if package_name not in sys.modules:
-        pkg = types.ModuleType(package_name)
-        pkg.__path__ = [str(rewards_dir)]
-        pkg.__package__ = package_name
-        sys.modules[package_name] = pkg
+    ensure_rewards_package(rewards_dir)
 
     # First, load backend.py as it's needed by other modules
     backend_file = rewards_dir / "backend.py"
@@ -129,46 +180,156 @@ def load_reward_functions(rewards_dir: Path = REWARDS_DIR) -> Dict[str, Any]:
             module_name = py_file.stem
             full_module_name = f"{package_name}.{module_name}"
 
-            # Skip if already loaded
+            # Skip if already loaded (e.g. imported by an earlier module)
             if full_module_name in sys.modules:
-                module = sys.modules[full_module_name]
-            else:
-                spec = importlib.util.spec_from_file_location(
-                    full_module_name, py_file,
-                    submodule_search_locations=[str(rewards_dir)]
-                )
-                if spec and spec.loader:
-                    module = importlib.util.module_from_spec(spec)
-                    module.__package__ = package_name
-                    sys.modules[full_module_name] = module
-                    spec.loader.exec_module(module)
-                else:
-                    continue
-
-            # Find all functions starting with _validate
-            for name in dir(module):
-                if name.startswith("_validate"):
-                    func = getattr(module, name)
-                    if callable(func):
-                        functions[name] = func
+                continue
+            spec = importlib.util.spec_from_file_location(
+                full_module_name, py_file,
+                submodule_search_locations=[str(rewards_dir)]
+            )
+            if spec and spec.loader:
+                module = importlib.util.module_from_spec(spec)
+                module.__package__ = package_name
+                sys.modules[full_module_name] = module
+                spec.loader.exec_module(module)
 
         except Exception as e:
             print(f"Failed to load {py_file.name}: {e}")
 
+    # Reward functions register themselves with @reward when their module is imported
+    registry = sys.modules.get(f"{package_name}.registry")
+    if registry is not None:
+        functions.update(registry.registered())
+
+    record_module_mtimes()
     print(f"Loaded {len(functions)} reward functions")
     return functions
 
 
-def reload_reward_functions() -> Dict[str, Any]:
-    """Reload all reward functions (clears cache and reloads from disk)."""
-    # Clear cached modules
+def ensure_rewards_package(rewards_dir: Path = REWARDS_DIR) -> None:
+    """Register the fake 'rewards' package, so ``importlib.import_module("rewards.X")`` finds rewards_dir/X."""
+    package_name = "rewards"
+    if package_name not in sys.modules:
+        pkg = types.ModuleType(package_name)
+        pkg.__path__ = [str(rewards_dir)]
+        pkg.__package__ = package_name
+        sys.modules[package_name] = pkg
+
+
+def clear_reward_modules() -> None:
+    """Drop every loaded rewards module, so the next import re-executes it from disk."""
     modules_to_remove = [key for key in sys.modules.keys() if key.startswith("rewards")]
     for mod in modules_to_remove:
         del sys.modules[mod]
+    _module_mtimes.clear()
+
 
+def reload_reward_functions() -> Dict[str, Any]:
+    """Reload all reward functions (clears cache and reloads from disk)."""
+    clear_reward_modules()
     return load_reward_functions()
 
 
+# Modification time of each loaded rewards module's file when it was imported
+_module_mtimes: Dict[str, float] = {}
+
+
+def _loaded_reward_files() -> Dict[str, str]:
+    return {
+        name: module.__file__
+        for name, module in list(sys.modules.items())
+        if name.startswith("rewards.") and getattr(module, "__file__", None)
+    }
+
+
+def record_module_mtimes() -> None:
+    """Remember the file mtimes of rewards modules imported since the last call."""
+    for name, path in _loaded_reward_files().items():
+        if name not in _module_mtimes:
+            try:
+                _module_mtimes[name] = os.path.getmtime(path)
+            except OSError:
+                pass
+
+
+def reward_modules_changed() -> bool:
+    """Whether any loaded rewards module's file changed (or vanished) since it was imported."""
+    for name, path in _loaded_reward_files().items():
+        recorded = _module_mtimes.get(name)
+        if recorded is None:
+            continue
+        try:
+            if os.path.getmtime(path) != recorded:
+                return True
+        except OSError:
+            return True
+    return False
+
+
+def reward_modules_stale(rewards_dir: Path = REWARDS_DIR) -> bool:
+    """Whether all reward functions need reloading.
+
+    True if a loaded rewards file changed, or a rewards file isn't loaded
+    (it is new, or a split reward's reload dropped it).
+    """
+    if reward_modules_changed():
+        return True
+    return any(
+        f"rewards.{py_file.stem}" not in sys.modules
+        for py_file in rewards_dir.glob("*.py")
+        if not py_file.name.startswith("_")
+    )
+
+
+def split_reward_modules(rewards_dir: Path = REWARDS_DIR) -> Dict[str, str]:
+    """Reward name -> module name, for rewards split into per-task packages.
+
+    Packages are found by their index.json (see scripts/split_rewards.py).
+    A package whose source file changed since it was generated is skipped,
+    so its rewards fall back to the full reload of the source.
+    """
+    modules: Dict[str, str] = {}
+    for index_file in sorted(rewards_dir.glob(f"*/{SPLIT_INDEX_FILE}")):
+        try:
+            with open(index_file) as f:
+                index = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Failed to read {index_file}: {e}")
+            continue
+        source_file = rewards_dir / index.get("source", "")
+        if source_file.is_file():
+            digest = hashlib.sha256(source_file.read_bytes()).hexdigest()
+            if digest != index.get("source_sha256"):
+                print(f"Skipping {index_file.parent.name}: {source_file.name} changed since it was split")
+                continue
+        package = f"rewards.{index_file.parent.name}"
+        for name, entry in index.get("rewards", {}).items():
+            modules[name] = f"{package}.{entry['module']}"
+    return modules
+
+
+def load_split_reward(name: str) -> Optional[Any]:
+    """Import only the per-task module of a split reward; returns its RewardSpec.
+
+    Loaded modules are re-executed only when a rewards file changed since
+    it was imported. Returns None when the reward isn't split (or its
+    module fails to import), for the caller to fall back to a full reload.
+    """
+    module_name = split_reward_modules().get(name)
+    if module_name is None:
+        return None
+    if reward_modules_changed():
+        clear_reward_modules()
+    ensure_rewards_package()
+    try:
+        importlib.import_module(module_name)
+    except Exception as e:
+        print(f"Failed to load {module_name}: {e}")
+        return None
+    record_module_mtimes()
+    return importlib.import_module("rewards.registry").get_reward(name)
+
+
 # Load functions on startup
 reward_functions = load_reward_functions()
 
@@ -183,19 +344,21 @@ def health():
         "reward_functions_loaded": len(reward_functions),
         "tasks_dir": str(TASKS_DIR),
         "rewards_dir": str(REWARDS_DIR),
+        "initial_state_dir": str(INITIAL_STATE_DIR),
     }
 
 
-@app.post("/verify", response_model=VerifyResponse)
-def verify(request: VerifyRequest):
-    """Run verification for a Figma task."""
-    global reward_functions
+def load_task_reward(task_id: str):
+    """Load a task and its reward function.
 
-    # Reload reward functions to get latest changes
-    reward_functions = reload_reward_functions()
+    Returns:
+        (task, reward): reward is a ``RewardSpec``; tasks with only an
+        inline check_spec get an unregistered one scoring the spec.
+    """
+    global reward_functions
 
     # Load task to get reward function name
-    task_path = TASKS_DIR / f"{request.task_id}.json"
+    task_path = TASKS_DIR / f"{task_id}.json"
     if not task_path.exists():
         raise HTTPException(status_code=404, detail=f"Task not found: {task_path}")
 
@@ -203,54 +366,247 @@ def verify(request: VerifyRequest):
         task = json.load(f)
 
     reward_function_name = task.get("reward_function", "")
-    if not reward_function_name:
-        raise HTTPException(status_code=400, detail="Task has no reward_function defined")
-
-    # Get reward function
-    reward_fn = reward_functions.get(reward_function_name)
-    if not reward_fn:
+    inline_spec = task.get("check_spec")
+    if not reward_function_name and inline_spec is None:
+        raise HTTPException(status_code=400, detail="Task has no reward_function or check_spec defined")
+
+    # Split rewards import just their own module; everything else reloads
+    # all reward functions, but only when a rewards file changed, so the
+    # modules' caches (ground truth, parsed answers, check plans) persist
+    reward = load_split_reward(reward_function_name) if reward_function_name else None
+    if reward is not None:
+        reward_functions[reward_function_name] = reward
+        return task, reward
+    if reward_modules_stale():
+        reward_functions = reload_reward_functions()
+
+    # Get reward function (tasks with only an inline check_spec are scored from the spec)
+    if reward_function_name:
+        reward = reward_functions.get(reward_function_name)
+    else:
+        check_spec = importlib.import_module("rewards.check_spec")
+
+        def score_inline_spec(backend, frontend_state, final_answer):
+            plan = check_spec.plan_for_task(task_id, inline_spec)
+            return check_spec.score_answer(plan, final_answer)
+
+        registry = importlib.import_module("rewards.registry")
+        reward = registry.RewardSpec(score_inline_spec, name=f"check_spec:{task_id}", cost="answer")
+
+    if not reward:
         raise HTTPException(
             status_code=404,
             detail=f"Reward function '{reward_function_name}' not found. Available: {list(reward_functions.keys())}"
         )
+    return task, reward
 
-    # Create backend
-    backend = StorageBackend(DEFAULT_STORAGE_URL)
 
-    # Get frontend state (use empty dict if not provided)
-    frontend_state = request.frontend_state or {}
+# state name -> (file, size, mtime_ns, backend over the state, content hash)
+_initial_states: Dict[str, Tuple[Path, int, int, Any, str]] = {}
+# state name -> lock held while that state loads, so loading one large
+# state doesn't hold up requests for other states
+_initial_state_locks: Dict[str, threading.Lock] = {}
+_initial_state_locks_guard = threading.Lock()
+
 
+def initial_state_path(name: str) -> Path:
+    """The file to load a state from: its compiled ``.bsnap`` snapshot if one
+    is at least as new as the JSON (see scripts/compile_backend_snapshot.py),
+    else ``<name>.json``."""
+    stem = name[:-len(".json")] if name.endswith(".json") else name
+    json_path = INITIAL_STATE_DIR / f"{stem}.json"
+    snapshot_path = INITIAL_STATE_DIR / f"{stem}.bsnap"
+    try:
+        snapshot_mtime = snapshot_path.stat().st_mtime_ns
+    except OSError:
+        return json_path
     try:
-        # Call the reward function
-        import inspect
-        sig = inspect.signature(reward_fn)
-        params = list(sig.parameters.keys())
+        if json_path.stat().st_mtime_ns > snapshot_mtime:
+            return json_path
+    except OSError:
+        pass
+    return snapshot_path
+
+
+def initial_state_backend(task: Dict[str, Any]) -> Optional[Tuple[Any, str]]:
+    """(backend, content hash) for the task's initial backend state file.
+
+    The file (see ``initial_state_path``) is loaded and indexed once and
+    shared by every request until it or its size or mtime changes. A
+    ``.bsnap`` snapshot is opened lazily and brings its precomputed hash
+    indexes. Other indexes are cached on disk next to the file (see
+    ``rewards/index_cache.py``), so a restarted server doesn't rebuild
+    them. Returns None if the task names no state or the file isn't in
+    INITIAL_STATE_DIR.
+    """
+    name = task.get("initial_backend_state_name")
+    if not name:
+        return None
+    path = initial_state_path(name)
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    version = (path, stat.st_size, stat.st_mtime_ns)
+    cached = _initial_states.get(name)
+    if cached is not None and cached[:3] == version:
+        return cached[3], cached[4]
+
+    with _initial_state_locks_guard:
+        lock = _initial_state_locks.setdefault(name, threading.Lock())
+    with lock:
+        cached = _initial_states.get(name)
+        if cached is None or cached[:3] != version:
+            backend_module = importlib.import_module("rewards.backend")
+            ground_truth = importlib.import_module("rewards.ground_truth")
+            index_cache = importlib.import_module("rewards.index_cache")
+            snapshot_file = importlib.import_module("rewards.snapshot_file")
+            adapter = None
+            if path.suffix == snapshot_file.SNAPSHOT_SUFFIX:
+                try:
+                    adapter = backend_module.BackendDictAdapter(snapshot_file.open_snapshot(path))
+                except snapshot_file.SnapshotFormatError as e:
+                    # e.g. compiled under another marshal version; the JSON still loads
+                    print(f"Snapshot {path.name} unreadable, loading JSON instead: {e}")
+                    path = path.with_suffix(".json")
+            if adapter is None:
+                with open(path) as f:
+                    adapter = backend_module.BackendDictAdapter(json.load(f))
+
+            def build_indexes(adapter: Any) -> None:
+                for collection in ground_truth.COLLECTIONS:
+                    adapter.create_index(collection, ["fileId"])
+
+            # Indexes built by an earlier run come from <state>.indexes/
+            cache = index_cache.IndexCache(path)
+            try:
+                cache.warm(adapter, build_indexes)
+                content_hash = cache.content_hash()
+            except OSError as e:
+                print(f"Index cache for {path.name} unavailable, indexing in memory: {e}")
+                build_indexes(adapter)
+                content_hash = index_cache.file_content_hash(path)
+            cached = _initial_states[name] = (*version, adapter, content_hash)
+        return cached[3], cached[4]
+
+
+def initial_state_context(task: Dict[str, Any]):
+    """Context in which rewards derive ground truth from the task's initial state."""
+    state = initial_state_backend(task)
+    if state is None:
+        return contextlib.nullcontext()
+    return importlib.import_module("rewards.ground_truth").initial_state(*state)
+
+
+def answer_validator_for(task_id: str, task: Dict[str, Any], reward: Any):
+    """Compiled answer-shape validator: the reward's declared answer_schema, else the prompt's example."""
+    answer_schema = importlib.import_module("rewards.answer_schema")
+    example = reward.answer_schema or answer_schema.example_for_task(task)
+    return answer_schema.answer_validator(task_id, example)
+
+
+def score_many(
+    task_id: str,
+    answers: List[str],
+    frontend_state: Optional[Dict[str, Any]] = None,
+    mode: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Score N final answers for one task against one backend state.
+
+    The task, reward function and check plan are loaded once, and all
+    answers share one backend and one initial state, so ground truth
+    derived from it is computed once. Identical answers are scored once.
+    Mismatches between an answer's JSON and the task's expected shape are
+    reported with its result (see ``rewards/answer_schema.py``). Spec-backed
+    tasks are scored through ``check_spec.score_answers``,
+    which vectorizes the numeric checks in fail-fast mode.
+
+    Returns:
+        TaskScore-shaped results in input order.
+    """
+    task, reward = load_task_reward(task_id)
+    scoring = importlib.import_module("rewards.scoring")
+    check_spec = importlib.import_module("rewards.check_spec")
+    answer_schema = importlib.import_module("rewards.answer_schema")
+    mode = mode or DEFAULT_SCORING_MODE
+    answers = [answer or "" for answer in answers]
+
+    validator = answer_validator_for(task_id, task, reward)
+    results: Dict[str, Dict[str, Any]] = {}
+    pending = list(dict.fromkeys(answers))
+
+    # Tasks scored purely from a check spec: inline, or a validator marked with check_spec_task
+    spec_task = reward.check_spec_task
+    if spec_task or not task.get("reward_function"):
+        try:
+            plan = check_spec.plan_for_task(spec_task or task_id, None if spec_task else task.get("check_spec"))
+        except check_spec.CheckSpecError:
+            plan = None
+        if plan is not None:
+            with scoring.scoring_mode(mode):
+                for answer, result in zip(pending, check_spec.score_answers(plan, pending)):
+                    results[answer] = answer_schema.add_structure_errors(result, validator, answer)
+            return [results[answer] for answer in answers]
 
-        if len(params) >= 3:
-            result = reward_fn(backend, frontend_state, request.final_answer or "")
-        else:
-            result = reward_fn(backend, frontend_state)
+    backend = StorageBackend(DEFAULT_STORAGE_URL)
+    frontend_state = frontend_state or {}
+
+    with initial_state_context(task):
+        for answer in pending:
+            call = lambda: reward.call(backend, frontend_state, answer)
+            results[answer] = scoring.run_scored(
+                lambda: answer_schema.score_with_structure(validator, answer, call), mode
+            )
+    return [results[answer] for answer in answers]
 
-        score = result.get("score", 0.0)
-        metadata = result.get("metadata", {})
 
-        error_msgs = metadata.get("error_accumulator", [])
-        success_msgs = metadata.get("success_accumulator", [])
+def _to_response(result: Dict[str, Any]) -> VerifyResponse:
+    score = result.get("score", 0.0)
+    metadata = result.get("metadata", {})
 
-        if error_msgs:
-            message = "; ".join(error_msgs)
-        elif success_msgs:
-            message = "; ".join(success_msgs)
-        else:
-            message = "Task complete" if score == 1.0 else "Task incomplete"
+    error_msgs = metadata.get("error_accumulator", [])
+    success_msgs = metadata.get("success_accumulator", [])
 
-        return VerifyResponse(
-            score=score,
-            passed=score == 1.0,
-            message=message,
-            errors=error_msgs,
-            successes=success_msgs,
+    if error_msgs:
+        message = "; ".join(error_msgs)
+    elif success_msgs:
+        message = "; ".join(success_msgs)
+    else:
+        message = "Task complete" if score == 1.0 else "Task incomplete"
+
+    return VerifyResponse(
+        score=score,
+        passed=score == 1.0,
+        message=message,
+        errors=error_msgs,
+        successes=success_msgs,
+    )
+
+
+@app.post("/verify", response_model=VerifyResponse)
+def verify(request: VerifyRequest):
+    """Run verification for a Figma task."""
+    task, reward = load_task_reward(request.task_id)
+
+    # Create backend
+    backend = StorageBackend(DEFAULT_STORAGE_URL)
+
+    # Get frontend state (use empty dict if not provided)
+    frontend_state = request.frontend_state or {}
+
+    try:
+        # Call the reward function, reporting answer shape mismatches with
+        # its result (RewardSpec.call is already specialized for its arity)
+        scoring = importlib.import_module("rewards.scoring")
+        answer_schema = importlib.import_module("rewards.answer_schema")
+        validator = answer_validator_for(request.task_id, task, reward)
+        final_answer = request.final_answer or ""
+        call = lambda: answer_schema.score_with_structure(
+            validator, final_answer, lambda: reward.call(backend, frontend_state, final_answer)
         )
+        with initial_state_context(task):
+            return _to_response(scoring.run_scored(call, request.mode or DEFAULT_SCORING_MODE))
 
     except Exception as e:
         import traceback
@@ -264,6 +620,21 @@ def verify(request: VerifyRequest):
         )
 
 
+@app.post("/verify_batch", response_model=VerifyBatchResponse)
+def verify_batch(request: VerifyBatchRequest):
+    """Score several final answers for one Figma task."""
+    try:
+        results = score_many(request.task_id, request.final_answers, request.frontend_state, request.mode)
+    except HTTPException:
+        raise
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"Verification error: {str(e)}")
+    responses = [_to_response(result) for result in results]
+    return VerifyBatchResponse(scores=[response.score for response in responses], results=responses)
+
+
 @app.get("/tasks")
 def list_tasks():
     """List available Figma tasks."""
@@ -299,8 +670,12 @@ def get_task(task_id: str):
 
 @app.get("/functions")
 def list_functions():
-    """List available reward functions."""
-    return {"functions": list(reward_functions.keys()), "count": len(reward_functions)}
+    """List available reward functions with their registration metadata."""
+    return {
+        "functions": list(reward_functions.keys()),
+        "count": len(reward_functions),
+        "metadata": {name: reward.describe() for name, reward in reward_functions.items()},
+    }
 
 
 if __name__ == "__main__":